@@ -0,0 +1,117 @@
+"""
+기본 아바타 렌더링 서비스
+Pillow로 500x500 PNG를 그리는 작업을 요청 처리 경로(이벤트 루프)에서 분리해서
+별도 프로세스 풀에서 실행합니다.
+
+- 아바타는 (role, 이름 첫 글자)로 결정되므로 그 해시(digest)로 파일을 저장 (content-addressed)
+  → 같은 아바타를 쓰는 사용자들은 파일 하나를 공유
+- 같은 digest에 대한 동시 요청은 하나의 렌더링 작업을 공유 (single-flight)
+- 이미 파일이 있으면 다시 그리지 않음
+- 요청은 렌더링을 잠깐 기다리고, 그래도 끝나지 않으면 임시(placeholder) 이미지를 받음
+"""
+
+import asyncio
+import io
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional
+
+from create_test_images import avatar_digest, render_avatar_file
+from image_index import ImageIndex
+
+logger = logging.getLogger(__name__)
+
+_placeholder_png: Optional[bytes] = None
+
+
+def placeholder_png() -> bytes:
+    """렌더링이 끝나기 전에 돌려줄 작은 회색 PNG (한 번만 생성)"""
+    global _placeholder_png
+    if _placeholder_png is None:
+        from PIL import Image
+
+        buffer = io.BytesIO()
+        Image.new("RGB", (64, 64), (220, 220, 220)).save(buffer, "PNG")
+        _placeholder_png = buffer.getvalue()
+    return _placeholder_png
+
+
+AVATAR_DIR = "images/avatars"
+
+
+def avatar_path(digest: str) -> str:
+    return f"{AVATAR_DIR}/{digest}.png"
+
+
+class AvatarRenderService:
+    """프로세스 풀 기반 아바타 렌더러 (digest별 single-flight)"""
+
+    def __init__(self, index: ImageIndex, max_workers: int = 2, wait_timeout: float = 2.0):
+        self._index = index
+        self._max_workers = max_workers
+        self._wait_timeout = wait_timeout
+        # 프로세스 풀은 첫 렌더링 시 생성 (spawn: 부모의 스레드/락 상태를 물려받지 않음)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._rendered = 0
+
+    def schedule(self, role: str, text: str) -> Optional[asyncio.Future]:
+        """렌더링 시작 (이미 진행 중이거나 파일이 있으면 새로 시작하지 않음)"""
+        key = avatar_digest(role, text)
+        future = self._in_flight.get(key)
+        if future is not None:
+            return future
+        if self._index.get_avatar(key) is not None:
+            return None
+        path = avatar_path(key)
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, render_avatar_file, role, text, path)
+        self._in_flight[key] = future
+        future.add_done_callback(lambda done: self._finish(key, path, done))
+        return future
+
+    async def render(self, role: str, text: str) -> bool:
+        """렌더링을 시작(또는 진행 중인 작업에 합류)하고 잠깐 기다림
+
+        Returns:
+            bool: 파일이 준비됐으면 True, 대기 시간 안에 끝나지 않았으면 False
+        """
+        future = self.schedule(role, text)
+        if future is None:
+            return True
+        try:
+            # shield: 대기가 타임아웃돼도 렌더링 작업 자체는 계속 진행
+            await asyncio.wait_for(asyncio.shield(future), timeout=self._wait_timeout)
+        except asyncio.TimeoutError:
+            return False
+        except Exception as e:
+            logger.error("Avatar render failed for %s/%s: %s", role, text, e)
+            return False
+        return True
+
+    def stats(self) -> Dict:
+        return {
+            "workers": self._max_workers,
+            "in_flight": len(self._in_flight),
+            "rendered": self._rendered
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._in_flight.clear()
+
+    def _finish(self, key: str, path: str, future: asyncio.Future) -> None:
+        self._in_flight.pop(key, None)
+        if not future.cancelled() and future.exception() is None:
+            self._rendered += 1
+            # 렌더러가 돌려준 파일 정보로 인덱스 갱신 (이후 요청은 파일 확인 없이 바로 읽음)
+            self._index.put_avatar(key, path, future.result())
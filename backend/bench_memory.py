@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+메모리 사용량 측정 스크립트
+사용자 / 매칭 요청 한 건을 메모리에 보관하는 비용을 이전 방식(pydantic 모델)과
+현재 방식(records.py의 __slots__ 레코드)으로 비교합니다.
+
+- 레코드: 객체만 만들었을 때 (문자열 값 포함)
+- 저장소 포함: UserStore / MatchRequestStore에 등록해서 인덱스까지 만든 상태
+
+사용법: python bench_memory.py [건수]
+"""
+
+import gc
+import sys
+import tracemalloc
+from typing import Callable, List, Optional
+
+from pydantic import BaseModel
+
+from records import MatchRequest, User, UserProfile
+from store import MatchRequestStore, UserStore
+
+
+# 변경 전 main.py의 저장용 모델
+class OldUserProfile(BaseModel):
+    name: str
+    bio: Optional[str] = ""
+    imageUrl: Optional[str] = None
+    skills: Optional[List[str]] = []
+
+
+class OldUser(BaseModel):
+    id: int
+    email: str
+    role: str
+    profile: OldUserProfile
+    hashed_password: str
+
+
+class OldMatchRequest(BaseModel):
+    id: int
+    mentorId: int
+    menteeId: int
+    message: str
+    status: str
+    # 저장소가 매기는 변경 버전 (현재 레코드와 같은 필드로 비교)
+    version: int = 0
+
+
+# bcrypt 해시와 같은 길이의 값
+HASHED_PASSWORD = "$2b$12$" + "x" * 53
+
+
+def make_users(user_cls, profile_cls, count: int):
+    users = []
+    for i in range(1, count + 1):
+        mentor = i % 2 == 0
+        users.append(user_cls(
+            id=i,
+            email=f"user{i}@example.com",
+            role="mentor" if mentor else "mentee",
+            profile=profile_cls(
+                name=f"사용자 {i}",
+                bio=f"자기소개 {i}",
+                imageUrl=None,
+                skills=["React", "TypeScript"] if mentor else None
+            ),
+            hashed_password=HASHED_PASSWORD
+        ))
+    return users
+
+
+def make_match_requests(request_cls, count: int):
+    # 상태 문자열은 DB에서 읽어온 것처럼 요청마다 새 문자열로 생성
+    statuses = ("pending", "accepted", "rejected", "cancelled")
+    return [
+        request_cls(
+            id=i,
+            mentorId=(i % 1000) * 2 + 2,
+            menteeId=(i % 1000) * 2 + 1,
+            message=f"멘토링 요청드립니다 {i}",
+            status="".join(statuses[i % 4])
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def measure(build: Callable[[], object]) -> int:
+    """build()가 만든 객체가 유지하는 메모리 (bytes)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del kept
+    return used
+
+
+def with_user_store(users):
+    store = UserStore()
+    store.load(users)
+    return store
+
+
+def with_match_request_store(requests):
+    store = MatchRequestStore()
+    store.load(requests)
+    return store
+
+
+def run(count: int):
+    rows = [
+        (
+            "사용자",
+            lambda: make_users(OldUser, OldUserProfile, count),
+            lambda: make_users(User, UserProfile, count),
+            lambda: with_user_store(make_users(OldUser, OldUserProfile, count)),
+            lambda: with_user_store(make_users(User, UserProfile, count)),
+        ),
+        (
+            "매칭 요청",
+            lambda: make_match_requests(OldMatchRequest, count),
+            lambda: make_match_requests(MatchRequest, count),
+            lambda: with_match_request_store(make_match_requests(OldMatchRequest, count)),
+            lambda: with_match_request_store(make_match_requests(MatchRequest, count)),
+        ),
+    ]
+
+    print(f"건수: {count}, Python {sys.version.split()[0]} (건당 bytes)")
+    print(f"{'':<12}{'이전 레코드':>12}{'현재 레코드':>12}{'이전+저장소':>14}{'현재+저장소':>14}{'절감':>8}")
+    for name, old, new, old_store, new_store in rows:
+        old_bytes = measure(old) / count
+        new_bytes = measure(new) / count
+        old_store_bytes = measure(old_store) / count
+        new_store_bytes = measure(new_store) / count
+        saved = 1 - new_store_bytes / old_store_bytes
+        print(
+            f"{name:<12}{old_bytes:>12.0f}{new_bytes:>12.0f}"
+            f"{old_store_bytes:>14.0f}{new_store_bytes:>14.0f}{saved:>7.0%}"
+        )
+    print("100만 건 기준은 건당 bytes 값을 MB로 읽으면 됩니다. (1 byte/건 ≈ 1 MB/100만 건)")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
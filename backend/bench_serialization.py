@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+응답 직렬화 벤치마크 스크립트
+멘토 목록 / 매칭 요청 목록 응답을 만드는 비용을 이전 방식과 현재 방식으로 비교합니다.
+
+- 이전: 핸들러에서 pydantic 모델 생성 → FastAPI가 response_model로 재검증/직렬화 → JSONResponse
+- 현재: 도메인 객체 → dict 한 번 변환 → FastJSONResponse (orjson)
+
+사용법: python bench_serialization.py [항목 수] [반복 횟수]
+"""
+
+import asyncio
+import os
+import sys
+import time
+from typing import List
+
+# main 모듈 import 시 테스트 데이터/이미지 스캔이 필요 없도록 설정
+os.environ.setdefault("SEED_TEST_DATA", "false")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+import main
+from json_response import FastJSONResponse
+
+
+def make_mentors(count: int) -> List[main.User]:
+    return [
+        main.User(
+            id=i,
+            email=f"mentor{i}@example.com",
+            role="mentor",
+            profile=main.UserProfile(
+                name=f"멘토 {i}",
+                bio="프론트엔드 개발 10년차 멘토입니다. React와 TypeScript를 주로 다룹니다.",
+                imageUrl=f"/images/mentor/{i}",
+                skills=["React", "TypeScript", "Node.js", "GraphQL"]
+            ),
+            hashed_password="x"
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def make_match_requests(count: int) -> List[main.MatchRequest]:
+    return [
+        main.MatchRequest(id=i, mentorId=1, menteeId=i + 1, message="멘토링 요청드립니다!", status="pending")
+        for i in range(1, count + 1)
+    ]
+
+
+async def old_mentor_list(mentors, field):
+    # 변경 전 get_mentors와 같은 경로
+    items = [
+        main.MentorListItem(
+            id=mentor.id,
+            email=mentor.email,
+            role=mentor.role,
+            profile=main.MentorProfile(
+                name=mentor.profile.name,
+                bio=mentor.profile.bio or "",
+                imageUrl=mentor.profile.imageUrl or f"/images/mentor/{mentor.id}",
+                skills=mentor.profile.skills or []
+            )
+        )
+        for mentor in mentors
+    ]
+    content = await serialize_response(field=field, response_content=items, is_coroutine=True)
+    return JSONResponse(content).body
+
+
+async def new_mentor_list(mentors, field):
+    return FastJSONResponse([main.user_response_dict(mentor) for mentor in mentors]).body
+
+
+async def old_match_requests(requests, field):
+    # 변경 전 get_incoming_match_requests와 같은 경로
+    items = [
+        main.MatchRequestResponse(
+            id=req.id,
+            mentorId=req.mentorId,
+            menteeId=req.menteeId,
+            message=req.message,
+            status=req.status
+        )
+        for req in requests
+    ]
+    content = await serialize_response(field=field, response_content=items, is_coroutine=True)
+    return JSONResponse(content).body
+
+
+async def new_match_requests(requests, field):
+    return FastJSONResponse([main.match_request_dict(req) for req in requests]).body
+
+
+async def measure(func, data, field, iterations: int) -> float:
+    """한 번 호출당 평균 시간 (마이크로초)"""
+    await func(data, field)  # 워밍업
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await func(data, field)
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+async def run(count: int, iterations: int):
+    import json
+
+    mentors = make_mentors(count)
+    requests = make_match_requests(count)
+    mentor_field = create_response_field(name="Response", type_=List[main.MentorListItem])
+    request_field = create_response_field(name="Response", type_=List[main.MatchRequestResponse])
+
+    # 두 방식의 응답 내용이 같은지 먼저 확인
+    assert json.loads(await old_mentor_list(mentors, mentor_field)) == json.loads(await new_mentor_list(mentors, mentor_field))
+    assert json.loads(await old_match_requests(requests, request_field)) == json.loads(await new_match_requests(requests, request_field))
+
+    print(f"항목 수: {count}, 반복: {iterations}")
+    print(f"{'응답':<20}{'이전 (us)':>14}{'현재 (us)':>14}{'배율':>8}")
+    for name, old, new, data, field in [
+        ("GET /api/mentors", old_mentor_list, new_mentor_list, mentors, mentor_field),
+        ("GET .../incoming", old_match_requests, new_match_requests, requests, request_field),
+    ]:
+        old_us = await measure(old, data, field, iterations)
+        new_us = await measure(new, data, field, iterations)
+        print(f"{name:<20}{old_us:>14.1f}{new_us:>14.1f}{old_us / new_us:>7.1f}x")
+        print(f"{'  (항목당)':<20}{old_us / count:>14.2f}{new_us / count:>14.2f}")
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    asyncio.run(run(count, iterations))
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+매칭 요청 상태 전이 경합 벤치마크
+여러 스레드가 같은 대기 중 요청들에 수락/거절을 동시에 시도할 때의 처리량과 정확성을 봅니다.
+
+- 이전 방식: 상태 확인 후 set_status (락 없음) - 같은 요청이 두 번 전이될 수 있음
+- 현재 방식: MatchTransitionEngine (요청 id별 락 안에서 확인-변경)
+
+각 요청은 정확히 한 번만 전이되어야 합니다. ("중복 전이"가 0이어야 함)
+
+사용법: python bench_transitions.py [요청 수] [스레드 수...]
+"""
+
+import random
+import sys
+import threading
+import time
+from typing import Callable, Dict, List
+
+from match_transitions import MatchTransitionEngine
+from records import MatchRequest
+from store import MatchRequestStore
+
+MENTEE_ID = 0
+
+
+def make_store(count: int) -> MatchRequestStore:
+    # 요청마다 멘토를 다르게 해서 (멘토 id = 요청 id) 멘토당 수락 1건 제한과 관계없이 요청별 경합만 측정
+    store = MatchRequestStore()
+    store.load(
+        MatchRequest(id=i, mentorId=i, menteeId=MENTEE_ID, message="멘토링 요청드립니다!", status="pending")
+        for i in range(1, count + 1)
+    )
+    return store
+
+
+def unlocked_transition(store: MatchRequestStore) -> Callable[[int, str], bool]:
+    """변경 전 핸들러와 같은 확인 → 변경 (락 없음)"""
+    targets = {"accept": "accepted", "reject": "rejected"}
+
+    def apply(request_id: int, action: str) -> bool:
+        match_request = store.get(request_id)
+        if match_request is None or match_request.mentorId != request_id:
+            return False
+        if match_request.status != "pending":
+            return False
+        store.set_status(match_request, targets[action])
+        return True
+
+    return apply
+
+
+def engine_transition(store: MatchRequestStore, lock_stripes: int) -> Callable[[int, str], bool]:
+    engine = MatchTransitionEngine(store, lock_stripes=lock_stripes)
+    return lambda request_id, action: engine.apply(request_id, request_id, action).ok
+
+
+def run_case(make_apply: Callable[[MatchRequestStore], Callable[[int, str], bool]], count: int, threads: int) -> Dict:
+    store = make_store(count)
+    apply = make_apply(store)
+    wins: List[List[int]] = [[] for _ in range(threads)]
+    start = threading.Barrier(threads + 1)
+
+    def worker(index: int):
+        # 스레드마다 다른 순서로 모든 요청에 수락/거절 시도
+        order = list(range(1, count + 1))
+        random.Random(index).shuffle(order)
+        action = "accept" if index % 2 == 0 else "reject"
+        start.wait()
+        for request_id in order:
+            if apply(request_id, action):
+                wins[index].append(request_id)
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    start.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    won = [request_id for group in wins for request_id in group]
+    return {
+        "attempts_per_sec": count * threads / elapsed,
+        "won": len(won),
+        "duplicates": len(won) - len(set(won))
+    }
+
+
+def main(count: int, thread_counts: List[int]):
+    # 스레드 전환을 자주 일으켜서 경합 구간이 겹치도록 함
+    sys.setswitchinterval(1e-6)
+    cases = [
+        ("이전 (락 없음)", unlocked_transition),
+        ("엔진 (락 1개)", lambda store: engine_transition(store, 1)),
+        ("엔진 (락 64개)", lambda store: engine_transition(store, 64)),
+    ]
+    print(f"요청 수: {count} (스레드마다 전체 요청에 수락/거절 시도)")
+    print(f"{'방식':<16}{'스레드':>6}{'시도/초':>12}{'성공':>8}{'중복 전이':>10}")
+    for threads in thread_counts:
+        for name, make_apply in cases:
+            result = run_case(make_apply, count, threads)
+            print(
+                f"{name:<16}{threads:>6}{result['attempts_per_sec']:>12.0f}"
+                f"{result['won']:>8}{result['duplicates']:>10}"
+            )
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    thread_counts = [int(arg) for arg in sys.argv[2:]] or [1, 2, 4, 8]
+    main(count, thread_counts)
@@ -0,0 +1,82 @@
+"""
+pytest 공통 픽스처
+test_*.py는 서버 없이 프로세스 안에서 실행됩니다.
+(test_mentors.py, test_profile_api.py는 실행 중인 서버가 필요한 기존 스크립트)
+
+API 테스트는 TestClient로 main.app을 띄우고 seed_data.json의 테스트 사용자로 로그인합니다.
+"""
+
+import itertools
+import os
+
+import pytest
+
+# main을 import하기 전에 설정 (메모리 저장소, 로그 최소화)
+os.environ["STORAGE_BACKEND"] = "memory"
+os.environ["SEED_TEST_DATA"] = "true"
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("LOG_FORMAT", "text")
+
+# seed_data.json 사용자 비밀번호
+SEED_PASSWORD = "password123"
+
+_signup_ids = itertools.count(1)
+
+
+@pytest.fixture(scope="session")
+def app_client(tmp_path_factory):
+    """main.app TestClient (이미지 등 상대 경로 파일은 임시 디렉터리에 생성)"""
+    from fastapi.testclient import TestClient
+
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("cwd"))
+    try:
+        import main
+
+        with TestClient(main.app) as client:
+            yield client
+    finally:
+        os.chdir(cwd)
+
+
+@pytest.fixture(scope="session")
+def auth_headers(app_client):
+    """이메일 → Authorization 헤더 (로그인은 사용자당 한 번)"""
+    headers = {}
+
+    def get(email: str, password: str = SEED_PASSWORD):
+        if email not in headers:
+            response = app_client.post("/api/login", json={"email": email, "password": password})
+            assert response.status_code == 200, response.text
+            headers[email] = {"Authorization": f"Bearer {response.json()['token']}"}
+        return headers[email]
+
+    return get
+
+
+@pytest.fixture
+def signup(app_client, auth_headers):
+    """새 사용자를 가입시키고 (사용자 JSON, Authorization 헤더) 반환
+
+    프로필을 바꾸는 테스트가 다른 테스트에서 쓰는 테스트 사용자를 건드리지 않도록 사용합니다.
+    """
+    def create(role: str = "mentor", name: str = "테스트"):
+        email = f"user{next(_signup_ids)}@test.example.com"
+        response = app_client.post(
+            "/api/signup",
+            json={"email": email, "password": SEED_PASSWORD, "name": name, "role": role}
+        )
+        assert response.status_code == 201, response.text
+        return response.json(), auth_headers(email)
+
+    return create
+
+
+@pytest.fixture
+def client(app_client):
+    """매칭 요청을 비운 상태의 TestClient"""
+    import main
+
+    main.match_request_store.clear()
+    yield app_client
+    main.match_request_store.clear()
@@ -2,42 +2,71 @@
 """
 테스트용 프로필 이미지 생성 스크립트
 500x500 픽셀 크기의 정사각형 PNG 이미지를 생성합니다.
+
+같은 (역할, 이름 첫 글자)는 항상 같은 이미지가 되도록 결정적으로 그립니다.
+폰트 객체와 배경 템플릿(배경 + 원 + 역할 텍스트)은 프로세스 안에서 캐시해서 재사용합니다.
 """
 
 from PIL import Image, ImageDraw, ImageFont
+from functools import lru_cache
+import hashlib
 import os
-import random
 
-def create_profile_image(width=500, height=500, user_id=1, role="mentor", name="User"):
-    """
-    프로필 이미지를 생성합니다.
-    
-    Args:
-        width (int): 이미지 너비
-        height (int): 이미지 높이
-        user_id (int): 사용자 ID
-        role (str): 사용자 역할 (mentor/mentee)
-        name (str): 사용자 이름
-    
-    Returns:
-        PIL.Image: 생성된 이미지 객체
-    """
-    
-    # 랜덤 배경색 생성 (파스텔 톤)
-    colors = [
-        (255, 182, 193),  # Light Pink
-        (173, 216, 230),  # Light Blue
-        (144, 238, 144),  # Light Green
-        (255, 218, 185),  # Peach
-        (221, 160, 221),  # Plum
-        (255, 228, 196),  # Bisque
-        (176, 196, 222),  # Light Steel Blue
-        (255, 192, 203),  # Pink
-    ]
-    
-    bg_color = random.choice(colors)
-    
-    # 이미지 생성
+# 배경색 후보 (파스텔 톤)
+AVATAR_COLORS = [
+    (255, 182, 193),  # Light Pink
+    (173, 216, 230),  # Light Blue
+    (144, 238, 144),  # Light Green
+    (255, 218, 185),  # Peach
+    (221, 160, 221),  # Plum
+    (255, 228, 196),  # Bisque
+    (176, 196, 222),  # Light Steel Blue
+    (255, 192, 203),  # Pink
+]
+
+# 그리는 방식이 바뀌면 올려서 기존 content-addressed 파일과 구분
+AVATAR_TEMPLATE_VERSION = 1
+
+# 이름이 없는 사용자의 아바타 글자 (모두 같은 아바타를 공유)
+AVATAR_FALLBACK_TEXT = "?"
+
+# 시도할 폰트 파일 (macOS → Linux 순, 없으면 기본 폰트)
+FONT_CANDIDATES = [
+    "/System/Library/Fonts/Helvetica.ttc",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "DejaVuSans.ttf",
+]
+
+def avatar_text(name):
+    """아바타에 표시할 글자 (이름 첫 글자, 이름이 없으면 AVATAR_FALLBACK_TEXT)"""
+    if name and len(name) > 0:
+        return name[0].upper()
+    return AVATAR_FALLBACK_TEXT
+
+def avatar_color(role, text):
+    """(역할, 글자)로 결정되는 배경색"""
+    digest = hashlib.sha256(f"{role}:{text}".encode("utf-8")).digest()
+    return AVATAR_COLORS[digest[0] % len(AVATAR_COLORS)]
+
+def avatar_digest(role, text, width=500, height=500):
+    """기본 아바타의 content address (같은 입력이면 같은 이미지)"""
+    key = f"v{AVATAR_TEMPLATE_VERSION}:{role}:{text}:{width}x{height}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+
+@lru_cache(maxsize=8)
+def _load_font(size):
+    """폰트 객체 (크기별로 한 번만 로드)"""
+    for path in FONT_CANDIDATES:
+        try:
+            return ImageFont.truetype(path, size)
+        except OSError:
+            continue
+    # 폰트가 없으면 기본 폰트 사용
+    return ImageFont.load_default()
+
+@lru_cache(maxsize=64)
+def _base_template(width, height, bg_color, role):
+    """배경 + 원 + 역할 텍스트까지 그린 템플릿 (복사해서 사용)"""
     image = Image.new('RGB', (width, height), bg_color)
     draw = ImageDraw.Draw(image)
     
@@ -55,22 +84,44 @@ def create_profile_image(width=500, height=500, user_id=1, role="mentor", name="
         center_y + circle_radius
     ], fill=circle_color)
     
-    # 텍스트 추가
-    try:
-        # 시스템 폰트 사용 시도
-        font_size = 40
-        font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", font_size)
-    except:
-        # 폰트가 없으면 기본 폰트 사용
-        font = ImageFont.load_default()
-    
-    # 사용자 이름의 첫 글자 또는 ID 표시
-    if name and len(name) > 0:
-        text = name[0].upper()
-    else:
-        text = str(user_id)
+    # 역할 표시 (작은 텍스트)
+    role_text = role.upper()
+    role_font = _load_font(20)
+    
+    role_bbox = draw.textbbox((0, 0), role_text, font=role_font)
+    role_width = role_bbox[2] - role_bbox[0]
+    role_x = center_x - role_width // 2
+    role_y = center_y + circle_radius + 20
+    
+    draw.text((role_x, role_y), role_text, fill=(100, 100, 100), font=role_font)
+    
+    return image
+
+def create_profile_image(width=500, height=500, user_id=1, role="mentor", name="User"):
+    """
+    프로필 이미지를 생성합니다.
+    
+    Args:
+        width (int): 이미지 너비
+        height (int): 이미지 높이
+        user_id (int): 사용자 ID (그림에는 쓰이지 않음, 기존 호출 호환용)
+        role (str): 사용자 역할 (mentor/mentee)
+        name (str): 사용자 이름
+    
+    Returns:
+        PIL.Image: 생성된 이미지 객체
+    """
+    
+    # 사용자 이름의 첫 글자 (이름이 없으면 고정 글자)
+    text = avatar_text(name)
+    
+    # (역할, 글자)로 정해지는 배경색의 템플릿 복사
+    image = _base_template(width, height, avatar_color(role, text), role).copy()
+    draw = ImageDraw.Draw(image)
+    center_x, center_y = width // 2, height // 2
     
     # 텍스트 크기 계산
+    font = _load_font(40)
     text_bbox = draw.textbbox((0, 0), text, font=font)
     text_width = text_bbox[2] - text_bbox[0]
     text_height = text_bbox[3] - text_bbox[1]
@@ -83,20 +134,6 @@ def create_profile_image(width=500, height=500, user_id=1, role="mentor", name="
     text_color = (255, 255, 255)
     draw.text((text_x, text_y), text, fill=text_color, font=font)
     
-    # 역할 표시 (작은 텍스트)
-    role_text = role.upper()
-    try:
-        role_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 20)
-    except:
-        role_font = ImageFont.load_default()
-    
-    role_bbox = draw.textbbox((0, 0), role_text, font=role_font)
-    role_width = role_bbox[2] - role_bbox[0]
-    role_x = center_x - role_width // 2
-    role_y = center_y + circle_radius + 20
-    
-    draw.text((role_x, role_y), role_text, fill=(100, 100, 100), font=role_font)
-    
     return image
 
 def create_test_images():
@@ -155,6 +192,26 @@ def create_single_image(user_id=1, role="mentor", name="Test", filename=None):
     
     return filename
 
+def render_avatar_file(role, text, filename, width=500, height=500):
+    """(역할, 글자) 기본 아바타를 content-addressed 파일로 저장합니다.
+    
+    임시 파일에 쓴 뒤 이름을 바꿔서, 동시에 읽는 쪽이 쓰다 만 파일을 보지 않도록 합니다.
+    
+    Returns:
+        os.stat_result: 저장된 파일 정보 (렌더링을 요청한 쪽의 인덱스 갱신용)
+    """
+    if os.path.exists(filename):
+        return os.stat(filename)
+    
+    image = create_profile_image(width=width, height=height, role=role, name=text)
+    
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    tmp_filename = f"{filename}.{os.getpid()}.tmp"
+    image.save(tmp_filename, "PNG")
+    os.replace(tmp_filename, filename)
+    
+    return os.stat(filename)
+
 if __name__ == "__main__":
     print("🎨 테스트 프로필 이미지 생성 중...")
     
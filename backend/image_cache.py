@@ -0,0 +1,120 @@
+"""
+프로필 이미지 캐시
+이미지 바이트를 메모리에 LRU로 보관하고 (전체 바이트 수 상한), 조건부 GET(ETag / Last-Modified)을 처리합니다.
+
+캐시 키는 (role, user_id, ...) 형태의 튜플이고, invalidate(role, user_id)는
+해당 사용자의 모든 항목을 제거합니다.
+같은 CachedImage를 여러 키로 넣을 수 있고 (예: 기본 아바타를 공유하는 사용자들), 바이트는 한 번만 계산합니다.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Dict, Hashable, Optional, Set, Tuple
+
+
+class CachedImage:
+    """캐시된 이미지 한 개 (본문 + 검증자)"""
+
+    __slots__ = ("body", "media_type", "etag", "last_modified")
+
+    def __init__(self, body: bytes, media_type: str, last_modified: float):
+        self.body = body
+        self.media_type = media_type
+        # 강한 ETag: 내용 해시
+        self.etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+        self.last_modified = int(last_modified)
+
+    @property
+    def last_modified_header(self) -> str:
+        return formatdate(self.last_modified, usegmt=True)
+
+
+def is_not_modified(image: CachedImage, if_none_match: Optional[str], if_modified_since: Optional[str]) -> bool:
+    """조건부 요청 헤더를 보고 304를 보내도 되는지 판단 (If-None-Match가 있으면 우선)"""
+    if if_none_match:
+        candidates = {tag.strip() for tag in if_none_match.split(",")}
+        return "*" in candidates or image.etag in candidates
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since is None:
+            return False
+        return image.last_modified <= int(since.timestamp())
+    return False
+
+
+class ImageCache:
+    """바이트 크기 상한이 있는 LRU 이미지 캐시"""
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, max_entry_bytes: int = 2 * 1024 * 1024):
+        self._max_bytes = max_bytes
+        self._max_entry_bytes = max_entry_bytes
+        self._entries: "OrderedDict[Tuple, CachedImage]" = OrderedDict()
+        # (role, user_id) → 해당 사용자의 캐시 키들
+        self._keys_by_user: Dict[Tuple[str, int], Set[Tuple]] = {}
+        # id(CachedImage) → 그 이미지를 가리키는 키 개수
+        self._refs: Dict[int, int] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Tuple) -> Optional[CachedImage]:
+        with self._lock:
+            image = self._entries.get(key)
+            if image is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return image
+
+    def put(self, key: Tuple, image: CachedImage) -> None:
+        # 너무 큰 이미지는 캐시하지 않음 (다른 항목을 모두 밀어내지 않도록)
+        if len(image.body) > self._max_entry_bytes:
+            return
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = image
+            self._keys_by_user.setdefault(key[:2], set()).add(key)
+            refs = self._refs.get(id(image), 0)
+            if refs == 0:
+                self._bytes += len(image.body)
+            self._refs[id(image)] = refs + 1
+            while self._bytes > self._max_bytes and self._entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, role: str, user_id: int) -> None:
+        """사용자 이미지가 바뀌었을 때 해당 사용자의 모든 항목 제거"""
+        with self._lock:
+            for key in list(self._keys_by_user.get((role, user_id), ())):
+                self._remove(key)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+                "hits": self._hits,
+                "misses": self._misses
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        image = self._entries.pop(key, None)
+        if image is None:
+            return
+        refs = self._refs.pop(id(image)) - 1
+        if refs:
+            self._refs[id(image)] = refs
+        else:
+            self._bytes -= len(image.body)
+        keys = self._keys_by_user.get(key[:2])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[key[:2]]
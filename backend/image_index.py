@@ -0,0 +1,126 @@
+"""
+이미지 경로 인덱스
+(role, user_id) → 업로드된 프로필 이미지, digest → 렌더링된 기본 아바타 파일 정보를 메모리에 보관합니다.
+
+시작 시 images/ 디렉터리를 한 번 스캔해서 만들고, 이후에는 업로드/아바타 렌더링이 직접 갱신하므로
+이미지 요청은 확장자별로 파일 존재를 확인(stat)할 필요가 없습니다.
+"""
+
+import os
+import re
+import threading
+from typing import Dict, Optional, Tuple
+
+# 같은 사용자의 파일이 여러 확장자로 있으면 앞쪽 확장자 우선 (기존 탐색 순서와 동일)
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+
+MEDIA_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".webp": "image/webp"
+}
+
+_USER_IMAGE_PATTERN = re.compile(r"^(\d+)(\.png|\.jpg|\.jpeg)$")
+_AVATAR_PATTERN = re.compile(r"^([0-9a-f]{32})\.png$")
+
+
+def media_type_for(path: str) -> str:
+    return MEDIA_TYPES.get(os.path.splitext(path)[1].lower(), "image/png")
+
+
+class ImageEntry:
+    """이미지 파일 한 개의 위치와 정보"""
+
+    __slots__ = ("path", "media_type", "size", "mtime")
+
+    def __init__(self, path: str, size: int, mtime: float):
+        self.path = path
+        self.media_type = media_type_for(path)
+        self.size = size
+        self.mtime = mtime
+
+    @classmethod
+    def from_stat(cls, path: str, file_stat: os.stat_result) -> "ImageEntry":
+        return cls(path, file_stat.st_size, file_stat.st_mtime)
+
+
+class ImageIndex:
+    """업로드 이미지 / 기본 아바타 파일 인덱스"""
+
+    def __init__(self, root: str = "images", roles: Tuple[str, ...] = ("mentor", "mentee")):
+        self._root = root
+        self._roles = roles
+        self._user_images: Dict[Tuple[str, int], ImageEntry] = {}
+        self._avatars: Dict[str, ImageEntry] = {}
+        self._lock = threading.Lock()
+
+    def scan(self, avatar_dir: str) -> int:
+        """디렉터리 스캔으로 인덱스 재구성 (시작 시 한 번, 블로킹) - 찾은 파일 수 반환"""
+        user_images: Dict[Tuple[str, int], ImageEntry] = {}
+        for role in self._roles:
+            for entry in _scan_dir(os.path.join(self._root, role)):
+                match = _USER_IMAGE_PATTERN.match(entry.name)
+                if not match:
+                    continue
+                key = (role, int(match.group(1)))
+                path = f"{self._root}/{role}/{entry.name}"
+                current = user_images.get(key)
+                if current is not None and _priority(current.path) <= _priority(path):
+                    continue
+                user_images[key] = ImageEntry.from_stat(path, entry.stat())
+
+        avatars: Dict[str, ImageEntry] = {}
+        for entry in _scan_dir(avatar_dir):
+            match = _AVATAR_PATTERN.match(entry.name)
+            if match:
+                avatars[match.group(1)] = ImageEntry.from_stat(f"{avatar_dir}/{entry.name}", entry.stat())
+
+        with self._lock:
+            self._user_images = user_images
+            self._avatars = avatars
+        return len(user_images) + len(avatars)
+
+    def get_user_image(self, role: str, user_id: int) -> Optional[ImageEntry]:
+        return self._user_images.get((role, user_id))
+
+    def put_user_image(self, role: str, user_id: int, path: str, file_stat: os.stat_result) -> ImageEntry:
+        entry = ImageEntry.from_stat(path, file_stat)
+        with self._lock:
+            self._user_images[(role, user_id)] = entry
+        return entry
+
+    def discard_user_image(self, role: str, user_id: int) -> None:
+        with self._lock:
+            self._user_images.pop((role, user_id), None)
+
+    def get_avatar(self, digest: str) -> Optional[ImageEntry]:
+        return self._avatars.get(digest)
+
+    def put_avatar(self, digest: str, path: str, file_stat: os.stat_result) -> ImageEntry:
+        entry = ImageEntry.from_stat(path, file_stat)
+        with self._lock:
+            self._avatars[digest] = entry
+        return entry
+
+    def discard_avatar(self, digest: str) -> None:
+        with self._lock:
+            self._avatars.pop(digest, None)
+
+    def stats(self) -> Dict:
+        return {
+            "user_images": len(self._user_images),
+            "avatars": len(self._avatars)
+        }
+
+
+def _scan_dir(path: str):
+    try:
+        with os.scandir(path) as entries:
+            return [entry for entry in entries if entry.is_file()]
+    except FileNotFoundError:
+        return []
+
+
+def _priority(path: str) -> int:
+    return IMAGE_EXTENSIONS.index(os.path.splitext(path)[1].lower())
@@ -0,0 +1,155 @@
+"""
+이미지 파일 저장소 (비동기)
+images/ 아래 파일의 존재 확인/읽기/쓰기/삭제를 전용 스레드 풀에서 실행해서
+디스크가 느려도 이벤트 루프(다른 JSON API)가 멈추지 않도록 합니다.
+
+쓰기는 항상 같은 디렉터리의 임시 파일에 쓴 뒤 os.replace로 교체하므로
+읽는 쪽은 이전 파일 또는 완성된 새 파일만 보게 됩니다.
+"""
+
+import asyncio
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterable, Callable, Dict, Optional, Tuple
+
+# 스트림 쓰기 시 모아서 한 번에 쓰는 크기
+STREAM_WRITE_SIZE = 256 * 1024
+
+
+class FileTooLargeError(Exception):
+    """스트림 쓰기 중 크기 상한 초과"""
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _read(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _stat(path: str) -> Optional[os.stat_result]:
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+def _remove(path: str) -> bool:
+    try:
+        os.remove(path)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def _create_temp(directory: str, suffix: str) -> str:
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=suffix)
+    os.close(fd)
+    return tmp_path
+
+
+def _write_temp(directory: str, data: bytes, suffix: str) -> str:
+    tmp_path = _create_temp(directory, suffix)
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    return tmp_path
+
+
+class ImageStorage:
+    """스레드 풀로 넘겨서 실행하는 파일 I/O"""
+
+    def __init__(self, max_workers: int = 4):
+        self._max_workers = max_workers
+        # 스레드 풀은 첫 작업 시 생성 (shutdown 후 재시작도 지원)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._operations = 0
+
+    async def exists(self, path: str) -> bool:
+        return await self.stat(path) is not None
+
+    async def stat(self, path: str) -> Optional[os.stat_result]:
+        """파일 정보 (없으면 None)"""
+        return await self._run(_stat, path)
+
+    async def read(self, path: str) -> bytes:
+        return await self._run(_read, path)
+
+    async def write(self, path: str, data: bytes) -> None:
+        """원자적 쓰기 (임시 파일 → os.replace)"""
+        await self._run(_write_atomic, path, data)
+
+    async def replace(self, src: str, dst: str) -> None:
+        await self._run(os.replace, src, dst)
+
+    async def remove(self, path: str) -> bool:
+        """삭제 (없었으면 False)"""
+        return await self._run(_remove, path)
+
+    async def write_temp(self, directory: str, data: bytes, suffix: str = ".upload") -> str:
+        """directory 안의 새 임시 파일에 data를 쓰고 경로 반환 (정리는 호출한 쪽 책임)"""
+        return await self._run(_write_temp, directory, data, suffix)
+
+    async def write_temp_stream(
+        self,
+        directory: str,
+        chunks: AsyncIterable[bytes],
+        max_bytes: int,
+        suffix: str = ".upload"
+    ) -> Tuple[str, int]:
+        """스트림을 임시 파일에 흘려 쓰고 (경로, 바이트 수) 반환
+
+        작은 청크는 모아서 한 번에 쓰고, max_bytes를 넘으면 임시 파일을 지우고 FileTooLargeError
+        """
+        tmp_path = await self._run(_create_temp, directory, suffix)
+        f = await self._run(open, tmp_path, "wb")
+        received = 0
+        buffer = bytearray()
+        try:
+            try:
+                async for chunk in chunks:
+                    received += len(chunk)
+                    if received > max_bytes:
+                        raise FileTooLargeError(f"File exceeds {max_bytes} bytes")
+                    buffer += chunk
+                    if len(buffer) >= STREAM_WRITE_SIZE:
+                        await self._run(f.write, bytes(buffer))
+                        buffer.clear()
+                if buffer:
+                    await self._run(f.write, bytes(buffer))
+            finally:
+                await self._run(f.close)
+        except BaseException:
+            await self._run(_remove, tmp_path)
+            raise
+        return tmp_path, received
+
+    def stats(self) -> Dict:
+        return {
+            "workers": self._max_workers,
+            "operations": self._operations
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def _run(self, func: Callable, *args):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="image-io")
+        self._operations += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
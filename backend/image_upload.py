@@ -0,0 +1,109 @@
+"""
+프로필 이미지 업로드 처리
+업로드된 파일을 Pillow로 열어서 실제 이미지인지 확인하고, 메타데이터(EXIF 등)를 버리고
+최대 크기로 줄인 PNG로 다시 인코딩한 뒤 최종 경로로 원자적으로 교체합니다.
+
+디코딩/인코딩은 CPU 작업이라 이벤트 루프가 아닌 전용 스레드 풀에서 실행합니다.
+(Pillow는 디코딩/인코딩 중 GIL을 해제함)
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+from PIL import Image, ImageOps
+
+# 받아들이는 원본 포맷
+ALLOWED_FORMATS = {"PNG", "JPEG", "WEBP", "GIF"}
+
+# 디코딩 전에 거부할 픽셀 수 (압축 폭탄 방지)
+MAX_SOURCE_PIXELS = 40_000_000
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidImageError(Exception):
+    """업로드된 데이터가 허용된 이미지가 아님 (메시지는 클라이언트에 그대로 전달되므로 고정 문구만 사용)"""
+
+
+def reencode_image(source_path: str, dest_path: str, max_dimension: int) -> None:
+    """source_path 이미지를 검증/정리해서 dest_path에 PNG로 저장 (임시 파일 → 이름 바꾸기)"""
+    try:
+        with Image.open(source_path) as image:
+            if image.format not in ALLOWED_FORMATS:
+                logger.warning("Rejected upload %s: format %s", source_path, image.format)
+                raise InvalidImageError("Unsupported image format")
+            width, height = image.size
+            if width * height > MAX_SOURCE_PIXELS:
+                logger.warning("Rejected upload %s: %sx%s pixels", source_path, width, height)
+                raise InvalidImageError("Image dimensions too large")
+            # 전체 디코딩 전에 헤더만으로 큰 JPEG를 줄여서 읽기
+            image.draft("RGB", (max_dimension, max_dimension))
+            image.load()
+            # EXIF 회전 정보를 픽셀에 반영 (메타데이터 자체는 저장하지 않음)
+            image = ImageOps.exif_transpose(image)
+            cleaned = image.convert("RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB")
+    except InvalidImageError:
+        raise
+    except (OSError, SyntaxError, ValueError, Image.DecompressionBombError) as e:
+        # Pillow 메시지에는 서버의 임시 파일 경로가 들어 있으므로 로그에만 남김
+        logger.warning("Rejected upload %s: %s", source_path, e)
+        raise InvalidImageError("Cannot decode image") from e
+
+    cleaned.thumbnail((max_dimension, max_dimension), Image.LANCZOS)
+
+    # 같은 사용자의 업로드가 동시에 처리돼도 임시 파일이 겹치지 않도록 스레드별 이름 사용
+    tmp_path = f"{dest_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        # 새 이미지 객체로 저장하므로 EXIF/ICC/텍스트 청크가 따라가지 않음
+        cleaned.save(tmp_path, "PNG", optimize=True)
+        os.replace(tmp_path, dest_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class ImageUploadPool:
+    """업로드 이미지 재인코딩 전용 스레드 풀"""
+
+    def __init__(self, max_workers: int = 2, max_dimension: int = 500):
+        self._max_workers = max_workers
+        self._max_dimension = max_dimension
+        # 스레드 풀은 첫 작업 시 생성 (shutdown 후 재시작도 지원)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight = 0
+        self._processed = 0
+        self._rejected = 0
+
+    async def process(self, source_path: str, dest_path: str) -> None:
+        """검증 + 재인코딩 (실패 시 InvalidImageError)"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="image-upload")
+
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._executor, reencode_image, source_path, dest_path, self._max_dimension)
+            self._processed += 1
+        except InvalidImageError:
+            self._rejected += 1
+            raise
+        finally:
+            self._in_flight -= 1
+
+    def stats(self) -> Dict:
+        return {
+            "workers": self._max_workers,
+            "max_dimension": self._max_dimension,
+            "in_flight": self._in_flight,
+            "processed": self._processed,
+            "rejected": self._rejected
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -0,0 +1,30 @@
+"""
+빠른 JSON 응답
+핸들러가 도메인 객체를 dict로 한 번만 변환해서 바로 직렬화합니다.
+FastAPI는 핸들러가 Response를 반환하면 response_model 검증/직렬화를 건너뛰므로
+(OpenAPI 스키마는 데코레이터의 response_model 그대로 유지)
+pydantic 모델 생성 → 재검증 → jsonable_encoder → json.dumps 과정을 생략할 수 있습니다.
+
+직렬화는 orjson(requirements.txt의 필수 의존성)으로 합니다.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import Response
+
+
+def dumps(content: Any) -> bytes:
+    """dict/list → JSON bytes (UTF-8, 공백 없음)"""
+    return orjson.dumps(content)
+
+
+class FastJSONResponse(Response):
+    """dict/list를 바로 직렬화하는 JSON 응답 (JSON bytes를 그대로 넘겨도 됨)"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
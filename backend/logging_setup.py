@@ -0,0 +1,212 @@
+"""
+로깅 설정
+요청 처리 스레드(이벤트 루프)는 로그 레코드를 큐에 넣기만 하고,
+포맷/출력은 QueueListener 스레드에서 처리합니다.
+
+- LOG_FORMAT=json: 한 줄에 JSON 한 개 (기본), text: 기존 텍스트 형식
+- 경로 접두사별 샘플링 비율/로그 레벨 (WARNING 이상은 샘플링하지 않음)
+- 비밀번호/토큰/이미지 같은 필드는 가리고, 긴 문자열은 잘라서 출력
+"""
+
+import contextvars
+import json
+import logging
+import logging.handlers
+import queue
+import random
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# 값을 출력하지 않고 가리는 필드 이름
+REDACTED_FIELDS = {"password", "token", "authorization", "image", "access_token", "secret"}
+
+# 요청별 로그 컨텍스트 (경로, 이 요청의 INFO 이하 로그를 남길지)
+_request_path: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("log_request_path", default=None)
+_request_sampled: contextvars.ContextVar[bool] = contextvars.ContextVar("log_request_sampled", default=True)
+
+
+def parse_path_settings(value: str) -> Dict[str, str]:
+    """"/api/images=0.1,/api/mentors=WARNING" 형식 → {경로 접두사: 값}"""
+    settings = {}
+    for item in value.split(","):
+        prefix, sep, setting = item.strip().partition("=")
+        if sep and prefix.strip() and setting.strip():
+            settings[prefix.strip()] = setting.strip()
+    return settings
+
+
+def truncate(value: str, max_length: int) -> str:
+    if len(value) <= max_length:
+        return value
+    return f"{value[:max_length]}...(+{len(value) - max_length} chars)"
+
+
+def redact(value: Any, max_length: int = 200) -> Any:
+    """로그에 남길 값 정리 (민감/대용량 필드 가림, 긴 문자열 자름)"""
+    if isinstance(value, dict):
+        cleaned = {}
+        for key, item in value.items():
+            if str(key).lower() in REDACTED_FIELDS:
+                cleaned[key] = f"<redacted {len(item)} chars>" if isinstance(item, (str, bytes)) and item else "<redacted>"
+            else:
+                cleaned[key] = redact(item, max_length)
+        return cleaned
+    if isinstance(value, (list, tuple)):
+        return [redact(item, max_length) for item in value]
+    if isinstance(value, str):
+        return truncate(value, max_length)
+    return value
+
+
+class LazyRedacted:
+    """로그 인자로 넘기면 메시지를 포맷할 때(리스너 스레드) 값을 만들어 redact() 적용
+
+    레벨/샘플링으로 버려지는 레코드는 포맷되지 않으므로 값을 만드는 비용(model_dump 등)도 들지 않습니다.
+    """
+
+    __slots__ = ("_produce", "_max_length")
+
+    def __init__(self, produce: Callable[[], Any], max_length: int = 200):
+        self._produce = produce
+        self._max_length = max_length
+
+    def __str__(self) -> str:
+        return str(redact(self._produce(), self._max_length))
+
+
+class PathPrefixSettings:
+    """가장 긴 경로 접두사가 일치하는 설정 선택"""
+
+    def __init__(self, settings: Dict[str, Any]):
+        # 긴 접두사부터 비교
+        self._items: Tuple[Tuple[str, Any], ...] = tuple(
+            sorted(settings.items(), key=lambda item: len(item[0]), reverse=True)
+        )
+
+    def lookup(self, path: Optional[str], default: Any) -> Any:
+        if path is not None:
+            for prefix, value in self._items:
+                if path.startswith(prefix):
+                    return value
+        return default
+
+
+class RequestLogFilter(logging.Filter):
+    """경로별 레벨/샘플링 필터 (큐에 넣기 전에 실행되므로 버려지는 레코드는 포맷되지 않음)"""
+
+    def __init__(self, levels: PathPrefixSettings):
+        super().__init__()
+        self._levels = levels
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        path = _request_path.get()
+        if path is None:
+            return True
+        if record.levelno < self._levels.lookup(path, logging.NOTSET):
+            return False
+        return _request_sampled.get()
+
+
+class LazyQueueHandler(logging.handlers.QueueHandler):
+    """메시지 포맷을 리스너 스레드로 미루는 QueueHandler
+
+    기본 QueueHandler.prepare()는 호출한 스레드에서 메시지를 포맷하므로,
+    예외 정보만 문자열로 바꾸고 msg/args는 그대로 넘깁니다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        record.path = _request_path.get()
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """로그 레코드 → JSON 한 줄"""
+
+    def __init__(self, max_message_length: int = 2000):
+        super().__init__()
+        self._max_message_length = max_message_length
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": truncate(record.getMessage(), self._max_message_length)
+        }
+        path = getattr(record, "path", None)
+        if path is not None:
+            entry["path"] = path
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class RequestLogContextMiddleware:
+    """요청 경로와 샘플링 여부를 로그 컨텍스트에 기록하는 ASGI 미들웨어"""
+
+    def __init__(self, app, sampling: Optional[PathPrefixSettings] = None):
+        self.app = app
+        self._sampling = sampling or PathPrefixSettings({})
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        path = scope["path"]
+        rate = self._sampling.lookup(path, 1.0)
+        path_token = _request_path.set(path)
+        sampled_token = _request_sampled.set(rate >= 1.0 or random.random() < rate)
+        try:
+            return await self.app(scope, receive, send)
+        finally:
+            _request_path.reset(path_token)
+            _request_sampled.reset(sampled_token)
+
+
+def setup_logging(
+    level: str = "INFO",
+    log_format: str = "json",
+    path_levels: Optional[Dict[str, str]] = None,
+    max_message_length: int = 2000
+) -> logging.handlers.QueueListener:
+    """루트 로거를 큐 기반 핸들러로 설정하고 시작된 리스너 반환 (종료 시 listener.stop())"""
+    if log_format == "json":
+        formatter: logging.Formatter = JsonFormatter(max_message_length)
+    else:
+        formatter = logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S"
+        )
+    output = logging.StreamHandler()
+    output.setFormatter(formatter)
+
+    levels = {prefix: logging.getLevelName(value.upper()) for prefix, value in (path_levels or {}).items()}
+    handler = LazyQueueHandler(queue.SimpleQueue())
+    handler.addFilter(RequestLogFilter(PathPrefixSettings(
+        {prefix: value for prefix, value in levels.items() if isinstance(value, int)}
+    )))
+
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(level.upper())
+
+    listener = logging.handlers.QueueListener(handler.queue, output, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+def sampling_settings(value: str) -> PathPrefixSettings:
+    """LOG_SAMPLING 환경변수 → 경로 접두사별 샘플링 비율"""
+    rates = {}
+    for prefix, rate in parse_path_settings(value).items():
+        try:
+            rates[prefix] = min(1.0, max(0.0, float(rate)))
+        except ValueError:
+            continue
+    return PathPrefixSettings(rates)
@@ -1,25 +1,65 @@
-from fastapi import FastAPI, HTTPException, Depends, status, Request, Body
+from fastapi import FastAPI, HTTPException, Depends, status, Request, Body, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from fastapi.responses import FileResponse, JSONResponse, RedirectResponse
+from fastapi.responses import JSONResponse, RedirectResponse, Response, StreamingResponse
 from fastapi.exceptions import RequestValidationError
 from passlib.context import CryptContext
 from jose import JWTError, jwt
 from datetime import datetime, timedelta
 from typing import Optional, List, Union
-from pydantic import BaseModel, ValidationError, EmailStr
-import json
+from pydantic import BaseModel, Field, ValidationError, EmailStr
+import asyncio
 import os
+import atexit
 import base64
 import logging
-import traceback
-
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
+import time
+
+from records import User, UserProfile, MatchRequest
+from store import UserStore, MatchRequestStore, DuplicateEmailError, DuplicateMatchRequestError, PendingLimitError, normalize_skill
+from storage import create_storage_backend
+from password_pool import PasswordPool, PasswordPoolBusyError
+from seed import load_seed_users, ensure_password_hashes
+from token_cache import TokenCache
+from response_cache import VersionedResponseCache
+from pagination import (
+    NEXT_CURSOR_HEADER, SYNC_RESET_HEADER, SYNC_VERSION_HEADER,
+    encode_cursor, decode_cursor, encode_sync_token, decode_sync_token
+)
+from image_cache import ImageCache, CachedImage, is_not_modified
+from avatar_service import AVATAR_DIR, AvatarRenderService, placeholder_png
+from create_test_images import avatar_digest, avatar_text
+from thumbnails import THUMBNAIL_SIZES, is_thumbnail_fresh, negotiate_format, render_thumbnail, thumbnail_path
+from image_upload import ImageUploadPool, InvalidImageError
+from image_storage import ImageStorage, FileTooLargeError
+from image_index import ImageIndex, ImageEntry, media_type_for
+from json_response import FastJSONResponse, dumps as json_dumps
+from match_events import HEARTBEAT, MatchEventBroker, format_sse
+from match_transitions import (
+    MatchTransitionEngine, TransitionResult, NOT_FOUND as TRANSITION_NOT_FOUND, FORBIDDEN as TRANSITION_FORBIDDEN,
+    MENTOR_ALREADY_MATCHED
+)
+from logging_setup import LazyRedacted, RequestLogContextMiddleware, parse_path_settings, sampling_settings, setup_logging
+
+# 로깅 설정 (큐 기반 - 출력은 별도 리스너 스레드에서)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+# json 또는 text
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json")
+# 경로 접두사별 INFO 로그 샘플링 비율 (예: "/api/images=0.1,/api/mentors=0.5")
+LOG_SAMPLING = os.getenv("LOG_SAMPLING", "/api/images=0.1")
+# 경로 접두사별 최소 로그 레벨 (예: "/api/images=WARNING")
+LOG_PATH_LEVELS = os.getenv("LOG_PATH_LEVELS", "")
+# 메시지 최대 길이 (초과분은 잘라냄)
+LOG_MAX_MESSAGE_LENGTH = int(os.getenv("LOG_MAX_MESSAGE_LENGTH", "2000"))
+
+log_listener = setup_logging(
+    level=LOG_LEVEL,
+    log_format=LOG_FORMAT,
+    path_levels=parse_path_settings(LOG_PATH_LEVELS),
+    max_message_length=LOG_MAX_MESSAGE_LENGTH
 )
+# 종료 시 큐에 남은 로그 출력
+atexit.register(log_listener.stop)
 logger = logging.getLogger(__name__)
 
 # FastAPI의 uvicorn 로거도 활성화
@@ -31,10 +71,62 @@ SECRET_KEY = "your-secret-key-here"  # 실제로는 환경변수로 관리해야
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# 목록 API 페이지 크기 상한 (limit 파라미터)
+MAX_PAGE_LIMIT = 100
+
+# 멘티 한 명이 동시에 가질 수 있는 대기 중 매칭 요청 수
+# (요구사항: 멘토가 수락/거절하기 전까지 다른 멘토에게 요청할 수 없음 → 기본 1)
+MAX_PENDING_MATCH_REQUESTS = int(os.getenv("MAX_PENDING_MATCH_REQUESTS", "1"))
+
+# 일괄 수락/거절 한 번에 처리할 수 있는 요청 수
+MAX_BULK_ACTION_SIZE = int(os.getenv("MAX_BULK_ACTION_SIZE", "100"))
+
+# 프로필 이미지 캐시 설정
+IMAGE_CACHE_MAX_BYTES = int(os.getenv("IMAGE_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+# 브라우저는 항상 재검증 (변경이 없으면 304로 본문 없이 응답)
+IMAGE_CACHE_CONTROL = os.getenv("IMAGE_CACHE_CONTROL", "public, no-cache")
+
+# 기본 아바타 렌더링 프로세스 풀 설정
+AVATAR_RENDER_WORKERS = int(os.getenv("AVATAR_RENDER_WORKERS", "2"))
+# 이미지 요청이 렌더링을 기다리는 최대 시간 (초과 시 임시 이미지 응답)
+AVATAR_RENDER_WAIT_SECONDS = float(os.getenv("AVATAR_RENDER_WAIT_SECONDS", "2.0"))
+
+# 프로필 이미지 업로드 설정
+IMAGE_UPLOAD_MAX_BYTES = int(os.getenv("IMAGE_UPLOAD_MAX_BYTES", str(5 * 1024 * 1024)))
+# 저장 시 긴 변의 최대 픽셀 수 (더 크면 줄여서 저장)
+IMAGE_UPLOAD_MAX_DIMENSION = int(os.getenv("IMAGE_UPLOAD_MAX_DIMENSION", "500"))
+IMAGE_UPLOAD_WORKERS = int(os.getenv("IMAGE_UPLOAD_WORKERS", "2"))
+
+# 이미지 파일 I/O 스레드 풀 크기
+IMAGE_IO_WORKERS = int(os.getenv("IMAGE_IO_WORKERS", "4"))
+
+# 매칭 요청 이벤트 스트림(SSE) 설정
+# 이벤트가 없을 때 연결 유지용 주석을 보내는 간격 (초)
+SSE_HEARTBEAT_SECONDS = float(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))
+# 연결별로 쌓아 둘 수 있는 이벤트 수 (넘치면 resync 이벤트로 대체)
+SSE_QUEUE_SIZE = int(os.getenv("SSE_QUEUE_SIZE", "100"))
+
+# 검증된 토큰 캐시 설정 (토큰 → claims/사용자)
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "10000"))
+TOKEN_CACHE_TTL_SECONDS = float(os.getenv("TOKEN_CACHE_TTL_SECONDS", "300"))
+
+# 저장소 설정 - "memory"(재시작 시 초기화) 또는 "sqlite"(파일에 영속 저장)
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "memory")
+SQLITE_PATH = os.getenv("SQLITE_PATH", "data/mentor_mentee.db")
+
+# 테스트 데이터 설정 - SEED_TEST_DATA=false면 시작 시 테스트 사용자를 만들지 않음
+SEED_TEST_DATA = os.getenv("SEED_TEST_DATA", "true").lower() in ("1", "true", "yes")
+SEED_DATA_PATH = os.getenv("SEED_DATA_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "seed_data.json"))
+
 # Password hashing - rounds를 낮춰서 성능 향상
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=10)
 security = HTTPBearer(auto_error=False)
 
+# bcrypt 작업은 이벤트 루프를 막지 않도록 전용 스레드 풀에서 실행
+PASSWORD_POOL_WORKERS = int(os.getenv("PASSWORD_POOL_WORKERS", str(min(4, os.cpu_count() or 1))))
+PASSWORD_POOL_MAX_PENDING = int(os.getenv("PASSWORD_POOL_MAX_PENDING", "64"))
+password_pool = PasswordPool(pwd_context, max_workers=PASSWORD_POOL_WORKERS, max_pending=PASSWORD_POOL_MAX_PENDING)
+
 # Pydantic 모델들
 class SignupRequest(BaseModel):
     email: str
@@ -49,12 +141,6 @@ class LoginRequest(BaseModel):
 class LoginResponse(BaseModel):
     token: str
 
-class UserProfile(BaseModel):
-    name: str
-    bio: Optional[str] = ""
-    imageUrl: Optional[str] = None
-    skills: Optional[List[str]] = []
-
 class MentorProfile(BaseModel):
     name: str
     bio: str
@@ -106,13 +192,6 @@ class UpdateProfileRequest(BaseModel):
         }
     }
 
-class MatchRequest(BaseModel):
-    id: int
-    mentorId: int
-    menteeId: int
-    message: str
-    status: str  # "pending", "accepted", "rejected", "cancelled"
-
 class CreateMatchRequest(BaseModel):
     mentorId: int
     menteeId: int
@@ -125,20 +204,76 @@ class MatchRequestResponse(BaseModel):
     message: str
     status: str
 
-class User(BaseModel):
+# 일괄 수락/거절 (멘토 전용)
+class BulkMatchRequestAction(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=MAX_BULK_ACTION_SIZE)
+    action: str  # "accept" or "reject"
+
+class BulkMatchRequestResult(BaseModel):
     id: int
-    email: str
-    role: str
-    profile: UserProfile
-    hashed_password: str
+    # 같은 요청을 단건 API로 처리했을 때의 HTTP 상태 코드
+    status: int
+    matchRequest: Optional[MatchRequestResponse] = None
+    detail: Optional[str] = None
+
+class BulkMatchRequestResponse(BaseModel):
+    action: str
+    succeeded: int
+    failed: int
+    results: List[BulkMatchRequestResult]
+
+# 영속 저장소 백엔드 (인메모리 저장소의 변경 내용을 write-through로 기록)
+storage_backend = create_storage_backend(STORAGE_BACKEND, SQLITE_PATH)
+
+# In-memory 저장소 (id / 이메일 / 역할 인덱스)
+user_store = UserStore(backend=storage_backend)
+
+# 매칭 요청 저장소 (id / 멘토 / 멘티 / 상태 인덱스)
+match_request_store = MatchRequestStore(backend=storage_backend)
+
+# 매칭 요청 변경 이벤트 (SSE 연결로 전달)
+match_event_broker = MatchEventBroker(max_queue=SSE_QUEUE_SIZE)
+MATCH_REQUEST_EVENT = "match_request"
+
+# 검증된 토큰 캐시 - 사용자가 변경/삭제되면 해당 사용자의 토큰을 무효화
+token_cache = TokenCache(max_size=TOKEN_CACHE_SIZE, ttl_seconds=TOKEN_CACHE_TTL_SECONDS)
+
+def invalidate_user_tokens(user_id: Optional[int]):
+    if user_id is None:
+        token_cache.clear()
+    else:
+        token_cache.invalidate_user(user_id)
 
-# In-memory 저장소
-users_db: List[User] = []
-user_id_counter = 1
+user_store.add_listener(invalidate_user_tokens)
 
-# 매칭 요청 저장소
-match_requests_db: List[MatchRequest] = []
-match_request_id_counter = 1
+# 멘토 리스트 응답 캐시 ((skill, order_by) → JSON bytes) - 멘토 정보가 바뀌면 버전 증가
+mentor_list_cache = VersionedResponseCache()
+
+def invalidate_mentor_list(user_id: Optional[int]):
+    user = user_store.get(user_id) if user_id is not None else None
+    if user is None or user.role == "mentor":
+        mentor_list_cache.bump()
+
+user_store.add_listener(invalidate_mentor_list)
+
+# 프로필 이미지 캐시 ((role, user_id) → 이미지 바이트 + ETag/Last-Modified)
+image_cache = ImageCache(max_bytes=IMAGE_CACHE_MAX_BYTES)
+
+# images/ 파일 I/O (이벤트 루프 밖 스레드 풀에서 실행)
+image_storage = ImageStorage(max_workers=IMAGE_IO_WORKERS)
+
+# 이미지 파일 인덱스 ((role, user_id) / 아바타 digest → 파일 경로, 시작 시 스캔)
+image_index = ImageIndex()
+
+# 기본 아바타 렌더러 (프로세스 풀 + 아바타별 single-flight)
+avatar_service = AvatarRenderService(
+    image_index,
+    max_workers=AVATAR_RENDER_WORKERS,
+    wait_timeout=AVATAR_RENDER_WAIT_SECONDS
+)
+
+# 업로드 이미지 검증/재인코딩 스레드 풀
+image_upload_pool = ImageUploadPool(max_workers=IMAGE_UPLOAD_WORKERS, max_dimension=IMAGE_UPLOAD_MAX_DIMENSION)
 
 # Helper functions
 def get_password_hash(password: str) -> str:
@@ -147,6 +282,27 @@ def get_password_hash(password: str) -> str:
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
+def raise_password_pool_busy():
+    raise HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Server busy, please retry",
+        headers={"Retry-After": "1"}
+    )
+
+async def get_password_hash_async(password: str) -> str:
+    """워커 풀에서 패스워드 해싱 (대기열이 가득 차면 503)"""
+    try:
+        return await password_pool.hash(password)
+    except PasswordPoolBusyError:
+        raise_password_pool_busy()
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """워커 풀에서 패스워드 검증 (대기열이 가득 차면 503)"""
+    try:
+        return await password_pool.verify(plain_password, hashed_password)
+    except PasswordPoolBusyError:
+        raise_password_pool_busy()
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
@@ -158,43 +314,155 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     return encoded_jwt
 
 def get_user_by_email(email: str) -> Optional[User]:
-    for user in users_db:
-        if user.email == email:
-            return user
-    return None
+    return user_store.get_by_email(email)
 
 def get_user_by_id(user_id: int) -> Optional[User]:
-    for user in users_db:
-        if user.id == user_id:
-            return user
-    return None
+    return user_store.get(user_id)
 
-def get_match_request_by_id(request_id: int) -> Optional[MatchRequest]:
-    for match_request in match_requests_db:
-        if match_request.id == request_id:
-            return match_request
-    return None
+def get_users_by_role(role: str) -> List[User]:
+    return user_store.by_role(role)
 
-def create_match_request(mentor_id: int, mentee_id: int, message: str) -> MatchRequest:
-    global match_request_id_counter
-    
+def parse_skill_filter(skill: Optional[str]) -> List[str]:
+    """skill 파라미터 파싱 ("React,TypeScript" → ["react", "typescript"])"""
+    if not skill:
+        return []
+    return sorted({normalize_skill(s) for s in skill.split(",") if normalize_skill(s)})
+
+def get_match_request_by_id(request_id: int) -> Optional[MatchRequest]:
+    return match_request_store.get(request_id)
+
+def create_match_request(
+    mentor_id: int,
+    mentee_id: int,
+    message: str,
+    request_status: str = "pending",
+    max_pending: Optional[int] = None
+) -> MatchRequest:
+    """매칭 요청 생성 (max_pending이 주어지면 중복/대기 중 요청 수 제한 확인 - 위반 시 store 예외)"""
+    # id는 저장소에 추가할 때 발급됨
     match_request = MatchRequest(
-        id=match_request_id_counter,
+        id=None,
         mentorId=mentor_id,
         menteeId=mentee_id,
         message=message,
-        status="pending"
+        status=request_status
     )
     
-    match_requests_db.append(match_request)
-    match_request_id_counter += 1
+    match_request_store.add(match_request, max_pending=max_pending)
+    publish_match_request_event(match_request, "created")
     return match_request
 
-def get_incoming_requests(mentor_id: int) -> List[MatchRequest]:
-    return [req for req in match_requests_db if req.mentorId == mentor_id]
+def publish_match_request_event(match_request: MatchRequest, action: str):
+    """매칭 요청 변경을 멘토/멘티의 이벤트 스트림으로 전달 (연결이 없으면 직렬화도 하지 않음)
+
+    action: created / accepted / rejected / cancelled
+    멘토에게는 incoming 목록, 멘티에게는 outgoing 목록과 같은 형식으로 보냅니다.
+    """
+    if match_event_broker.has_subscribers(match_request.mentorId):
+        match_event_broker.publish(
+            match_request.mentorId,
+            MATCH_REQUEST_EVENT,
+            json_dumps({"type": action, "version": match_request.version, "matchRequest": match_request_dict(match_request)})
+        )
+    if match_event_broker.has_subscribers(match_request.menteeId):
+        match_event_broker.publish(
+            match_request.menteeId,
+            MATCH_REQUEST_EVENT,
+            json_dumps({"type": action, "version": match_request.version, "matchRequest": match_request_outgoing_dict(match_request)})
+        )
+
+# 매칭 요청 상태 전이 (수락/거절/취소) - 성공하면 이벤트 스트림으로 알림
+match_transition_engine = MatchTransitionEngine(match_request_store, on_transition=publish_match_request_event)
+
+def transition_error(result: TransitionResult, action: str):
+    """전이 실패 결과 → (HTTP 상태 코드, 메시지) - 성공이면 None"""
+    if result.ok:
+        return None
+    if result.outcome == TRANSITION_NOT_FOUND:
+        return status.HTTP_404_NOT_FOUND, "Match request not found"
+    if result.outcome == TRANSITION_FORBIDDEN:
+        return status.HTTP_403_FORBIDDEN, f"Can only {action} your own match requests"
+    if result.outcome == MENTOR_ALREADY_MATCHED:
+        return status.HTTP_400_BAD_REQUEST, "Mentor has already accepted another match request"
+    if action == "cancel":
+        return status.HTTP_400_BAD_REQUEST, f"Cannot cancel {result.previous_status} match request"
+    return status.HTTP_400_BAD_REQUEST, f"Match request already {result.previous_status}"
+
+def raise_for_transition(result: TransitionResult, request_id: int, user_id: int, action: str):
+    """전이 실패 결과 → HTTPException (상태 코드/메시지는 기존 엔드포인트와 동일)"""
+    error = transition_error(result, action)
+    if error is None:
+        return
+    logger.warning("User %s could not %s match request %s: %s", user_id, action, request_id, result.outcome)
+    raise HTTPException(status_code=error[0], detail=error[1])
+
+def get_incoming_requests(mentor_id: int, after_id: Optional[int] = None, limit: Optional[int] = None) -> List[MatchRequest]:
+    return match_request_store.by_mentor(mentor_id, after_id=after_id, limit=limit)
 
-def get_outgoing_requests(mentee_id: int) -> List[MatchRequest]:
-    return [req for req in match_requests_db if req.menteeId == mentee_id]
+def get_outgoing_requests(mentee_id: int, after_id: Optional[int] = None, limit: Optional[int] = None) -> List[MatchRequest]:
+    return match_request_store.by_mentee(mentee_id, after_id=after_id, limit=limit)
+
+def parse_cursor(cursor: Optional[str], ordering: str):
+    """커서 파라미터 디코딩 (잘못된 커서면 400)"""
+    if not cursor:
+        return None
+    try:
+        return decode_cursor(cursor, ordering)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+def paginate_match_requests(fetch, owner_id: int, cursor: Optional[str], limit: Optional[int]):
+    """매칭 요청 목록 한 페이지 + 다음 커서 (id 순 keyset 페이지네이션)"""
+    after = parse_cursor(cursor, "id")
+    if after is not None and (len(after) != 1 or not isinstance(after[0], int)):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+    # 다음 페이지가 있는지 알기 위해 하나 더 가져옴
+    items = fetch(owner_id, after_id=after[0] if after else None, limit=limit + 1 if limit else None)
+    next_cursor = None
+    if limit and len(items) > limit:
+        items = items[:limit]
+        next_cursor = encode_cursor("id", (items[-1].id,))
+    return items, next_cursor
+
+def current_sync_token() -> str:
+    return encode_sync_token(*match_request_store.sync_state())
+
+def sync_match_requests(fetch_changed, owner_id: int, since: str, limit: Optional[int]):
+    """since 토큰 이후 바뀐 매칭 요청 + 다음 since 토큰 + 전체 목록 여부 (잘못된 토큰이면 400)
+
+    토큰의 epoch가 저장소와 다르면 (서버 재시작, 다른 워커, 저장소 초기화) 같은 버전 번호라도
+    다른 변경을 가리키므로 전체 목록(버전 0 이후 변경)을 반환합니다. 버전이 현재보다 큰 경우도 같음.
+    limit개보다 많이 바뀌었으면 limit개까지만 반환하고 마지막 항목의 버전을 다음 since로 줍니다.
+    """
+    try:
+        since_epoch, since_version = decode_sync_token(since)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid since"
+        )
+    epoch, current_version = match_request_store.sync_state()
+    reset = since_epoch != epoch or since_version > current_version
+    if reset:
+        since_version = 0
+    items = fetch_changed(owner_id, since_version, limit=limit + 1 if limit else None)
+    if limit and len(items) > limit:
+        items = items[:limit]
+        return items, encode_sync_token(epoch, items[-1].version), reset
+    return items, encode_sync_token(epoch, current_version), reset
+
+def reject_cursor_with_since(cursor: Optional[str], since: Optional[str]):
+    if cursor and since is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="cursor cannot be combined with since"
+        )
 
 def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> User:
     try:
@@ -214,6 +482,12 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
             )
         
         token = credentials.credentials
+        
+        # 이미 검증된 토큰이면 jwt.decode 생략
+        cached = token_cache.get(token)
+        if cached is not None:
+            return cached[1]
+        
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         user_id = payload.get("user_id")
         if user_id is None:
@@ -229,6 +503,7 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
                 detail="User not found",
                 headers={"WWW-Authenticate": "Bearer"}
             )
+        token_cache.put(token, payload, user)
         return user
     except JWTError as e:
         raise HTTPException(
@@ -245,190 +520,121 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
             headers={"WWW-Authenticate": "Bearer"}
         )
 
-def create_user_response(user: User) -> UserResponse:
-    """User 객체를 UserResponse로 변환"""
+# 응답 변환 - 도메인 객체를 API 스펙 형식의 dict로 한 번만 변환 (FastJSONResponse로 바로 직렬화)
+# 형식은 UserResponse / MentorListItem / MatchRequestResponse / MatchRequestOutgoing 모델과 동일
+def user_response_dict(user: User) -> dict:
+    """User 객체 → UserResponse 형식 dict (멘토만 skills 포함)"""
+    profile = {
+        "name": user.profile.name,
+        "bio": user.profile.bio or "",
+        "imageUrl": user.profile.imageUrl or f"/images/{user.role}/{user.id}"
+    }
     if user.role == "mentor":
-        profile = MentorProfile(
-            name=user.profile.name,
-            bio=user.profile.bio or "",
-            imageUrl=user.profile.imageUrl or f"/images/mentor/{user.id}",
-            skills=user.profile.skills or []
-        )
-    else:  # mentee
-        profile = MenteeProfile(
-            name=user.profile.name,
-            bio=user.profile.bio or "",
-            imageUrl=user.profile.imageUrl or f"/images/mentee/{user.id}"
-        )
+        profile["skills"] = list(user.profile.skills or [])
     
-    return UserResponse(
-        id=user.id,
-        email=user.email,
-        role=user.role,
-        profile=profile
-    )
+    return {
+        "id": user.id,
+        "email": user.email,
+        "role": user.role,
+        "profile": profile
+    }
+
+def match_request_dict(match_request: MatchRequest) -> dict:
+    """MatchRequest → MatchRequestResponse 형식 dict"""
+    return {
+        "id": match_request.id,
+        "mentorId": match_request.mentorId,
+        "menteeId": match_request.menteeId,
+        "message": match_request.message,
+        "status": match_request.status
+    }
+
+def match_request_outgoing_dict(match_request: MatchRequest) -> dict:
+    """MatchRequest → MatchRequestOutgoing 형식 dict (message 필드 없음)"""
+    return {
+        "id": match_request.id,
+        "mentorId": match_request.mentorId,
+        "menteeId": match_request.menteeId,
+        "status": match_request.status
+    }
 
-def authenticate_user(email: str, password: str) -> Optional[User]:
+async def authenticate_user(email: str, password: str) -> Optional[User]:
     user = get_user_by_email(email)
     if not user:
         return None
-    if not verify_password(password, user.hashed_password):
+    if not await verify_password_async(password, user.hashed_password):
         return None
     return user
 
-def create_user(signup_data: SignupRequest) -> User:
-    global user_id_counter
-    
-    logger.info(f"👤 Creating user {user_id_counter} - {signup_data.name}")
+def create_user(signup_data: SignupRequest, hashed_password: Optional[str] = None) -> User:
+    """사용자 생성 (같은 이메일이 저장소 백엔드에 이미 있으면 store.DuplicateEmailError)"""
+    logger.info("👤 Creating user - %s", signup_data.name)
     
-    # 기본 이미지 URL 생성
-    image_url = f"/images/{signup_data.role}/{user_id_counter}"
-    
-    # 프로필 생성
+    # 프로필 생성 (기본 이미지 URL은 id가 발급된 뒤에 설정)
     profile = UserProfile(
         name=signup_data.name,
         bio="",
-        imageUrl=image_url,
+        imageUrl=None,
         skills=[] if signup_data.role == "mentor" else None
     )
     
-    # 패스워드 해싱 (가장 시간이 많이 걸리는 부분)
-    logger.info(f"🔐 Hashing password for user {user_id_counter}")
-    hashed_password = get_password_hash(signup_data.password)
-    logger.info(f"✅ Password hashed for user {user_id_counter}")
+    # 패스워드 해싱 (가장 시간이 많이 걸리는 부분 - API에서는 워커 풀에서 미리 해싱해서 전달)
+    if hashed_password is None:
+        logger.info("🔐 Hashing password for %s", signup_data.name)
+        hashed_password = get_password_hash(signup_data.password)
+        logger.info("✅ Password hashed for %s", signup_data.name)
     
-    # 사용자 생성
+    # 사용자 생성 (id는 저장소가 발급 - SQLite 백엔드면 DB가 발급)
     user = User(
-        id=user_id_counter,
+        id=None,
         email=signup_data.email,
         role=signup_data.role,
         profile=profile,
         hashed_password=hashed_password
     )
     
-    users_db.append(user)
-    logger.info(f"✅ User {user_id_counter} added to database")
-    user_id_counter += 1
+    user_store.add(user)
+    # 기본 이미지 URL 생성
+    user.profile.imageUrl = f"/images/{user.role}/{user.id}"
+    user_store.update(user)
+    logger.info("✅ User %s added to database", user.id)
     return user
 
+def load_persisted_data():
+    """영속 저장소에 저장된 사용자/매칭 요청을 인메모리 저장소로 불러오기"""
+    user_store.load(User.from_dict(row) for row in storage_backend.load_users())
+    match_request_store.load(MatchRequest.from_dict(row) for row in storage_backend.load_match_requests())
+    logger.info("Loaded persisted data (%s): %s users, %s match requests", STORAGE_BACKEND, len(user_store), len(match_request_store))
+
 def init_test_data():
     """테스트 데이터 초기화"""
-    global users_db, user_id_counter
-    
     # 이미 데이터가 있으면 초기화하지 않음
-    if len(users_db) > 0:
+    if len(user_store) > 0:
         return
     
-    logger.info("Initializing test data...")
-    
-    # 멘토 테스트 데이터
-    mentors_data = [
-        {
-            "email": "mentor1@example.com",
-            "password": "password123",
-            "name": "김프론트",
-            "role": "mentor",
-            "bio": "React와 Vue.js 전문 프론트엔드 개발자입니다. 5년 경력으로 다양한 프로젝트 경험이 있습니다.",
-            "skills": ["React", "Vue", "JavaScript", "TypeScript"]
-        },
-        {
-            "email": "mentor2@example.com", 
-            "password": "password123",
-            "name": "이백엔드",
-            "role": "mentor",
-            "bio": "Python과 Java를 활용한 백엔드 개발 전문가입니다. 대용량 시스템 설계 경험이 풍부합니다.",
-            "skills": ["Python", "FastAPI", "Django", "Java", "Spring Boot"]
-        },
-        {
-            "email": "mentor3@example.com",
-            "password": "password123", 
-            "name": "박풀스택",
-            "role": "mentor",
-            "bio": "풀스택 개발자로 프론트엔드부터 백엔드까지 전 영역을 다룹니다. 스타트업 경험이 많습니다.",
-            "skills": ["React", "Node.js", "Express", "MongoDB", "PostgreSQL"]
-        },
-        {
-            "email": "mentor4@example.com",
-            "password": "password123",
-            "name": "최모바일",
-            "role": "mentor", 
-            "bio": "React Native와 Flutter를 이용한 모바일 앱 개발 전문가입니다.",
-            "skills": ["React Native", "Flutter", "iOS", "Android", "Dart"]
-        },
-        {
-            "email": "mentor5@example.com",
-            "password": "password123",
-            "name": "정데이터",
-            "role": "mentor",
-            "bio": "데이터 분석과 머신러닝 전문가입니다. Python을 주로 사용합니다.",
-            "skills": ["Python", "Pandas", "NumPy", "TensorFlow", "PyTorch"]
-        }
-    ]
-    
-    # 멘티 테스트 데이터
-    mentees_data = [
-        {
-            "email": "mentee1@example.com",
-            "password": "password123",
-            "name": "김신입",
-            "role": "mentee",
-            "bio": "프론트엔드 개발자를 꿈꾸는 신입 개발자입니다. React를 배우고 있습니다."
-        },
-        {
-            "email": "mentee2@example.com",
-            "password": "password123", 
-            "name": "이학생",
-            "role": "mentee",
-            "bio": "컴퓨터공학과 학생입니다. 백엔드 개발에 관심이 많습니다."
-        },
-        {
-            "email": "mentee3@example.com",
-            "password": "password123",
-            "name": "박취준",
-            "role": "mentee", 
-            "bio": "취업 준비생입니다. 웹 개발 전반에 대해 배우고 싶습니다."
-        },
-        {
-            "email": "mentee4@example.com",
-            "password": "password123",
-            "name": "최전향",
-            "role": "mentee",
-            "bio": "비전공자에서 개발자로 전향하려고 합니다. 모바일 앱 개발에 관심이 있습니다."
-        }
-    ]
+    logger.info("Initializing test data from %s...", SEED_DATA_PATH)
     
-    # 멘토 데이터 생성
-    for mentor_data in mentors_data:
-        signup_request = SignupRequest(
-            email=mentor_data["email"],
-            password=mentor_data["password"],
-            name=mentor_data["name"],
-            role=mentor_data["role"]
-        )
-        user = create_user(signup_request)
-        
-        # 추가 프로필 정보 설정
-        user.profile.bio = mentor_data["bio"]
-        user.profile.skills = mentor_data["skills"]
-        
-        logger.info(f"Created mentor: {user.profile.name} (ID: {user.id})")
+    # 픽스처에 미리 계산된 해시가 없는 항목만 병렬 해싱
+    seed_users = ensure_password_hashes(load_seed_users(SEED_DATA_PATH), get_password_hash)
     
-    # 멘티 데이터 생성  
-    for mentee_data in mentees_data:
+    for seed_user in seed_users:
         signup_request = SignupRequest(
-            email=mentee_data["email"],
-            password=mentee_data["password"], 
-            name=mentee_data["name"],
-            role=mentee_data["role"]
+            email=seed_user["email"],
+            password="",
+            name=seed_user["name"],
+            role=seed_user["role"]
         )
-        user = create_user(signup_request)
+        user = create_user(signup_request, hashed_password=seed_user["hashed_password"])
         
         # 추가 프로필 정보 설정
-        user.profile.bio = mentee_data["bio"]
+        user.profile.bio = seed_user.get("bio", "")
+        if user.role == "mentor":
+            user.profile.skills = seed_user.get("skills", [])
+        user_store.update(user)
         
-        logger.info(f"Created mentee: {user.profile.name} (ID: {user.id})")
+        logger.info("Created %s: %s (ID: %s)", user.role, user.profile.name, user.id)
     
-    logger.info(f"Test data initialization completed. Total users: {len(users_db)}")
+    logger.info("Test data initialization completed. Total users: %s", len(user_store))
 
 app = FastAPI(
     title="Mentor-Mentee API",
@@ -436,13 +642,34 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# 서버 시작에 걸린 시간 (초)
+startup_duration: Optional[float] = None
+
 # 서버 시작 시 테스트 데이터 초기화
 @app.on_event("startup")
 async def startup_event():
     """서버 시작 시 실행되는 이벤트"""
+    global startup_duration
+    started_at = time.perf_counter()
     logger.info("Server starting up...")
-    init_test_data()
-    logger.info("Server startup completed")
+    load_persisted_data()
+    indexed = image_index.scan(AVATAR_DIR)
+    logger.info("Indexed %s image files", indexed)
+    if SEED_TEST_DATA:
+        init_test_data()
+    else:
+        logger.info("Test data seeding disabled (SEED_TEST_DATA=false)")
+    startup_duration = time.perf_counter() - started_at
+    logger.info("Server startup completed in %.3fs", startup_duration)
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """서버 종료 시 실행되는 이벤트"""
+    password_pool.shutdown()
+    avatar_service.shutdown()
+    image_upload_pool.shutdown()
+    image_storage.shutdown()
+    storage_backend.close()
 
 # CORS 설정 (프론트엔드와 연결하기 위해)
 app.add_middleware(
@@ -451,8 +678,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, SYNC_VERSION_HEADER, SYNC_RESET_HEADER],
 )
 
+# 요청 경로별 로그 샘플링/레벨 적용을 위한 컨텍스트
+app.add_middleware(RequestLogContextMiddleware, sampling=sampling_settings(LOG_SAMPLING))
+
 
 @app.get("/")
 async def root():
@@ -477,7 +708,7 @@ async def debug_users():
     """디버그용: 모든 사용자 정보 조회"""
     try:
         users_info = []
-        for user in users_db:
+        for user in user_store.all():
             user_info = {
                 "id": user.id,
                 "email": user.email,
@@ -492,17 +723,35 @@ async def debug_users():
             users_info.append(user_info)
         
         return {
-            "total_users": len(users_db),
+            "total_users": len(user_store),
             "users": users_info
         }
     except Exception as e:
-        logger.error(f"Error in debug endpoint: {str(e)}")
+        logger.error("Error in debug endpoint: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error"
         )
 
 
+@app.get("/api/debug/stats")
+async def debug_stats():
+    """디버그용: 워커 풀 등 내부 상태 통계 조회"""
+    return {
+        "startup_seconds": startup_duration,
+        "password_pool": password_pool.stats(),
+        "token_cache": token_cache.stats(),
+        "mentor_list_cache": mentor_list_cache.stats(),
+        "image_cache": image_cache.stats(),
+        "avatar_render": avatar_service.stats(),
+        "image_upload": image_upload_pool.stats(),
+        "image_io": image_storage.stats(),
+        "image_index": image_index.stats(),
+        "match_events": match_event_broker.stats(),
+        "match_transitions": match_transition_engine.stats()
+    }
+
+
 # API 엔드포인트들
 @app.post("/api/signup", status_code=status.HTTP_201_CREATED)
 async def signup(signup_data: SignupRequest = Body(...)):
@@ -537,15 +786,33 @@ async def signup(signup_data: SignupRequest = Body(...)):
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Invalid role"
             )
-        response_data = create_user_response(create_user(signup_data))
-        return response_data
+        hashed_password = await get_password_hash_async(signup_data.password)
+        # 해싱을 기다리는 동안 같은 이메일로 가입됐을 수 있으므로 다시 확인
+        if get_user_by_email(signup_data.email):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email already exists"
+            )
+        try:
+            user = create_user(signup_data, hashed_password=hashed_password)
+        except DuplicateEmailError:
+            # 다른 워커가 같은 이메일로 먼저 저장한 경우 (SQLite unique 인덱스)
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email already exists"
+            )
+        # 가입 전에 이 id로 요청된 아바타("User")가 캐시에 남아 있을 수 있음
+        image_cache.invalidate(user.role, user.id)
+        # 기본 아바타는 가입 시점에 미리 렌더링 시작 (첫 이미지 요청에서 그리지 않도록)
+        avatar_service.schedule(user.role, avatar_text(user.profile.name))
+        return FastJSONResponse(user_response_dict(user), status_code=status.HTTP_201_CREATED)
     except HTTPException as e:
         total_time = (datetime.utcnow() - request_start).total_seconds()
-        logger.error(f"❌ SIGNUP HTTP ERROR ({total_time:.3f}s): {e.status_code} - {e.detail}")
+        logger.error("❌ SIGNUP HTTP ERROR (%.3fs): %s - %s", total_time, e.status_code, e.detail)
         raise
     except Exception as e:
         total_time = (datetime.utcnow() - request_start).total_seconds()
-        logger.error(f"💥 SIGNUP ERROR ({total_time:.3f}s): {str(e)}")
+        logger.error("💥 SIGNUP ERROR (%.3fs): %s", total_time, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error"
@@ -557,7 +824,7 @@ async def login(login_data: LoginRequest = Body(...)):
     """로그인"""
     try:
         print("in login")
-        logger.info(f"🔐 LOGIN ATTEMPT: {login_data.email}")
+        logger.info("🔐 LOGIN ATTEMPT: %s", login_data.email)
         # 필수 필드 체크
         if not login_data.email or not login_data.password:
             raise HTTPException(
@@ -565,7 +832,7 @@ async def login(login_data: LoginRequest = Body(...)):
                 detail="Missing required fields"
             )
         # 사용자 인증
-        user = authenticate_user(login_data.email, login_data.password)
+        user = await authenticate_user(login_data.email, login_data.password)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -577,15 +844,15 @@ async def login(login_data: LoginRequest = Body(...)):
             data={"sub": user.email, "user_id": user.id, "role": user.role}, 
             expires_delta=access_token_expires
         )
-        logger.info(f"✅ LOGIN SUCCESS: User {user.id} ({user.email}) as {user.role}")
-        response_data = LoginResponse(token=access_token)
-        logger.info(f"📤 LOGIN RESPONSE: Token generated for user {user.id}")
+        logger.info("✅ LOGIN SUCCESS: User %s (%s) as %s", user.id, user.email, user.role)
+        response_data = FastJSONResponse({"token": access_token})
+        logger.info("📤 LOGIN RESPONSE: Token generated for user %s", user.id)
         return response_data
     except HTTPException as e:
-        logger.error(f"❌ LOGIN HTTP ERROR: {e.status_code} - {e.detail}")
+        logger.error("❌ LOGIN HTTP ERROR: %s - %s", e.status_code, e.detail)
         raise
     except Exception as e:
-        logger.error(f"💥 LOGIN UNEXPECTED ERROR: {str(e)}")
+        logger.error("💥 LOGIN UNEXPECTED ERROR: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error"
@@ -596,20 +863,43 @@ async def login(login_data: LoginRequest = Body(...)):
 async def get_current_user_info(current_user: User = Depends(get_current_user)):
     """내 정보 조회"""
     try:
-        logger.info(f"👤 GET MY INFO: User {current_user.id} ({current_user.email})")
+        logger.info("👤 GET MY INFO: User %s (%s)", current_user.id, current_user.email)
         
-        response_data = create_user_response(current_user)
-        logger.info(f"📤 MY INFO RESPONSE: User {current_user.id} - {current_user.profile.name} ({current_user.role})")
+        response_data = FastJSONResponse(user_response_dict(current_user))
+        logger.info("📤 MY INFO RESPONSE: User %s - %s (%s)", current_user.id, current_user.profile.name, current_user.role)
         
         return response_data
     except Exception as e:
-        logger.error(f"💥 GET MY INFO ERROR: {str(e)}")
+        logger.error("💥 GET MY INFO ERROR: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error"
         )
 
 
+def raise_image_too_large():
+    raise HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Image too large (max {IMAGE_UPLOAD_MAX_BYTES} bytes)"
+    )
+
+
+async def store_profile_image(user: User, source_path: str) -> str:
+    """업로드 임시 파일을 검증/재인코딩해서 사용자 프로필 이미지로 저장 (실패 시 InvalidImageError)"""
+    images_dir = f"images/{user.role}"
+    image_path = os.path.join(images_dir, f"{user.id}.png")
+    await image_upload_pool.process(source_path, image_path)
+    image_index.put_user_image(user.role, user.id, image_path, await image_storage.stat(image_path))
+    
+    # 예전에 다른 확장자로 저장된 원본이 있으면 새 PNG보다 먼저 찾히지 않도록 제거
+    for ext in (".jpg", ".jpeg"):
+        old_path = os.path.join(images_dir, f"{user.id}{ext}")
+        await image_storage.remove(old_path)
+    
+    image_cache.invalidate(user.role, user.id)
+    return image_path
+
+
 @app.put("/api/profile", response_model=UserResponse)
 async def update_profile(
     request: Request,
@@ -619,12 +909,13 @@ async def update_profile(
     """프로필 수정"""
     try:
         # 요청 데이터 로깅
-        logger.info(f"Profile update request from user {current_user.id}")
-        logger.info(f"Request data: {profile_data.dict()}")
+        logger.info("Profile update request from user %s", current_user.id)
+        # 덤프/가리기는 로그가 실제로 출력될 때만 (이미지 Base64가 포함될 수 있음)
+        logger.info("Request data: %s", LazyRedacted(profile_data.model_dump))
         
         # 사용자 ID 확인
         if profile_data.id != current_user.id:
-            logger.warning(f"User {current_user.id} tried to update profile of user {profile_data.id}")
+            logger.warning("User %s tried to update profile of user %s", current_user.id, profile_data.id)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot update profile of another user"
@@ -632,7 +923,7 @@ async def update_profile(
         
         # 역할 확인
         if profile_data.role != current_user.role:
-            logger.warning(f"User {current_user.id} tried to change role from {current_user.role} to {profile_data.role}")
+            logger.warning("User %s tried to change role from %s to %s", current_user.id, current_user.role, profile_data.role)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot change user role"
@@ -642,212 +933,379 @@ async def update_profile(
         image_path = None
         if profile_data.image and profile_data.image.strip():  # 빈 문자열 체크 추가
             try:
-                logger.info(f"Processing image upload for user {current_user.id}")
+                logger.info("Processing image upload for user %s", current_user.id)
+                # 디코딩 전에 크기 확인 (Base64는 4글자 → 3바이트)
+                if len(profile_data.image) // 4 * 3 > IMAGE_UPLOAD_MAX_BYTES:
+                    raise_image_too_large()
                 # Base64 디코딩
                 image_data = base64.b64decode(profile_data.image)
-                logger.info(f"Image decoded successfully, size: {len(image_data)} bytes")
-                
-                # 이미지 저장 디렉토리 생성
-                images_dir = f"images/{current_user.role}"
-                os.makedirs(images_dir, exist_ok=True)
+                logger.info("Image decoded successfully, size: %s bytes", len(image_data))
                 
-                # 이미지 파일 저장 (PNG 형식)
-                image_filename = f"{current_user.id}.png"
-                image_path = os.path.join(images_dir, image_filename)
+                # 임시 파일에 쓴 뒤 검증/재인코딩해서 PNG로 저장
+                tmp_path = await image_storage.write_temp(f"images/{current_user.role}", image_data)
+                del image_data
+                try:
+                    image_path = await store_profile_image(current_user, tmp_path)
+                finally:
+                    await image_storage.remove(tmp_path)
                 
-                with open(image_path, "wb") as f:
-                    f.write(image_data)
-                
-                logger.info(f"Image saved to: {image_path}")
+                logger.info("Image saved to: %s", image_path)
                 
+            except HTTPException:
+                raise
+            except InvalidImageError as e:
+                logger.error("Image processing error for user %s: %s", current_user.id, e)
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Invalid image data: {e}"
+                )
             except Exception as e:
-                logger.error(f"Image processing error for user {current_user.id}: {str(e)}")
+                # 예외 메시지에 서버 경로 등이 들어 있을 수 있으므로 응답에는 고정 문구만 사용
+                logger.error("Image processing error for user %s: %s", current_user.id, e)
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid image data: {str(e)}"
+                    detail="Invalid image data"
                 )
         else:
-            logger.info(f"No image provided for user {current_user.id}, skipping image processing")
+            logger.info("No image provided for user %s, skipping image processing", current_user.id)
         
         # 프로필 업데이트
-        logger.info(f"Updating profile for user {current_user.id}")
+        logger.info("Updating profile for user %s", current_user.id)
         current_user.profile.name = profile_data.name
         current_user.profile.bio = profile_data.bio
         
         if current_user.role == "mentor" and profile_data.skills is not None:
             current_user.profile.skills = profile_data.skills
-            logger.info(f"Updated skills for mentor {current_user.id}: {profile_data.skills}")
+            logger.info("Updated skills for mentor %s: %s", current_user.id, profile_data.skills)
         
         if image_path:
             current_user.profile.imageUrl = f"/images/{current_user.role}/{current_user.id}"
         
-        logger.info(f"Profile update completed for user {current_user.id}")
-        return create_user_response(current_user)
+        user_store.update(current_user)
+        # 이름이 바뀌면 기본 아바타도 달라지므로 캐시 항목 제거
+        image_cache.invalidate(current_user.role, current_user.id)
+        
+        logger.info("Profile update completed for user %s", current_user.id)
+        return FastJSONResponse(user_response_dict(current_user))
         
     except HTTPException:
         raise
     except ValidationError as e:
-        logger.error(f"Validation error in profile update: {str(e)}")
+        logger.error("Validation error in profile update: %s", e)
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail=f"Validation error: {str(e)}"
         )
     except Exception as e:
-        logger.error(f"Unexpected error in profile update: {str(e)}")
+        logger.error("Unexpected error in profile update: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Internal server error: {str(e)}"
         )
 
 
+@app.put("/api/profile/image", response_model=UserResponse)
+async def upload_profile_image(
+    request: Request,
+    current_user: User = Depends(get_current_user)
+):
+    """프로필 이미지 업로드 - 본문은 이미지 바이너리 그대로 (예: Content-Type: image/jpeg)
+    
+    본문을 메모리에 모으지 않고 임시 파일로 흘려 쓰며, 크기 상한을 넘으면 413
+    """
+    tmp_path = None
+    try:
+        logger.info("Binary image upload from user %s", current_user.id)
+        
+        # 선언된 크기가 이미 상한을 넘으면 본문을 읽지 않고 거부
+        content_length = request.headers.get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > IMAGE_UPLOAD_MAX_BYTES:
+            raise_image_too_large()
+        
+        try:
+            tmp_path, received = await image_storage.write_temp_stream(
+                f"images/{current_user.role}",
+                request.stream(),
+                IMAGE_UPLOAD_MAX_BYTES
+            )
+        except FileTooLargeError:
+            raise_image_too_large()
+        
+        if received == 0:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Empty image data"
+            )
+        
+        image_path = await store_profile_image(current_user, tmp_path)
+        logger.info("Image saved to: %s (%s bytes received)", image_path, received)
+        
+        current_user.profile.imageUrl = f"/images/{current_user.role}/{current_user.id}"
+        user_store.update(current_user)
+        return FastJSONResponse(user_response_dict(current_user))
+        
+    except HTTPException as e:
+        logger.error("❌ IMAGE UPLOAD HTTP ERROR: %s - %s", e.status_code, e.detail)
+        raise
+    except InvalidImageError as e:
+        logger.error("Image processing error for user %s: %s", current_user.id, e)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid image data: {e}"
+        )
+    except Exception as e:
+        logger.error("💥 IMAGE UPLOAD UNEXPECTED ERROR: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error"
+        )
+    finally:
+        if tmp_path:
+            await image_storage.remove(tmp_path)
+
+
 @app.get("/api/mentors", response_model=List[MentorListItem])
 async def get_mentors(
     skill: Optional[str] = None,
     order_by: Optional[str] = None,
+    skill_match: str = Query("any", pattern="^(any|all)$"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: Optional[str] = None,
     current_user: User = Depends(get_current_user)
 ):
-    """멘토 전체 리스트 조회 (멘티 전용)"""
+    """멘토 전체 리스트 조회 (멘티 전용)
+    
+    skill은 쉼표로 여러 개 지정 가능 (skill=React,TypeScript)
+    skill_match=any(기본값)는 하나라도 가진 멘토, all은 모두 가진 멘토 (다른 값은 400)
+    limit을 주면 페이지 단위로 반환하고, 다음 페이지 커서는 X-Next-Cursor 헤더로 전달
+    """
     try:
-        logger.info(f"Mentor list request from user {current_user.id} (role: {current_user.role})")
+        logger.info("Mentor list request from user %s (role: %s)", current_user.id, current_user.role)
         
         # 멘티만 접근 가능
         if current_user.role != "mentee":
-            logger.warning(f"Non-mentee user {current_user.id} tried to access mentor list")
+            logger.warning("Non-mentee user %s tried to access mentor list", current_user.id)
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Only mentees can access mentor list"
             )
         
-        # 모든 멘토 사용자 가져오기
-        mentors = [user for user in users_db if user.role == "mentor"]
-        logger.info(f"Found {len(mentors)} mentors")
-        
-        # skill 파라미터로 필터링
-        if skill:
-            skill_lower = skill.lower()
-            filtered_mentors = []
-            for mentor in mentors:
-                if mentor.profile.skills:
-                    # 스킬 목록에서 대소문자 구분 없이 검색
-                    mentor_skills = [s.lower() for s in mentor.profile.skills]
-                    if skill_lower in mentor_skills:
-                        filtered_mentors.append(mentor)
-            mentors = filtered_mentors
-            logger.info(f"Filtered by skill '{skill}': {len(mentors)} mentors found")
-        
-        # order_by 파라미터로 정렬
-        if order_by == "name":
-            mentors.sort(key=lambda x: x.profile.name.lower())
-            logger.info("Sorted mentors by name")
-        elif order_by == "skill":
-            # 첫 번째 스킬을 기준으로 정렬 (스킬이 없으면 맨 뒤로)
-            mentors.sort(key=lambda x: (x.profile.skills[0].lower() if x.profile.skills else "zzz"))
-            logger.info("Sorted mentors by skill")
-        else:
-            # 기본: mentor ID 기준 오름차순
-            mentors.sort(key=lambda x: x.id)
-            logger.info("Sorted mentors by ID (default)")
-        
-        # API 스펙에 맞는 형식으로 변환 (profile 객체 안에 name 포함)
-        mentor_list = []
-        for mentor in mentors:
-            mentor_profile = MentorProfile(
-                name=mentor.profile.name,
-                bio=mentor.profile.bio or "",
-                imageUrl=mentor.profile.imageUrl or f"/images/mentor/{mentor.id}",
-                skills=mentor.profile.skills or []
-            )
-            mentor_item = MentorListItem(
-                id=mentor.id,
-                email=mentor.email,
-                role=mentor.role,
-                profile=mentor_profile
+        skills = parse_skill_filter(skill)
+        match_all = skill_match == "all"
+        
+        ordering = user_store.mentor_ordering(order_by)
+        after = parse_cursor(cursor, ordering)
+        paginated = limit is not None or after is not None
+        
+        # 캐시된 응답이 있으면 그대로 반환 (pydantic 검증/직렬화 생략) - 페이지 요청은 캐시하지 않음
+        cache_key = (tuple(skills), match_all, ordering)
+        cache_version = mentor_list_cache.version
+        cached_body = mentor_list_cache.get(cache_key) if not paginated else None
+        if cached_body is not None:
+            logger.info("📤 MENTORS RESPONSE (cached): skill=%s, order_by=%s", skill, order_by)
+            return FastJSONResponse(cached_body)
+        
+        # 정렬 순서는 저장소가 미리 유지 (요청마다 정렬하지 않음)
+        # 다음 페이지가 있는지 알기 위해 하나 더 가져옴
+        fetch_limit = limit + 1 if limit else None
+        try:
+            if skills:
+                # 스킬 역색인으로 필터링 (대소문자 구분 없음)
+                mentor_ids = user_store.mentor_ids_with_skills(skills, match_all=match_all)
+                mentors = user_store.mentors_ordered(ordering, ids=mentor_ids, after=after, limit=fetch_limit)
+                logger.info("Filtered by skill '%s' (%s): %s mentors found", skill, 'all' if match_all else 'any', len(mentors))
+            else:
+                mentors = user_store.mentors_ordered(ordering, after=after, limit=fetch_limit)
+                logger.info("Found %s mentors", len(mentors))
+        except TypeError:
+            # 커서의 정렬 키 형식이 정렬 순서와 맞지 않음
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
             )
-            mentor_list.append(mentor_item)
         
-        logger.info(f"Returning {len(mentor_list)} mentors to user {current_user.id}")
+        next_cursor = None
+        if limit and len(mentors) > limit:
+            mentors = mentors[:limit]
+            next_cursor = encode_cursor(ordering, user_store.mentor_sort_key(mentors[-1].id, ordering))
+        
+        # API 스펙에 맞는 형식으로 변환 (MentorListItem 형식 = 멘토의 UserResponse)
+        mentor_list = [user_response_dict(mentor) for mentor in mentors]
+        
+        logger.info("Returning %s mentors to user %s", len(mentor_list), current_user.id)
         
         # 응답 데이터 로깅 (요약)
-        logger.info(f"📤 MENTORS RESPONSE: {len(mentor_list)} mentors")
+        logger.info("📤 MENTORS RESPONSE: %s mentors", len(mentor_list))
         for mentor in mentor_list[:3]:  # 처음 3명만 로깅
-            logger.info(f"  - Mentor {mentor.id}: {mentor.profile.name} ({len(mentor.profile.skills)} skills)")
+            logger.info("  - Mentor %s: %s (%s skills)", mentor["id"], mentor["profile"]["name"], len(mentor["profile"]["skills"]))
         if len(mentor_list) > 3:
-            logger.info(f"  ... and {len(mentor_list) - 3} more mentors")
+            logger.info("  ... and %s more mentors", len(mentor_list) - 3)
         
-        return mentor_list
+        body = json_dumps(mentor_list)
+        if not paginated:
+            mentor_list_cache.put(cache_key, body, cache_version)
+        response = FastJSONResponse(body)
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
+        return response
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in get_mentors: {str(e)}")
+        logger.error("Error in get_mentors: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error"
         )
 
 
+async def read_image_file(image_path: str) -> CachedImage:
+    """이미지 파일 → CachedImage (썸네일처럼 인덱스에 없는 파일용)"""
+    file_stat = await image_storage.stat(image_path)
+    body = await image_storage.read(image_path)
+    return CachedImage(body, media_type_for(image_path), file_stat.st_mtime)
+
+
+async def load_image_variant(source: ImageEntry, size: Optional[int], image_format: str) -> CachedImage:
+    """원본 또는 썸네일 읽기 (썸네일은 처음 요청될 때 생성)"""
+    if size is None:
+        # 경로/타입/수정 시각은 인덱스에 있으므로 본문만 읽음
+        body = await image_storage.read(source.path)
+        return CachedImage(body, source.media_type, source.mtime)
+    
+    path = thumbnail_path(source.path, size, image_format)
+    if is_thumbnail_fresh(source.mtime, await image_storage.stat(path)):
+        return await read_image_file(path)
+    
+    # 파일 I/O는 image_storage, 크기 조절(CPU 작업)만 스레드 풀에서 실행
+    source_body = await image_storage.read(source.path)
+    loop = asyncio.get_running_loop()
+    body = await loop.run_in_executor(None, render_thumbnail, source_body, size, image_format)
+    await image_storage.write(path, body)
+    file_stat = await image_storage.stat(path)
+    return CachedImage(body, media_type_for(path), file_stat.st_mtime)
+
+
+async def load_default_avatar(
+    role: str,
+    user_id: int,
+    size: Optional[int] = None,
+    image_format: str = "png"
+) -> Optional[CachedImage]:
+    """기본 아바타 (content-addressed, 같은 아바타는 캐시 항목 하나를 공유, 아직 준비되지 않았으면 None)"""
+    # 사용자 정보 가져오기
+    target_user = get_user_by_id(user_id)
+    text = avatar_text(target_user.profile.name if target_user else "User")
+    digest = avatar_digest(role, text)
+    
+    cache_key = ("avatar", digest) if size is None else ("avatar", digest, size, image_format)
+    image = image_cache.get(cache_key)
+    if image is not None:
+        return image
+    
+    # 렌더 프로세스 풀에서 실행 (진행 중이면 합류, 인덱스에 이미 있으면 바로 반환)
+    if not await avatar_service.render(role, text):
+        return None
+    entry = image_index.get_avatar(digest)
+    if entry is None:
+        return None
+    try:
+        image = await load_image_variant(entry, size, image_format)
+    except FileNotFoundError:
+        # 인덱스 밖에서 파일이 지워짐 - 다음 요청에서 다시 렌더링
+        image_index.discard_avatar(digest)
+        return None
+    image_cache.put(cache_key, image)
+    return image
+
+
+async def load_profile_image(
+    role: str,
+    user_id: int,
+    size: Optional[int] = None,
+    image_format: str = "png"
+) -> Optional[CachedImage]:
+    """프로필 이미지 읽기 (업로드된 이미지가 없으면 기본 아바타, 아직 준비되지 않았으면 None)"""
+    # 파일 위치는 인덱스에서 조회 (확장자별 파일 확인 없음)
+    entry = image_index.get_user_image(role, user_id)
+    if entry is not None:
+        logger.info("📁 IMAGE FOUND: %s", entry.path)
+        try:
+            return await load_image_variant(entry, size, image_format)
+        except FileNotFoundError:
+            # 인덱스 밖에서 파일이 지워짐
+            logger.warning("📁 IMAGE MISSING: %s removed outside the server", entry.path)
+            image_index.discard_user_image(role, user_id)
+    
+    # 파일이 없으면 기본 아바타
+    logger.info("📁 IMAGE NOT FOUND: Using default avatar for %s/%s", role, user_id)
+    return await load_default_avatar(role, user_id, size, image_format)
+
+
 @app.get("/api/images/{role}/{user_id}")
 async def get_profile_image(
+    request: Request,
     role: str,
-    user_id: int
+    user_id: int,
+    size: Optional[int] = None
 ):
-    """프로필 이미지 조회 - 인증 없이 접근 가능"""
+    """프로필 이미지 조회 - 인증 없이 접근 가능
+    
+    size를 지정하면 size x size 썸네일을 반환하고, Accept에 image/webp가 있으면 WebP로 반환
+    """
     try:
-        logger.info(f"🖼️ IMAGE REQUEST: Requesting image for {role}/{user_id}")
+        logger.info("🖼️ IMAGE REQUEST: Requesting image for %s/%s", role, user_id)
         
         # 역할 유효성 검사
         if role not in ["mentor", "mentee"]:
-            logger.warning(f"❌ IMAGE ERROR: Invalid role {role}")
+            logger.warning("❌ IMAGE ERROR: Invalid role %s", role)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Invalid role"
             )
         
-        # 여러 이미지 형식 지원 (png, jpg, jpeg)
-        image_extensions = [".png", ".jpg", ".jpeg"]
-        image_path = None
-        
-        for ext in image_extensions:
-            potential_path = f"images/{role}/{user_id}{ext}"
-            if os.path.exists(potential_path):
-                image_path = potential_path
-                logger.info(f"📁 IMAGE FOUND: {image_path}")
-                break
-        
-        # 파일이 없으면 기본 이미지 생성
-        if not image_path:
-            logger.info(f"📁 IMAGE NOT FOUND: Creating default image for {role}/{user_id}")
-            # 기본 이미지 생성
-            from create_test_images import create_single_image
-            
-            # 사용자 정보 가져오기
-            target_user = get_user_by_id(user_id)
-            user_name = target_user.profile.name if target_user else "User"
-            
-            image_path = create_single_image(
-                user_id=user_id,
-                role=role,
-                name=user_name,
-                filename=f"images/{role}/{user_id}.png"
+        # 썸네일 크기 검사
+        if size is not None and size not in THUMBNAIL_SIZES:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid size (allowed: {', '.join(str(s) for s in THUMBNAIL_SIZES)})"
             )
-            logger.info(f"✅ IMAGE CREATED: {image_path}")
         
-        # 미디어 타입 결정
-        if image_path.endswith('.png'):
-            media_type = "image/png"
-        elif image_path.endswith('.jpg') or image_path.endswith('.jpeg'):
-            media_type = "image/jpeg"
+        if size is None:
+            image_format = "png"
+            cache_key = (role, user_id)
         else:
-            media_type = "image/png"
+            image_format = negotiate_format(request.headers.get("accept"))
+            cache_key = (role, user_id, size, image_format)
+        image = image_cache.get(cache_key)
+        if image is None:
+            image = await load_profile_image(role, user_id, size, image_format)
+            if image is None:
+                # 아직 렌더링 중 - 임시 이미지 응답 (브라우저/서버 모두 캐시하지 않음)
+                return Response(content=placeholder_png(), media_type="image/png", headers={"Cache-Control": "no-store"})
+            image_cache.put(cache_key, image)
+        
+        headers = {
+            "ETag": image.etag,
+            "Last-Modified": image.last_modified_header,
+            "Cache-Control": IMAGE_CACHE_CONTROL
+        }
+        if size is not None:
+            # 썸네일은 Accept에 따라 포맷이 달라짐
+            headers["Vary"] = "Accept"
         
-        logger.info(f"📤 IMAGE RESPONSE: Serving {image_path} as {media_type}")
-        return FileResponse(image_path, media_type=media_type)
+        # 조건부 GET - 변경이 없으면 본문 없이 304
+        if is_not_modified(image, request.headers.get("if-none-match"), request.headers.get("if-modified-since")):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        
+        logger.info("📤 IMAGE RESPONSE: Serving %s/%s as %s", role, user_id, image.media_type)
+        return Response(content=image.body, media_type=image.media_type, headers=headers)
         
     except HTTPException as e:
-        logger.error(f"❌ IMAGE HTTP ERROR: {e.status_code} - {e.detail}")
+        logger.error("❌ IMAGE HTTP ERROR: %s - %s", e.status_code, e.detail)
         raise
     except Exception as e:
-        logger.error(f"💥 IMAGE UNEXPECTED ERROR: {str(e)}")
+        logger.error("💥 IMAGE UNEXPECTED ERROR: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error"
@@ -858,7 +1316,7 @@ async def get_profile_image(
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """422 Validation Error 핸들러 → 400 또는 401 Bad Request로 변경"""
-    logger.error(f"Validation error on {request.url}: {exc.errors()}")
+    logger.error("Validation error on %s: %s", request.url, exc.errors())
     logger.error("Request body reading skipped to avoid timeout issues")
     
     # login API에서는 401 에러로 처리
@@ -917,12 +1375,31 @@ async def create_match_request_api(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Mentee ID mismatch"
             )
-        match_request = create_match_request(match_data.mentorId, match_data.menteeId, match_data.message)
-        return MatchRequestResponse(**match_request.dict())
+        # 같은 멘토에게 대기 중인 요청이 있거나 대기 중 요청이 한도만큼 있으면 거절 (인덱스로 O(1) 확인)
+        try:
+            match_request = create_match_request(
+                match_data.mentorId,
+                match_data.menteeId,
+                match_data.message,
+                max_pending=MAX_PENDING_MATCH_REQUESTS
+            )
+        except DuplicateMatchRequestError:
+            logger.warning("Mentee %s already has a pending request to mentor %s", current_user.id, match_data.mentorId)
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Match request to this mentor is already pending"
+            )
+        except PendingLimitError:
+            logger.warning("Mentee %s reached the pending match request limit", current_user.id)
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Too many pending match requests (max {MAX_PENDING_MATCH_REQUESTS})"
+            )
+        return FastJSONResponse(match_request_dict(match_request))
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in create_match_request: {str(e)}")
+        logger.error("Error in create_match_request: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error"
@@ -931,43 +1408,51 @@ async def create_match_request_api(
 
 @app.get("/api/match-requests/incoming", response_model=List[MatchRequestResponse])
 async def get_incoming_match_requests(
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: Optional[str] = None,
+    since: Optional[str] = None,
     current_user: User = Depends(get_current_user)
 ):
-    """나에게 들어온 요청 목록 (멘토 전용)"""
+    """나에게 들어온 요청 목록 (멘토 전용) - limit/cursor로 페이지 조회 가능
+
+    since(이전 응답의 X-Sync-Version 토큰)를 주면 그 이후 추가/상태 변경된 요청만 버전 순으로 반환합니다.
+    다음에 보낼 since 값은 X-Sync-Version 헤더로 전달됩니다.
+    """
     try:
-        logger.info(f"📥 INCOMING REQUESTS: Mentor {current_user.id} checking incoming requests")
+        logger.info("📥 INCOMING REQUESTS: Mentor %s checking incoming requests", current_user.id)
         
         # 멘토만 접근 가능
         if current_user.role != "mentor":
-            logger.warning(f"Non-mentor user {current_user.id} tried to access incoming requests")
+            logger.warning("Non-mentor user %s tried to access incoming requests", current_user.id)
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Only mentors can access incoming match requests"
             )
         
         # 해당 멘토에게 온 요청들 가져오기
-        incoming_requests = get_incoming_requests(current_user.id)
+        reject_cursor_with_since(cursor, since)
+        sync_version, reset, next_cursor = current_sync_token(), False, None
+        if since is not None:
+            incoming_requests, sync_version, reset = sync_match_requests(match_request_store.changed_for_mentor, current_user.id, since, limit)
+        else:
+            incoming_requests, next_cursor = paginate_match_requests(get_incoming_requests, current_user.id, cursor, limit)
         
-        logger.info(f"📤 INCOMING REQUESTS RESPONSE: {len(incoming_requests)} requests for mentor {current_user.id}")
+        logger.info("📤 INCOMING REQUESTS RESPONSE: %s requests for mentor %s", len(incoming_requests), current_user.id)
         
-        response_data = [
-            MatchRequestResponse(
-                id=req.id,
-                mentorId=req.mentorId,
-                menteeId=req.menteeId,
-                message=req.message,
-                status=req.status
-            )
-            for req in incoming_requests
-        ]
+        response_data = FastJSONResponse([match_request_dict(req) for req in incoming_requests])
+        if next_cursor:
+            response_data.headers[NEXT_CURSOR_HEADER] = next_cursor
+        response_data.headers[SYNC_VERSION_HEADER] = sync_version
+        if reset:
+            response_data.headers[SYNC_RESET_HEADER] = "true"
         
         return response_data
         
     except HTTPException as e:
-        logger.error(f"❌ INCOMING REQUESTS HTTP ERROR: {e.status_code} - {e.detail}")
+        logger.error("❌ INCOMING REQUESTS HTTP ERROR: %s - %s", e.status_code, e.detail)
         raise
     except Exception as e:
-        logger.error(f"💥 INCOMING REQUESTS UNEXPECTED ERROR: {str(e)}")
+        logger.error("💥 INCOMING REQUESTS UNEXPECTED ERROR: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error"
@@ -976,111 +1461,195 @@ async def get_incoming_match_requests(
 
 @app.get("/api/match-requests/outgoing", response_model=List[MatchRequestOutgoing])
 async def get_outgoing_match_requests(
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: Optional[str] = None,
+    since: Optional[str] = None,
     current_user: User = Depends(get_current_user)
 ):
-    """내가 보낸 요청 목록 (멘티 전용)"""
+    """내가 보낸 요청 목록 (멘티 전용) - limit/cursor로 페이지 조회 가능
+
+    since(이전 응답의 X-Sync-Version 토큰)를 주면 그 이후 추가/상태 변경된 요청만 버전 순으로 반환합니다.
+    다음에 보낼 since 값은 X-Sync-Version 헤더로 전달됩니다.
+    """
     try:
-        logger.info(f"📤 OUTGOING REQUESTS: Mentee {current_user.id} checking outgoing requests")
+        logger.info("📤 OUTGOING REQUESTS: Mentee %s checking outgoing requests", current_user.id)
         
         # 멘티만 접근 가능
         if current_user.role != "mentee":
-            logger.warning(f"Non-mentee user {current_user.id} tried to access outgoing requests")
+            logger.warning("Non-mentee user %s tried to access outgoing requests", current_user.id)
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Only mentees can access outgoing match requests"
             )
         
         # 해당 멘티가 보낸 요청들 가져오기
-        outgoing_requests = get_outgoing_requests(current_user.id)
+        reject_cursor_with_since(cursor, since)
+        sync_version, reset, next_cursor = current_sync_token(), False, None
+        if since is not None:
+            outgoing_requests, sync_version, reset = sync_match_requests(match_request_store.changed_for_mentee, current_user.id, since, limit)
+        else:
+            outgoing_requests, next_cursor = paginate_match_requests(get_outgoing_requests, current_user.id, cursor, limit)
         
-        logger.info(f"📤 OUTGOING REQUESTS RESPONSE: {len(outgoing_requests)} requests from mentee {current_user.id}")
+        logger.info("📤 OUTGOING REQUESTS RESPONSE: %s requests from mentee %s", len(outgoing_requests), current_user.id)
         
         # API 스펙에 맞는 형식으로 변환 (message 필드 제외)
-        response_data = [
-            MatchRequestOutgoing(
-                id=req.id,
-                mentorId=req.mentorId,
-                menteeId=req.menteeId,
-                status=req.status
-            )
-            for req in outgoing_requests
-        ]
+        response_data = FastJSONResponse([match_request_outgoing_dict(req) for req in outgoing_requests])
+        if next_cursor:
+            response_data.headers[NEXT_CURSOR_HEADER] = next_cursor
+        response_data.headers[SYNC_VERSION_HEADER] = sync_version
+        if reset:
+            response_data.headers[SYNC_RESET_HEADER] = "true"
         
         return response_data
         
     except HTTPException as e:
-        logger.error(f"❌ OUTGOING REQUESTS HTTP ERROR: {e.status_code} - {e.detail}")
+        logger.error("❌ OUTGOING REQUESTS HTTP ERROR: %s - %s", e.status_code, e.detail)
         raise
     except Exception as e:
-        logger.error(f"💥 OUTGOING REQUESTS UNEXPECTED ERROR: {str(e)}")
+        logger.error("💥 OUTGOING REQUESTS UNEXPECTED ERROR: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error"
         )
 
 
-@app.put("/api/match-requests/{request_id}/accept", response_model=MatchRequestResponse)
-async def accept_match_request(
-    request_id: int,
+@app.get("/api/match-requests/events")
+async def stream_match_request_events(
+    request: Request,
     current_user: User = Depends(get_current_user)
 ):
-    """요청 수락 (멘토 전용)"""
+    """내 매칭 요청 변경 이벤트 스트림 (SSE)
+
+    - 연결 직후 `ready` 이벤트 (클라이언트는 이때 목록을 한 번 조회)
+    - `match_request` 이벤트: {"type": created/accepted/rejected/cancelled, "matchRequest": {...}}
+    - `resync` 이벤트: 이벤트가 밀려서 버려졌으니 목록을 다시 조회
+    - 이벤트가 없으면 SSE_HEARTBEAT_SECONDS마다 keepalive 주석
+    """
+    async def event_stream():
+        # 구독은 스트림이 실제로 시작될 때 (응답 전에 연결이 끊기면 구독이 남지 않도록)
+        subscription = match_event_broker.subscribe(current_user.id)
+        logger.info("📡 EVENT STREAM: User %s connected", current_user.id)
+        try:
+            yield format_sse("ready", json_dumps({"userId": current_user.id, "role": current_user.role}))
+            while True:
+                message = await subscription.get(SSE_HEARTBEAT_SECONDS)
+                if message is None:
+                    if await request.is_disconnected():
+                        break
+                    yield HEARTBEAT
+                else:
+                    yield message
+        finally:
+            match_event_broker.unsubscribe(subscription)
+            logger.info("📡 EVENT STREAM: User %s disconnected", current_user.id)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # 프록시(nginx) 버퍼링 끄기
+            "X-Accel-Buffering": "no"
+        }
+    )
+
+
+@app.post("/api/match-requests/bulk", response_model=BulkMatchRequestResponse)
+async def bulk_update_match_requests(
+    bulk_data: BulkMatchRequestAction = Body(...),
+    current_user: User = Depends(get_current_user)
+):
+    """여러 요청 일괄 수락/거절 (멘토 전용)
+
+    요청마다 단건 수락/거절과 같은 규칙으로 처리하고 (요청 단위로 원자적, 실패한 요청이 있어도 나머지는 처리)
+    결과는 요청한 id 순서대로 반환합니다. 같은 id가 여러 번 있으면 한 번만 처리합니다.
+    id는 멘토의 요청 목록을 한 번 훑어서 찾으므로 다른 멘토의 요청은 없는 요청과 같이 404입니다.
+    """
     try:
-        logger.info(f"✅ ACCEPT REQUEST: Mentor {current_user.id} accepting request {request_id}")
+        logger.info("📦 BULK REQUEST: Mentor %s %s %s requests", current_user.id, bulk_data.action, len(bulk_data.ids))
         
         # 멘토만 접근 가능
         if current_user.role != "mentor":
-            logger.warning(f"Non-mentor user {current_user.id} tried to accept match request")
+            logger.warning("Non-mentor user %s tried to bulk update match requests", current_user.id)
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail="Only mentors can accept match requests"
+                detail="Only mentors can accept or reject match requests"
             )
         
-        # 매칭 요청 찾기
-        match_request = get_match_request_by_id(request_id)
-        if not match_request:
-            logger.warning(f"Match request {request_id} not found")
+        if bulk_data.action not in ("accept", "reject"):
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Match request not found"
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="action must be 'accept' or 'reject'"
             )
         
-        # 해당 멘토의 요청인지 확인
-        if match_request.mentorId != current_user.id:
-            logger.warning(f"Mentor {current_user.id} tried to accept request {request_id} for mentor {match_request.mentorId}")
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Can only accept your own match requests"
-            )
+        request_ids = dict.fromkeys(bulk_data.ids)
+        # id마다 저장소를 조회하지 않고 멘토의 요청 목록에서 한 번에 찾음
+        owned = {mr.id: mr for mr in match_request_store.by_mentor(current_user.id) if mr.id in request_ids}
+        
+        results = []
+        succeeded = 0
+        for request_id in request_ids:
+            result = match_transition_engine.apply_to(owned.get(request_id), current_user.id, bulk_data.action)
+            error = transition_error(result, bulk_data.action)
+            if error is None:
+                succeeded += 1
+                results.append({"id": request_id, "status": status.HTTP_200_OK, "matchRequest": match_request_dict(result.match_request)})
+            else:
+                results.append({"id": request_id, "status": error[0], "detail": error[1]})
+        
+        logger.info("📦 BULK RESPONSE: %s of %s requests %s by mentor %s", succeeded, len(results), bulk_data.action, current_user.id)
+        
+        return FastJSONResponse({
+            "action": bulk_data.action,
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+            "results": results
+        })
+        
+    except HTTPException as e:
+        logger.error("❌ BULK REQUEST HTTP ERROR: %s - %s", e.status_code, e.detail)
+        raise
+    except Exception as e:
+        logger.error("💥 BULK REQUEST UNEXPECTED ERROR: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error"
+        )
+
+
+@app.put("/api/match-requests/{request_id}/accept", response_model=MatchRequestResponse)
+async def accept_match_request(
+    request_id: int,
+    current_user: User = Depends(get_current_user)
+):
+    """요청 수락 (멘토 전용)"""
+    try:
+        logger.info("✅ ACCEPT REQUEST: Mentor %s accepting request %s", current_user.id, request_id)
         
-        # 이미 처리된 요청인지 확인
-        if match_request.status != "pending":
-            logger.warning(f"Match request {request_id} already processed: {match_request.status}")
+        # 멘토만 접근 가능
+        if current_user.role != "mentor":
+            logger.warning("Non-mentor user %s tried to accept match request", current_user.id)
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Match request already {match_request.status}"
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only mentors can accept match requests"
             )
         
-        # 요청 수락
-        match_request.status = "accepted"
+        # 요청 수락 (조회/소유자 확인/상태 확인과 변경을 요청 단위로 원자적으로 처리)
+        result = match_transition_engine.apply(request_id, current_user.id, "accept")
+        raise_for_transition(result, request_id, current_user.id, "accept")
+        match_request = result.match_request
         
-        logger.info(f"✅ REQUEST ACCEPTED: Request {request_id} accepted by mentor {current_user.id}")
+        logger.info("✅ REQUEST ACCEPTED: Request %s accepted by mentor %s", request_id, current_user.id)
         
-        response_data = MatchRequestResponse(
-            id=match_request.id,
-            mentorId=match_request.mentorId,
-            menteeId=match_request.menteeId,
-            message=match_request.message,
-            status=match_request.status
-        )
+        response_data = FastJSONResponse(match_request_dict(match_request))
         
         return response_data
         
     except HTTPException as e:
-        logger.error(f"❌ ACCEPT REQUEST HTTP ERROR: {e.status_code} - {e.detail}")
+        logger.error("❌ ACCEPT REQUEST HTTP ERROR: %s - %s", e.status_code, e.detail)
         raise
     except Exception as e:
-        logger.error(f"💥 ACCEPT REQUEST UNEXPECTED ERROR: {str(e)}")
+        logger.error("💥 ACCEPT REQUEST UNEXPECTED ERROR: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error"
@@ -1094,61 +1663,32 @@ async def reject_match_request(
 ):
     """요청 거절 (멘토 전용)"""
     try:
-        logger.info(f"❌ REJECT REQUEST: Mentor {current_user.id} rejecting request {request_id}")
+        logger.info("❌ REJECT REQUEST: Mentor %s rejecting request %s", current_user.id, request_id)
         
         # 멘토만 접근 가능
         if current_user.role != "mentor":
-            logger.warning(f"Non-mentor user {current_user.id} tried to reject match request")
+            logger.warning("Non-mentor user %s tried to reject match request", current_user.id)
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Only mentors can reject match requests"
             )
         
-        # 매칭 요청 찾기
-        match_request = get_match_request_by_id(request_id)
-        if not match_request:
-            logger.warning(f"Match request {request_id} not found")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Match request not found"
-            )
-        
-        # 해당 멘토의 요청인지 확인
-        if match_request.mentorId != current_user.id:
-            logger.warning(f"Mentor {current_user.id} tried to reject request {request_id} for mentor {match_request.mentorId}")
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Can only reject your own match requests"
-            )
+        # 요청 거절 (조회/소유자 확인/상태 확인과 변경을 요청 단위로 원자적으로 처리)
+        result = match_transition_engine.apply(request_id, current_user.id, "reject")
+        raise_for_transition(result, request_id, current_user.id, "reject")
+        match_request = result.match_request
         
-        # 이미 처리된 요청인지 확인
-        if match_request.status != "pending":
-            logger.warning(f"Match request {request_id} already processed: {match_request.status}")
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Match request already {match_request.status}"
-            )
+        logger.info("❌ REQUEST REJECTED: Request %s rejected by mentor %s", request_id, current_user.id)
         
-        # 요청 거절
-        match_request.status = "rejected"
-        
-        logger.info(f"❌ REQUEST REJECTED: Request {request_id} rejected by mentor {current_user.id}")
-        
-        response_data = MatchRequestResponse(
-            id=match_request.id,
-            mentorId=match_request.mentorId,
-            menteeId=match_request.menteeId,
-            message=match_request.message,
-            status=match_request.status
-        )
+        response_data = FastJSONResponse(match_request_dict(match_request))
         
         return response_data
         
     except HTTPException as e:
-        logger.error(f"❌ REJECT REQUEST HTTP ERROR: {e.status_code} - {e.detail}")
+        logger.error("❌ REJECT REQUEST HTTP ERROR: %s - %s", e.status_code, e.detail)
         raise
     except Exception as e:
-        logger.error(f"💥 REJECT REQUEST UNEXPECTED ERROR: {str(e)}")
+        logger.error("💥 REJECT REQUEST UNEXPECTED ERROR: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error"
@@ -1162,61 +1702,32 @@ async def cancel_match_request(
 ):
     """요청 삭제/취소 (멘티 전용)"""
     try:
-        logger.info(f"🗑️ CANCEL REQUEST: Mentee {current_user.id} cancelling request {request_id}")
+        logger.info("🗑️ CANCEL REQUEST: Mentee %s cancelling request %s", current_user.id, request_id)
         
         # 멘티만 접근 가능
         if current_user.role != "mentee":
-            logger.warning(f"Non-mentee user {current_user.id} tried to cancel match request")
+            logger.warning("Non-mentee user %s tried to cancel match request", current_user.id)
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Only mentees can cancel match requests"
             )
         
-        # 매칭 요청 찾기
-        match_request = get_match_request_by_id(request_id)
-        if not match_request:
-            logger.warning(f"Match request {request_id} not found")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Match request not found"
-            )
-        
-        # 해당 멘티의 요청인지 확인
-        if match_request.menteeId != current_user.id:
-            logger.warning(f"Mentee {current_user.id} tried to cancel request {request_id} from mentee {match_request.menteeId}")
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Can only cancel your own match requests"
-            )
-        
-        # 이미 수락된 요청은 취소할 수 없음
-        if match_request.status == "accepted":
-            logger.warning(f"Cannot cancel accepted match request {request_id}")
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Cannot cancel accepted match request"
-            )
-        
-        # 요청 취소
-        match_request.status = "cancelled"
+        # 요청 취소 (조회/소유자 확인/상태 확인과 변경을 요청 단위로 원자적으로 처리)
+        result = match_transition_engine.apply(request_id, current_user.id, "cancel")
+        raise_for_transition(result, request_id, current_user.id, "cancel")
+        match_request = result.match_request
         
-        logger.info(f"🗑️ REQUEST CANCELLED: Request {request_id} cancelled by mentee {current_user.id}")
+        logger.info("🗑️ REQUEST CANCELLED: Request %s cancelled by mentee %s", request_id, current_user.id)
         
-        response_data = MatchRequestResponse(
-            id=match_request.id,
-            mentorId=match_request.mentorId,
-            menteeId=match_request.menteeId,
-            message=match_request.message,
-            status=match_request.status
-        )
+        response_data = FastJSONResponse(match_request_dict(match_request))
         
         return response_data
         
     except HTTPException as e:
-        logger.error(f"❌ CANCEL REQUEST HTTP ERROR: {e.status_code} - {e.detail}")
+        logger.error("❌ CANCEL REQUEST HTTP ERROR: %s - %s", e.status_code, e.detail)
         raise
     except Exception as e:
-        logger.error(f"💥 CANCEL REQUEST UNEXPECTED ERROR: {str(e)}")
+        logger.error("💥 CANCEL REQUEST UNEXPECTED ERROR: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error"
@@ -1230,12 +1741,11 @@ async def create_test_match_requests():
         logger.info("🔧 Creating test match requests...")
         
         # 기존 매칭 요청 데이터 삭제
-        global match_requests_db
-        match_requests_db.clear()
+        match_request_store.clear()
         
         # 멘토와 멘티 ID 찾기
-        mentors = [user for user in users_db if user.role == "mentor"]
-        mentees = [user for user in users_db if user.role == "mentee"]
+        mentors = get_users_by_role("mentor")
+        mentees = get_users_by_role("mentee")
         
         if len(mentors) == 0 or len(mentees) == 0:
             raise HTTPException(
@@ -1326,7 +1836,6 @@ async def create_test_match_requests():
         ]
         
         # 매칭 요청 생성
-        request_id = 1
         for i, mentee in enumerate(mentees):
             for j, mentor in enumerate(mentors[:3]):  # 각 멘티당 최대 3개 멘토에게 요청
                 if i < len(test_messages):
@@ -1334,17 +1843,13 @@ async def create_test_match_requests():
                 else:
                     message_data = test_messages[0]  # 기본 메시지 사용
                 
-                match_request = MatchRequest(
-                    id=request_id,
-                    mentorId=mentor.id,
-                    menteeId=mentee.id,
-                    message=message_data["message"],
-                    status=message_data["status"]
+                match_request = create_match_request(
+                    mentor.id,
+                    mentee.id,
+                    message_data["message"],
+                    request_status=message_data["status"]
                 )
-                
-                match_requests_db.append(match_request)
-                logger.info(f"Created match request {request_id}: mentee {mentee.profile.name} -> mentor {mentor.profile.name} ({message_data['status']})")
-                request_id += 1
+                logger.info("Created match request %s: mentee %s -> mentor %s (%s)", match_request.id, mentee.profile.name, mentor.profile.name, message_data['status'])
                 
                 # 다양한 상태의 요청을 위해 순환
                 if j == 1:  # 두 번째 멘토에게는 accepted 상태로
@@ -1354,24 +1859,24 @@ async def create_test_match_requests():
                     if len(test_messages) > 2:
                         message_data = test_messages[2]
         
-        created_count = len(match_requests_db)
-        logger.info(f"✅ Test match requests created successfully. Total: {created_count}")
+        created_count = len(match_request_store)
+        logger.info("✅ Test match requests created successfully. Total: %s", created_count)
         
         return {
             "message": f"Successfully created {created_count} test match requests",
             "total_requests": created_count,
             "by_status": {
-                "pending": len([req for req in match_requests_db if req.status == "pending"]),
-                "accepted": len([req for req in match_requests_db if req.status == "accepted"]),
-                "rejected": len([req for req in match_requests_db if req.status == "rejected"])
+                "pending": match_request_store.count_by_status("pending"),
+                "accepted": match_request_store.count_by_status("accepted"),
+                "rejected": match_request_store.count_by_status("rejected")
             }
         }
         
     except HTTPException as e:
-        logger.error(f"❌ CREATE TEST MATCH REQUESTS HTTP ERROR: {e.status_code} - {e.detail}")
+        logger.error("❌ CREATE TEST MATCH REQUESTS HTTP ERROR: %s - %s", e.status_code, e.detail)
         raise
     except Exception as e:
-        logger.error(f"💥 CREATE TEST MATCH REQUESTS UNEXPECTED ERROR: {str(e)}")
+        logger.error("💥 CREATE TEST MATCH REQUESTS UNEXPECTED ERROR: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error"
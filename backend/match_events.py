@@ -0,0 +1,113 @@
+"""
+매칭 요청 변경 이벤트 (in-process pub/sub)
+매칭 요청이 생성/수락/거절/취소되면 관련 멘토/멘티의 SSE 연결로 이벤트를 보냅니다.
+
+- 연결마다 크기가 정해진 큐를 사용하며, 클라이언트가 따라오지 못해 큐가 가득 차면
+  쌓인 이벤트를 버리고 "resync" 이벤트 하나만 남깁니다. (클라이언트는 목록을 다시 조회)
+- 한 프로세스 안에서만 전달되므로 워커가 여러 개면 같은 워커에 연결된 클라이언트만 받습니다.
+"""
+
+import asyncio
+import itertools
+import threading
+from typing import Dict, Optional, Set
+
+# SSE 이벤트 이름
+RESYNC_EVENT = "resync"
+
+
+def format_sse(event: str, data: bytes, event_id: Optional[int] = None) -> bytes:
+    """SSE 메시지 한 개 (data는 한 줄짜리 JSON bytes)"""
+    head = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{head}event: {event}\n".encode("utf-8") + b"data: " + data + b"\n\n"
+
+
+# 연결 유지용 주석 줄 (클라이언트는 무시함)
+HEARTBEAT = b": keepalive\n\n"
+
+
+class Subscription:
+    """SSE 연결 한 개의 이벤트 큐"""
+
+    def __init__(self, user_id: int, max_queue: int):
+        self.user_id = user_id
+        self.loop = asyncio.get_running_loop()
+        self.queue: "asyncio.Queue[bytes]" = asyncio.Queue(maxsize=max_queue)
+        self.dropped = 0
+
+    def push(self, message: bytes) -> None:
+        """이벤트 추가 (이벤트 루프 스레드에서 호출)"""
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # 밀린 이벤트는 버리고 전체 목록을 다시 받도록 알림
+            while not self.queue.empty():
+                self.queue.get_nowait()
+                self.dropped += 1
+            self.queue.put_nowait(format_sse(RESYNC_EVENT, b"{}"))
+
+    async def get(self, timeout: float) -> Optional[bytes]:
+        """다음 이벤트 (timeout 동안 없으면 None)"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class MatchEventBroker:
+    """사용자 id별 구독자 목록을 관리하고 이벤트를 전달"""
+
+    def __init__(self, max_queue: int = 100):
+        self._max_queue = max_queue
+        self._subscriptions: Dict[int, Set[Subscription]] = {}
+        # 발행은 핸들러 스레드에서도 호출될 수 있으므로 구독자 목록은 락으로 보호
+        self._lock = threading.Lock()
+        self._event_ids = itertools.count(1)
+        self._published = 0
+
+    def subscribe(self, user_id: int) -> Subscription:
+        """이벤트 루프 안에서 호출"""
+        subscription = Subscription(user_id, self._max_queue)
+        with self._lock:
+            self._subscriptions.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.user_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.user_id]
+
+    def has_subscribers(self, user_id: int) -> bool:
+        return user_id in self._subscriptions
+
+    def publish(self, user_id: int, event: str, data: bytes) -> None:
+        """user_id의 모든 연결로 이벤트 전달 (구독자가 없으면 아무 일도 하지 않음)"""
+        with self._lock:
+            subscriptions = tuple(self._subscriptions.get(user_id, ()))
+            if not subscriptions:
+                return
+            event_id = next(self._event_ids)
+            self._published += 1
+        message = format_sse(event, data, event_id)
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        for subscription in subscriptions:
+            if subscription.loop is running_loop:
+                subscription.push(message)
+            else:
+                subscription.loop.call_soon_threadsafe(subscription.push, message)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            subscriptions = [s for group in self._subscriptions.values() for s in group]
+            return {
+                "users": len(self._subscriptions),
+                "connections": len(subscriptions),
+                "published": self._published,
+                "dropped": sum(s.dropped for s in subscriptions)
+            }
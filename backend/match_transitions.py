@@ -0,0 +1,128 @@
+"""
+매칭 요청 상태 전이
+수락/거절/취소의 조회 → 소유자 확인 → 상태 확인 → 변경을 한 곳에서 처리합니다.
+
+상태 확인과 변경은 요청 id별 락(고정 개수의 락을 id로 나눠 씀) 안에서 한 번에 일어나므로,
+같은 요청에 수락과 취소가 동시에 들어와도 둘 중 하나만 성공합니다.
+백엔드 저장도 같은 락 안에서 하므로 같은 요청의 저장 순서가 뒤바뀌지 않습니다.
+
+멘토는 한 명의 멘티만 수락할 수 있습니다. 수락은 멘토 id의 락도 함께 잡고
+저장소의 멘토별 수락 인덱스를 확인하므로, 같은 멘토의 요청 여러 개를 동시에 수락해도 하나만 성공합니다.
+
+락은 프로세스 안에서만 유효합니다. (워커마다 인메모리 저장소를 따로 가짐)
+"""
+
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+# 전이 결과
+OK = "ok"
+NOT_FOUND = "not_found"
+# 요청의 멘토/멘티가 아님
+FORBIDDEN = "forbidden"
+# 현재 상태에서 할 수 없는 전이
+INVALID_STATE = "invalid_state"
+# 멘토가 이미 다른 요청을 수락함 (수락만 해당)
+MENTOR_ALREADY_MATCHED = "mentor_already_matched"
+
+# 동작 → (요청에서 행위자 id 필드, 전이 가능한 현재 상태, 바뀔 상태)
+# 취소는 기존 동작대로 수락된 요청만 막음 (거절된 요청 취소, 취소된 요청 재취소는 허용)
+TRANSITIONS: Dict[str, Tuple[str, Tuple[str, ...], str]] = {
+    "accept": ("mentorId", ("pending",), "accepted"),
+    "reject": ("mentorId", ("pending",), "rejected"),
+    "cancel": ("menteeId", ("pending", "rejected", "cancelled"), "cancelled"),
+}
+
+
+class TransitionResult:
+    """전이 결과 (outcome이 OK가 아니면 match_request는 변경되지 않음)"""
+
+    __slots__ = ("outcome", "match_request", "previous_status")
+
+    def __init__(self, outcome: str, match_request=None, previous_status: Optional[str] = None):
+        self.outcome = outcome
+        self.match_request = match_request
+        # 전이를 시도한 시점의 상태 (NOT_FOUND면 None)
+        self.previous_status = previous_status
+
+    @property
+    def ok(self) -> bool:
+        return self.outcome == OK
+
+    def __repr__(self) -> str:
+        return f"TransitionResult(outcome={self.outcome!r}, previous_status={self.previous_status!r})"
+
+
+class MatchTransitionEngine:
+    """매칭 요청 상태 전이 (요청 id별 락으로 확인-변경을 원자적으로 처리)"""
+
+    def __init__(
+        self,
+        store,
+        on_transition: Optional[Callable[[object, str], None]] = None,
+        lock_stripes: int = 64
+    ):
+        self._store = store
+        # 전이 성공 후 호출 (match_request, 바뀐 상태) - 락 밖에서 호출됨
+        self._on_transition = on_transition
+        # 요청마다 락을 만들지 않고 id % 개수로 나눠 씀
+        self._locks = tuple(threading.Lock() for _ in range(lock_stripes))
+        self._counts_lock = threading.Lock()
+        self._counts: Dict[str, int] = {OK: 0, NOT_FOUND: 0, FORBIDDEN: 0, INVALID_STATE: 0, MENTOR_ALREADY_MATCHED: 0}
+
+    def apply(self, request_id: int, actor_id: int, action: str) -> TransitionResult:
+        """actor_id 사용자가 request_id 요청에 action(accept/reject/cancel) 적용"""
+        return self.apply_to(self._store.get(request_id), actor_id, action)
+
+    def apply_to(self, match_request, actor_id: int, action: str) -> TransitionResult:
+        """이미 조회한 요청에 action 적용 (None이면 NOT_FOUND)"""
+        owner_field, allowed, new_status = TRANSITIONS[action]
+        if match_request is None:
+            return self._count(TransitionResult(NOT_FOUND))
+        # 멘토/멘티 id는 바뀌지 않으므로 락 없이 확인
+        if getattr(match_request, owner_field) != actor_id:
+            return self._count(TransitionResult(FORBIDDEN, match_request, match_request.status))
+
+        # 락 없이 먼저 확인 - 전이할 수 없는 상태는 다시 가능한 상태로 돌아가지 않으므로
+        # (대기 중으로 돌아가는 전이, 수락된 요청의 전이가 없음) 경합에서 진 요청은 락을 잡지 않고 실패
+        if match_request.status not in allowed:
+            return self._count(TransitionResult(INVALID_STATE, match_request, match_request.status))
+        # 수락된 요청은 다른 상태로 바뀌지 않으므로 이미 수락한 멘토도 락 없이 먼저 거름
+        accept = new_status == "accepted"
+        if accept and self._store.has_accepted(match_request.mentorId):
+            return self._count(TransitionResult(MENTOR_ALREADY_MATCHED, match_request, match_request.status))
+
+        locks = self._locks_for(match_request.id, match_request.mentorId if accept else None)
+        for lock in locks:
+            lock.acquire()
+        try:
+            previous_status = match_request.status
+            if previous_status not in allowed:
+                return self._count(TransitionResult(INVALID_STATE, match_request, previous_status))
+            if accept and self._store.has_accepted(match_request.mentorId):
+                return self._count(TransitionResult(MENTOR_ALREADY_MATCHED, match_request, previous_status))
+            self._store.set_status(match_request, new_status)
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+        # 이미 같은 상태였으면 (취소된 요청 재취소) 바뀐 게 없으므로 알리지 않음
+        if self._on_transition is not None and previous_status != new_status:
+            self._on_transition(match_request, new_status)
+        return self._count(TransitionResult(OK, match_request, previous_status))
+
+    def _locks_for(self, request_id: int, mentor_id: Optional[int]) -> Tuple[threading.Lock, ...]:
+        """요청 id (+ 멘토 id) 락 - 교착을 피하도록 항상 번호 순서로 잡음"""
+        stripes = {request_id % len(self._locks)}
+        if mentor_id is not None:
+            stripes.add(mentor_id % len(self._locks))
+        return tuple(self._locks[stripe] for stripe in sorted(stripes))
+
+    def stats(self) -> Dict:
+        with self._counts_lock:
+            return {"lock_stripes": len(self._locks), **self._counts}
+
+    def _count(self, result: TransitionResult) -> TransitionResult:
+        with self._counts_lock:
+            self._counts[result.outcome] += 1
+        return result
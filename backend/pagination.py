@@ -0,0 +1,61 @@
+"""
+커서(keyset) 페이지네이션
+커서는 마지막으로 반환한 항목의 정렬 키를 base64url(JSON)로 인코딩한 불투명 문자열입니다.
+다음 페이지는 정렬된 인덱스에서 그 키 바로 다음 위치부터 읽으므로 페이지 깊이와 관계없이 비용이 같습니다.
+"""
+
+import base64
+import binascii
+import json
+from typing import Tuple
+
+# 다음 페이지 커서를 담는 응답 헤더
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# 변경분 동기화(since 파라미터) 응답 헤더
+# - 다음 요청에 since로 보낼 동기화 토큰 ("<epoch>.<변경 버전>")
+SYNC_VERSION_HEADER = "X-Sync-Version"
+# - "true"면 변경분이 아니라 전체 목록 (클라이언트는 기존 목록을 버리고 교체)
+SYNC_RESET_HEADER = "X-Sync-Reset"
+
+
+def encode_cursor(ordering: str, key: Tuple) -> str:
+    """정렬 순서 + 정렬 키 → 커서 문자열"""
+    payload = json.dumps({"o": ordering, "k": key}, ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, ordering: str) -> Tuple:
+    """커서 문자열 → 정렬 키 (형식이 잘못됐거나 다른 정렬 순서의 커서면 ValueError)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    except (binascii.Error, UnicodeError, json.JSONDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    if not isinstance(payload, dict) or payload.get("o") != ordering or not isinstance(payload.get("k"), list):
+        raise ValueError("Invalid cursor")
+    return _to_tuple(payload["k"])
+
+
+def encode_sync_token(epoch: str, version: int) -> str:
+    """저장소 epoch + 변경 버전 → 동기화 토큰"""
+    return f"{epoch}.{version}"
+
+
+def decode_sync_token(token: str) -> Tuple[str, int]:
+    """동기화 토큰 → (epoch, 변경 버전) (형식이 잘못됐으면 ValueError)
+
+    epoch 없이 버전만 있는 값("10")은 epoch가 ""인 토큰으로 읽으므로 항상 전체 목록이 됩니다.
+    """
+    epoch, _, version = token.rpartition(".")
+    if not version.isdigit():
+        raise ValueError("Invalid sync token")
+    return epoch, int(version)
+
+
+def _to_tuple(value):
+    # JSON에서는 튜플이 리스트가 되므로 정렬 키 비교가 가능하도록 다시 튜플로 변환
+    if isinstance(value, list):
+        return tuple(_to_tuple(item) for item in value)
+    return value
@@ -0,0 +1,110 @@
+"""
+비밀번호 해싱 워커 풀
+bcrypt 해싱/검증은 요청당 수십 ms가 걸리므로 이벤트 루프에서 직접 실행하지 않고
+크기가 제한된 전용 스레드 풀에서 실행합니다. (bcrypt는 실행 중 GIL을 해제함)
+
+대기 작업 수가 한도를 넘으면 PasswordPoolBusyError를 발생시켜서
+로그인 폭주 시에도 대기열이 끝없이 늘어나지 않도록 합니다.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+
+class PasswordPoolBusyError(Exception):
+    """대기 작업 수가 한도를 넘어서 작업을 받을 수 없음"""
+
+
+class PasswordPool:
+    """bcrypt 작업 전용 스레드 풀 (대기열 길이 제한 + 대기 시간 통계)"""
+
+    def __init__(self, pwd_context, max_workers: int = 4, max_pending: int = 64):
+        self._pwd_context = pwd_context
+        self._max_workers = max_workers
+        self._max_pending = max_pending
+        # 스레드 풀은 첫 작업 시 생성 (shutdown 후 재시작도 지원)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # 통계 - in_flight는 실행기에 제출되어 아직 끝나지 않은 작업 수
+        # (완료 콜백이 워커 스레드에서 호출되므로 락으로 보호)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._started = 0
+        self._completed = 0
+        self._failed = 0
+        self._cancelled = 0
+        self._rejected = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(self._pwd_context.hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._submit(self._pwd_context.verify, plain_password, hashed_password)
+
+    async def _submit(self, func: Callable, *args):
+        with self._lock:
+            if self._in_flight >= self._max_workers + self._max_pending:
+                self._rejected += 1
+                raise PasswordPoolBusyError("Password worker pool is saturated")
+            self._in_flight += 1
+
+        submitted_at = time.perf_counter()
+
+        def run():
+            # 풀에서 실제로 실행되기까지 기다린 시간
+            wait = time.perf_counter() - submitted_at
+            with self._lock:
+                self._started += 1
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+            return func(*args)
+
+        try:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="bcrypt")
+            future = self._executor.submit(run)
+        except BaseException:
+            with self._lock:
+                self._in_flight -= 1
+            raise
+        # 요청이 취소(클라이언트 연결 끊김 등)되어도 작업이 실행기에서 끝날 때까지 in_flight에 남도록
+        # 카운터는 await가 아니라 실행기 future의 완료 콜백에서 줄임
+        # (아직 시작 전인 작업은 wrap_future가 취소를 전달해서 바로 빠짐)
+        future.add_done_callback(self._on_done)
+        return await asyncio.wrap_future(future)
+
+    def _on_done(self, future: Future) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if future.cancelled():
+                self._cancelled += 1
+            elif future.exception() is not None:
+                self._failed += 1
+            else:
+                self._completed += 1
+
+    def stats(self) -> Dict:
+        """대기열 길이 / 대기 시간 통계"""
+        with self._lock:
+            return {
+                "workers": self._max_workers,
+                "max_pending": self._max_pending,
+                "in_flight": self._in_flight,
+                "queue_depth": max(0, self._in_flight - self._max_workers),
+                "completed": self._completed,
+                "failed": self._failed,
+                "cancelled": self._cancelled,
+                "rejected": self._rejected,
+                "avg_wait_ms": round(self._total_wait / self._started * 1000, 3) if self._started else 0.0,
+                "max_wait_ms": round(self._max_wait * 1000, 3)
+            }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
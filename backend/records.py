@@ -0,0 +1,88 @@
+"""
+인메모리 도메인 레코드
+서버가 살아 있는 동안 메모리에 보관하는 사용자 / 매칭 요청은 pydantic 모델 대신
+__slots__ 클래스로 보관합니다. (인스턴스별 __dict__와 검증 정보가 없음)
+
+pydantic 모델은 API 경계(요청 본문 검증, OpenAPI 스키마)에서만 사용합니다.
+"""
+
+import sys
+from typing import Dict, List, Optional
+
+
+class UserProfile:
+    """사용자 프로필 (skills는 멘토만 사용, 멘티는 None)"""
+
+    __slots__ = ("name", "bio", "imageUrl", "skills")
+
+    def __init__(
+        self,
+        name: str,
+        bio: Optional[str] = "",
+        imageUrl: Optional[str] = None,
+        skills: Optional[List[str]] = None
+    ):
+        self.name = name
+        self.bio = bio
+        self.imageUrl = imageUrl
+        self.skills = skills
+
+    def __repr__(self) -> str:
+        return f"UserProfile(name={self.name!r}, bio={self.bio!r}, imageUrl={self.imageUrl!r}, skills={self.skills!r})"
+
+
+class User:
+    """사용자 레코드 (id는 저장소에 추가할 때 발급되므로 그 전에는 None)"""
+
+    __slots__ = ("id", "email", "role", "profile", "hashed_password")
+
+    def __init__(self, id: Optional[int], email: str, role: str, profile: UserProfile, hashed_password: str):
+        self.id = id
+        self.email = email
+        # 역할 문자열은 몇 가지 값뿐이므로 intern해서 레코드끼리 공유
+        self.role = sys.intern(role)
+        self.profile = profile
+        self.hashed_password = hashed_password
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "User":
+        """저장소 백엔드의 행(dict, profile은 중첩 dict) → User"""
+        return cls(
+            id=data["id"],
+            email=data["email"],
+            role=data["role"],
+            profile=UserProfile(**data["profile"]),
+            hashed_password=data["hashed_password"]
+        )
+
+    def __repr__(self) -> str:
+        return f"User(id={self.id!r}, email={self.email!r}, role={self.role!r}, profile={self.profile!r})"
+
+
+class MatchRequest:
+    """매칭 요청 레코드 (status: pending / accepted / rejected / cancelled)
+
+    version은 마지막으로 추가/상태 변경될 때 저장소가 매긴 변경 버전입니다. (0이면 아직 저장 전)
+    id도 저장소에 추가할 때 발급되므로 그 전에는 None입니다.
+    """
+
+    __slots__ = ("id", "mentorId", "menteeId", "message", "status", "version")
+
+    def __init__(self, id: Optional[int], mentorId: int, menteeId: int, message: str, status: str, version: int = 0):
+        self.id = id
+        self.mentorId = mentorId
+        self.menteeId = menteeId
+        self.message = message
+        # 상태 문자열은 몇 가지 값뿐이므로 intern해서 레코드끼리 공유 (DB에서 읽은 값도 같은 객체 사용)
+        self.status = sys.intern(status)
+        self.version = version
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "MatchRequest":
+        return cls(**data)
+
+    def __repr__(self) -> str:
+        return (
+            f"MatchRequest(id={self.id!r}, mentorId={self.mentorId!r}, menteeId={self.menteeId!r}, "
+            f"message={self.message!r}, status={self.status!r}, version={self.version!r})"
+        )
@@ -0,0 +1,62 @@
+"""
+직렬화된 응답 캐시
+자주 바뀌지 않는 목록 응답을 JSON 바이트로 보관해서 매 요청마다
+pydantic 모델 생성/검증/직렬화를 반복하지 않도록 합니다.
+
+데이터가 바뀌면 bump()로 버전을 올리고, 이전 버전으로 만든 항목은 조회 시 버려집니다.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+
+class VersionedResponseCache:
+    """버전 카운터로 무효화되는 LRU 응답 캐시 (key → JSON bytes)"""
+
+    def __init__(self, max_entries: int = 256):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[int, bytes]]" = OrderedDict()
+        self._version = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def bump(self) -> None:
+        """원본 데이터 변경 시 호출 - 기존 항목을 모두 무효화"""
+        with self._lock:
+            self._version += 1
+            self._entries.clear()
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != self._version:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, body: bytes, version: int) -> None:
+        """version: 응답을 만들기 시작할 때의 버전 (그 사이 데이터가 바뀌었으면 저장하지 않음)"""
+        with self._lock:
+            if version != self._version:
+                return
+            self._entries[key] = (version, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "version": self._version,
+                "size": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses
+            }
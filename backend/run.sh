@@ -38,5 +38,9 @@ echo ""
 echo "Press Ctrl+C to stop the server"
 echo "=================================="
 
+# 저장소 설정 (sqlite: 재시작/--reload 후에도 데이터 유지)
+export STORAGE_BACKEND="${STORAGE_BACKEND:-sqlite}"
+export SQLITE_PATH="${SQLITE_PATH:-data/mentor_mentee.db}"
+
 # uvicorn으로 서버 실행 (8080포트, 개발 모드)
 uvicorn main:app --host 0.0.0.0 --port 8080 --reload
@@ -0,0 +1,30 @@
+"""
+테스트 데이터(seed) 로더
+seed_data.json에서 테스트 사용자를 읽어옵니다.
+
+픽스처에는 미리 계산한 bcrypt 해시(hashed_password)를 넣어 두어서 서버 시작 시
+해싱을 하지 않습니다. 해시 없이 password만 있는 항목은 스레드 풀에서 병렬로 해싱합니다.
+(테스트 계정 비밀번호: password123)
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+
+
+def load_seed_users(path: str) -> List[Dict]:
+    """픽스처 파일에서 사용자 목록 읽기"""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return data.get("users", [])
+
+
+def ensure_password_hashes(users: List[Dict], hash_func: Callable[[str], str], max_workers: int = 4) -> List[Dict]:
+    """hashed_password가 없는 항목만 병렬로 해싱 (bcrypt는 GIL을 해제함)"""
+    missing = [user for user in users if not user.get("hashed_password")]
+    if missing:
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="seed-hash") as executor:
+            hashes = executor.map(lambda user: hash_func(user["password"]), missing)
+            for user, hashed_password in zip(missing, hashes):
+                user["hashed_password"] = hashed_password
+    return users
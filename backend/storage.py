@@ -0,0 +1,277 @@
+"""
+영속 저장소 백엔드
+인메모리 저장소(store.py)의 변경 내용을 기록하고, 서버 재시작 시 다시 불러옵니다.
+
+- MemoryBackend: 아무것도 저장하지 않음 (기존 동작, 재시작 시 데이터 초기화)
+- SQLiteBackend: SQLite(WAL 모드) 파일에 write-through로 저장
+
+새 사용자/매칭 요청의 id는 백엔드가 발급합니다. (insert_* 반환값, None이면 저장소가 메모리에서 발급)
+SQLite는 INTEGER PRIMARY KEY로 DB가 id를 정하므로 같은 파일을 쓰는 워커가 여러 개여도 id가 겹치지 않습니다.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Dict, List, Optional
+
+from store import DuplicateEmailError, normalize_email
+
+
+class MemoryBackend:
+    """저장하지 않는 백엔드 (인메모리 전용)"""
+
+    def load_users(self) -> List[Dict]:
+        return []
+
+    def load_match_requests(self) -> List[Dict]:
+        return []
+
+    def insert_user(self, user) -> Optional[int]:
+        return None
+
+    def save_user(self, user) -> None:
+        pass
+
+    def delete_user(self, user_id: int) -> None:
+        pass
+
+    def clear_users(self) -> None:
+        pass
+
+    def insert_match_request(self, match_request) -> Optional[int]:
+        return None
+
+    def save_match_request(self, match_request) -> None:
+        pass
+
+    def clear_match_requests(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class SQLiteBackend:
+    """SQLite 영속 저장소
+
+    하나의 커넥션을 재사용하고 SQL 문자열을 고정해 두어서 sqlite3 모듈의
+    statement 캐시(prepared statement)가 요청 간에 재사용되도록 합니다.
+
+    추가는 id 없이 INSERT해서 DB가 id를 발급하고 (lastrowid), 변경만 id 기준 upsert로 저장합니다.
+    쓰기는 호출한 스레드(핸들러에서는 이벤트 루프)에서 바로 실행됩니다. 한 건씩 autocommit하고
+    WAL + synchronous=NORMAL이라 커밋마다 fsync하지 않으므로 보통 수십 µs 수준이지만,
+    다른 프로세스가 쓰기 락을 잡고 있으면 busy_timeout(5초)까지 루프가 멈출 수 있습니다.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY,
+        email TEXT NOT NULL,
+        email_normalized TEXT NOT NULL,
+        role TEXT NOT NULL,
+        name TEXT NOT NULL,
+        bio TEXT,
+        image_url TEXT,
+        skills TEXT,
+        hashed_password TEXT NOT NULL
+    );
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_users_email ON users (email_normalized);
+    CREATE INDEX IF NOT EXISTS idx_users_role ON users (role);
+
+    CREATE TABLE IF NOT EXISTS match_requests (
+        id INTEGER PRIMARY KEY,
+        mentor_id INTEGER NOT NULL,
+        mentee_id INTEGER NOT NULL,
+        message TEXT NOT NULL,
+        status TEXT NOT NULL,
+        version INTEGER NOT NULL DEFAULT 0
+    );
+    CREATE INDEX IF NOT EXISTS idx_match_requests_mentor ON match_requests (mentor_id);
+    CREATE INDEX IF NOT EXISTS idx_match_requests_mentee ON match_requests (mentee_id);
+    CREATE INDEX IF NOT EXISTS idx_match_requests_status ON match_requests (status);
+    """
+
+    INSERT_USER = """
+    INSERT INTO users (email, email_normalized, role, name, bio, image_url, skills, hashed_password)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    UPSERT_USER = """
+    INSERT INTO users (id, email, email_normalized, role, name, bio, image_url, skills, hashed_password)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (id) DO UPDATE SET
+        email = excluded.email,
+        email_normalized = excluded.email_normalized,
+        role = excluded.role,
+        name = excluded.name,
+        bio = excluded.bio,
+        image_url = excluded.image_url,
+        skills = excluded.skills,
+        hashed_password = excluded.hashed_password
+    """
+
+    INSERT_MATCH_REQUEST = """
+    INSERT INTO match_requests (mentor_id, mentee_id, message, status, version)
+    VALUES (?, ?, ?, ?, ?)
+    """
+
+    UPSERT_MATCH_REQUEST = """
+    INSERT INTO match_requests (id, mentor_id, mentee_id, message, status, version)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT (id) DO UPDATE SET status = excluded.status, version = excluded.version
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        with self._lock:
+            self._connection()
+
+    def _connection(self) -> sqlite3.Connection:
+        """커넥션 반환 (close() 이후에는 다시 연결) - 락을 잡은 상태에서 호출"""
+        if self._conn is not None:
+            return self._conn
+
+        directory = os.path.dirname(self._path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # isolation_level=None: 각 쓰기를 바로 커밋 (autocommit)
+        conn = sqlite3.connect(
+            self._path,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=256
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        # WAL 모드에서는 NORMAL로도 크래시 시 DB가 손상되지 않음
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.executescript(self.SCHEMA)
+        self._migrate(conn)
+        self._conn = conn
+        return conn
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection) -> None:
+        """이전 버전에서 만든 DB 파일에 없는 컬럼 추가"""
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(match_requests)")}
+        if "version" not in columns:
+            conn.execute("ALTER TABLE match_requests ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+
+    def load_users(self) -> List[Dict]:
+        with self._lock:
+            rows = self._connection().execute("SELECT * FROM users ORDER BY id").fetchall()
+        return [
+            {
+                "id": row["id"],
+                "email": row["email"],
+                "role": row["role"],
+                "profile": {
+                    "name": row["name"],
+                    "bio": row["bio"],
+                    "imageUrl": row["image_url"],
+                    "skills": json.loads(row["skills"]) if row["skills"] is not None else None
+                },
+                "hashed_password": row["hashed_password"]
+            }
+            for row in rows
+        ]
+
+    def load_match_requests(self) -> List[Dict]:
+        with self._lock:
+            rows = self._connection().execute("SELECT * FROM match_requests ORDER BY id").fetchall()
+        return [
+            {
+                "id": row["id"],
+                "mentorId": row["mentor_id"],
+                "menteeId": row["mentee_id"],
+                "message": row["message"],
+                "status": row["status"],
+                "version": row["version"]
+            }
+            for row in rows
+        ]
+
+    @staticmethod
+    def _user_params(user) -> tuple:
+        skills = user.profile.skills
+        return (
+            user.email,
+            normalize_email(user.email),
+            user.role,
+            user.profile.name,
+            user.profile.bio,
+            user.profile.imageUrl,
+            json.dumps(skills, ensure_ascii=False) if skills is not None else None,
+            user.hashed_password
+        )
+
+    def insert_user(self, user) -> int:
+        """새 사용자 저장 후 DB가 발급한 id 반환 (이메일 중복이면 DuplicateEmailError)"""
+        return self._execute_user(self.INSERT_USER, self._user_params(user)).lastrowid
+
+    def save_user(self, user) -> None:
+        self._execute_user(self.UPSERT_USER, (user.id,) + self._user_params(user))
+
+    def _execute_user(self, sql: str, params: tuple) -> sqlite3.Cursor:
+        # 다른 워커가 같은 이메일로 먼저 가입한 경우 unique 인덱스 위반
+        try:
+            with self._lock:
+                return self._connection().execute(sql, params)
+        except sqlite3.IntegrityError as e:
+            raise DuplicateEmailError() from e
+
+    def delete_user(self, user_id: int) -> None:
+        with self._lock:
+            self._connection().execute("DELETE FROM users WHERE id = ?", (user_id,))
+
+    def clear_users(self) -> None:
+        with self._lock:
+            self._connection().execute("DELETE FROM users")
+
+    def insert_match_request(self, match_request) -> int:
+        """새 매칭 요청 저장 후 DB가 발급한 id 반환"""
+        params = (
+            match_request.mentorId,
+            match_request.menteeId,
+            match_request.message,
+            match_request.status,
+            match_request.version
+        )
+        with self._lock:
+            return self._connection().execute(self.INSERT_MATCH_REQUEST, params).lastrowid
+
+    def save_match_request(self, match_request) -> None:
+        params = (
+            match_request.id,
+            match_request.mentorId,
+            match_request.menteeId,
+            match_request.message,
+            match_request.status,
+            match_request.version
+        )
+        with self._lock:
+            self._connection().execute(self.UPSERT_MATCH_REQUEST, params)
+
+    def clear_match_requests(self) -> None:
+        with self._lock:
+            self._connection().execute("DELETE FROM match_requests")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def create_storage_backend(kind: str, sqlite_path: str):
+    """설정값에 맞는 저장소 백엔드 생성 ("memory" 또는 "sqlite")"""
+    if kind == "sqlite":
+        return SQLiteBackend(sqlite_path)
+    if kind == "memory":
+        return MemoryBackend()
+    raise ValueError(f"Unknown storage backend: {kind}")
@@ -0,0 +1,533 @@
+"""
+인메모리 저장소
+사용자와 매칭 요청 조회를 인덱스로 처리해서 전체 목록을 순회하지 않도록 합니다.
+변경 내용은 영속 저장소 백엔드(storage.py)로 write-through 됩니다.
+"""
+
+import secrets
+import threading
+from bisect import bisect_left, bisect_right, insort
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+
+def normalize_email(email: str) -> str:
+    """이메일 비교용 정규화 (앞뒤 공백 제거 + 소문자)"""
+    return (email or "").strip().lower()
+
+
+def normalize_skill(skill: str) -> str:
+    """스킬 비교용 정규화 (앞뒤 공백 제거 + 소문자)"""
+    return (skill or "").strip().lower()
+
+
+def _page(entries: List, after=None, limit: Optional[int] = None) -> List:
+    """정렬된 리스트에서 after 다음 원소부터 limit개 (bisect로 시작 위치를 찾으므로 깊은 페이지도 비용이 같음)"""
+    start = bisect_right(entries, after) if after is not None else 0
+    end = start + limit if limit is not None else len(entries)
+    return entries[start:end]
+
+
+class DuplicateEmailError(Exception):
+    """같은 이메일의 사용자가 이미 저장되어 있음 (다른 워커가 먼저 저장한 경우 등)"""
+
+
+class UserStore:
+    """id / 이메일 / 역할 / 스킬 인덱스와 멘토 정렬 순서를 가진 사용자 저장소"""
+
+    # 미리 정렬해 두는 멘토 목록 순서 (order_by 값)
+    MENTOR_ORDERINGS = ("id", "name", "skill")
+
+    def __init__(self, backend=None):
+        # 영속 저장소 백엔드 (None이면 메모리에만 보관)
+        self._backend = backend
+        self._by_id: Dict[int, object] = {}
+        self._id_by_email: Dict[str, int] = {}
+        # 역할별 id 집합 (dict를 삽입 순서가 유지되는 set으로 사용)
+        self._ids_by_role: Dict[str, Dict[int, None]] = {}
+        # 사용자별로 등록된 인덱스 키 (email, role) - 변경 시 이전 키 제거용
+        self._index_keys: Dict[int, Tuple[str, str]] = {}
+        # 스킬 역색인: 정규화된 스킬 → 멘토 id 집합
+        self._mentor_ids_by_skill: Dict[str, Set[int]] = {}
+        self._skill_keys: Dict[int, FrozenSet[str]] = {}
+        # 정렬 순서별 (정렬 키..., id) 리스트 - bisect로 삽입/재배치
+        self._mentor_orderings: Dict[str, List[Tuple]] = {order: [] for order in self.MENTOR_ORDERINGS}
+        self._mentor_sort_keys: Dict[int, Dict[str, Tuple]] = {}
+        # 사용자 변경 알림 콜백 (user_id, 전체 삭제 시 None)
+        self._listeners: List[Callable[[Optional[int]], None]] = []
+        self._next_id = 1
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def add_listener(self, callback: Callable[[Optional[int]], None]) -> None:
+        """사용자 추가/변경/삭제 시 호출될 콜백 등록 (캐시 무효화용)"""
+        self._listeners.append(callback)
+
+    def _allocate_id(self) -> int:
+        """백엔드가 id를 발급하지 않을 때 (메모리 백엔드) 쓰는 id"""
+        user_id = self._next_id
+        self._next_id += 1
+        return user_id
+
+    def load(self, users: Iterable) -> None:
+        """영속 저장소에서 읽어온 사용자 등록 (백엔드에 다시 쓰지 않음)"""
+        for user in users:
+            self._insert(user)
+
+    def add(self, user) -> None:
+        """새 사용자 추가 및 인덱스 등록 (user.id에 새 id를 발급해서 설정)
+
+        백엔드가 id를 발급하면 (SQLite) 그 값을 쓰므로 백엔드 저장이 먼저 일어납니다.
+        백엔드에 같은 이메일이 이미 있으면 DuplicateEmailError (메모리에는 추가되지 않음)
+        """
+        user_id = self._backend.insert_user(user) if self._backend is not None else None
+        user.id = user_id if user_id is not None else self._allocate_id()
+        self._insert(user)
+        self._notify(user.id)
+
+    def update(self, user) -> None:
+        """사용자 정보 변경 후 인덱스 갱신 (이메일/역할이 바뀐 경우만 재등록)"""
+        self._by_id[user.id] = user
+        if self._index_keys.get(user.id) != (normalize_email(user.email), user.role):
+            self._unindex(user.id)
+            self._index(user)
+        self._index_skills(user)
+        self._index_orderings(user)
+        if self._backend is not None:
+            self._backend.save_user(user)
+        self._notify(user.id)
+
+    def remove(self, user_id: int) -> None:
+        """사용자 삭제"""
+        self._unindex(user_id)
+        self._unindex_skills(user_id)
+        self._unindex_orderings(user_id)
+        self._by_id.pop(user_id, None)
+        if self._backend is not None:
+            self._backend.delete_user(user_id)
+        self._notify(user_id)
+
+    def clear(self) -> None:
+        """모든 사용자 삭제 (id 카운터 포함)"""
+        self._by_id.clear()
+        self._id_by_email.clear()
+        self._ids_by_role.clear()
+        self._index_keys.clear()
+        self._mentor_ids_by_skill.clear()
+        self._skill_keys.clear()
+        for ordering in self._mentor_orderings.values():
+            ordering.clear()
+        self._mentor_sort_keys.clear()
+        self._next_id = 1
+        if self._backend is not None:
+            self._backend.clear_users()
+        self._notify(None)
+
+    def get(self, user_id: int):
+        return self._by_id.get(user_id)
+
+    def get_by_email(self, email: str):
+        user_id = self._id_by_email.get(normalize_email(email))
+        if user_id is None:
+            return None
+        return self._by_id.get(user_id)
+
+    def by_role(self, role: str) -> List:
+        """역할별 사용자 목록 (id 오름차순)"""
+        return [self._by_id[user_id] for user_id in self._ids_by_role.get(role, {})]
+
+    def mentor_ids_with_skills(self, skills: Iterable[str], match_all: bool = False) -> Set[int]:
+        """스킬을 가진 멘토 id 집합 (대소문자 무시)
+
+        match_all=False면 하나라도 가진 멘토(OR), True면 모두 가진 멘토(AND).
+        역색인의 집합 연산만 하므로 비용은 전체 멘토 수가 아니라 결과 크기에 비례합니다.
+        """
+        keys = {normalize_skill(skill) for skill in skills if normalize_skill(skill)}
+        if not keys:
+            return set()
+        id_sets = [self._mentor_ids_by_skill.get(key, set()) for key in keys]
+        if match_all:
+            id_sets.sort(key=len)
+            return set(id_sets[0]).intersection(*id_sets[1:])
+        return set().union(*id_sets)
+
+    @classmethod
+    def mentor_ordering(cls, order_by: Optional[str]) -> str:
+        """order_by 값을 정렬 순서 이름으로 변환 (알 수 없는 값은 id 순)"""
+        return order_by if order_by in cls.MENTOR_ORDERINGS else "id"
+
+    def mentor_sort_key(self, user_id: int, order_by: Optional[str]) -> Tuple:
+        """멘토의 정렬 키 (페이지네이션 커서용)"""
+        return self._mentor_sort_keys[user_id][self.mentor_ordering(order_by)]
+
+    def mentors_ordered(
+        self,
+        order_by: Optional[str] = None,
+        ids: Optional[Set[int]] = None,
+        after: Optional[Tuple] = None,
+        limit: Optional[int] = None
+    ) -> List:
+        """정렬된 멘토 목록 (order_by: "name" / "skill" / 그 외는 id 순)
+
+        ids가 없으면 미리 정렬된 리스트를 그대로 읽고,
+        ids(필터 결과)가 있으면 저장해 둔 정렬 키로 결과만 정렬합니다.
+        after(정렬 키)가 있으면 그 다음부터 limit개만 반환합니다 (keyset 페이지네이션).
+        """
+        ordering = self.mentor_ordering(order_by)
+        if ids is None:
+            entries = self._mentor_orderings[ordering]
+        else:
+            sort_keys = self._mentor_sort_keys
+            entries = sorted(sort_keys[user_id][ordering] for user_id in ids)
+        return [self._by_id[entry[-1]] for entry in _page(entries, after, limit)]
+
+    def all(self) -> List:
+        return list(self._by_id.values())
+
+    def _notify(self, user_id: Optional[int]) -> None:
+        for callback in self._listeners:
+            callback(user_id)
+
+    def _insert(self, user) -> None:
+        self._by_id[user.id] = user
+        self._index(user)
+        self._index_skills(user)
+        self._index_orderings(user)
+        if user.id >= self._next_id:
+            self._next_id = user.id + 1
+
+    def _index(self, user) -> None:
+        email_key = normalize_email(user.email)
+        self._id_by_email[email_key] = user.id
+        self._ids_by_role.setdefault(user.role, {})[user.id] = None
+        self._index_keys[user.id] = (email_key, user.role)
+
+    def _unindex(self, user_id: int) -> None:
+        keys = self._index_keys.pop(user_id, None)
+        if keys is None:
+            return
+        email_key, role = keys
+        if self._id_by_email.get(email_key) == user_id:
+            del self._id_by_email[email_key]
+        self._ids_by_role.get(role, {}).pop(user_id, None)
+
+    def _index_skills(self, user) -> None:
+        """스킬 역색인 갱신 (바뀐 스킬만 추가/제거)"""
+        skills = getattr(user.profile, "skills", None) if user.role == "mentor" else None
+        new_keys = frozenset(normalize_skill(skill) for skill in (skills or []) if normalize_skill(skill))
+        old_keys = self._skill_keys.get(user.id, frozenset())
+        if new_keys == old_keys:
+            return
+        for key in old_keys - new_keys:
+            self._discard_skill(key, user.id)
+        for key in new_keys - old_keys:
+            self._mentor_ids_by_skill.setdefault(key, set()).add(user.id)
+        if new_keys:
+            self._skill_keys[user.id] = new_keys
+        else:
+            self._skill_keys.pop(user.id, None)
+
+    def _unindex_skills(self, user_id: int) -> None:
+        for key in self._skill_keys.pop(user_id, frozenset()):
+            self._discard_skill(key, user_id)
+
+    def _discard_skill(self, key: str, user_id: int) -> None:
+        ids = self._mentor_ids_by_skill.get(key)
+        if ids is not None:
+            ids.discard(user_id)
+            if not ids:
+                del self._mentor_ids_by_skill[key]
+
+    @staticmethod
+    def _sort_keys(user) -> Dict[str, Tuple]:
+        """정렬 순서별 정렬 키 (마지막 원소는 항상 id - 동점일 때 id 순)"""
+        skills = getattr(user.profile, "skills", None) or []
+        return {
+            "id": (user.id,),
+            "name": (user.profile.name.lower(), user.id),
+            # 스킬이 없는 멘토는 맨 뒤로
+            "skill": ((0, skills[0].lower()) if skills else (1, ""), user.id)
+        }
+
+    def _index_orderings(self, user) -> None:
+        """정렬 리스트 갱신 (키가 바뀐 순서에서만 제거 후 bisect 삽입)"""
+        if user.role != "mentor":
+            self._unindex_orderings(user.id)
+            return
+        new_keys = self._sort_keys(user)
+        old_keys = self._mentor_sort_keys.get(user.id, {})
+        for ordering, key in new_keys.items():
+            old_key = old_keys.get(ordering)
+            if old_key == key:
+                continue
+            if old_key is not None:
+                self._remove_sorted(self._mentor_orderings[ordering], old_key)
+            insort(self._mentor_orderings[ordering], key)
+        self._mentor_sort_keys[user.id] = new_keys
+
+    def _unindex_orderings(self, user_id: int) -> None:
+        for ordering, key in self._mentor_sort_keys.pop(user_id, {}).items():
+            self._remove_sorted(self._mentor_orderings[ordering], key)
+
+    @staticmethod
+    def _remove_sorted(entries: List[Tuple], key: Tuple) -> None:
+        index = bisect_left(entries, key)
+        if index < len(entries) and entries[index] == key:
+            del entries[index]
+
+
+class DuplicateMatchRequestError(Exception):
+    """같은 멘티 → 멘토 대기 중 요청이 이미 있음"""
+
+
+class PendingLimitError(Exception):
+    """멘티의 대기 중 요청 수가 한도에 도달함"""
+
+
+class MatchRequestStore:
+    """id / 멘토 / 멘티 / 상태 인덱스를 가진 매칭 요청 저장소
+
+    상태 변경은 반드시 set_status()를 거쳐야 상태 인덱스가 유지됩니다.
+    인덱스 변경은 내부 락으로 보호하므로 여러 스레드에서 호출해도 되지만, 같은 요청의
+    상태 확인 → 변경을 원자적으로 하려면 match_transitions.MatchTransitionEngine을 사용합니다.
+    추가/상태 변경 때마다 저장소 전체에서 증가하는 변경 버전(version)을 매기고,
+    멘토/멘티별 변경 로그로 특정 버전 이후 바뀐 요청만 조회할 수 있습니다. (changed_for_mentor/mentee)
+    버전은 이 저장소 인스턴스 안에서만 의미가 있으므로, 시작할 때와 clear() 때마다 새로 만드는
+    epoch와 함께 써야 합니다. (재시작/다른 워커/초기화 이후의 버전을 구분)
+    """
+
+    def __init__(self, backend=None):
+        # 영속 저장소 백엔드 (None이면 메모리에만 보관)
+        self._backend = backend
+        self._by_id: Dict[int, object] = {}
+        # 보조 인덱스 - 멘토/멘티별은 id 오름차순 리스트 (커서 페이지네이션용),
+        # 상태별은 dict를 삽입 순서가 유지되는 set으로 사용
+        self._ids_by_mentor: Dict[int, List[int]] = {}
+        self._ids_by_mentee: Dict[int, List[int]] = {}
+        self._ids_by_status: Dict[str, Dict[int, None]] = {}
+        # 변경 로그 - 멘토/멘티별 요청 id를 마지막 변경 버전 순서로 보관 (바뀔 때마다 맨 뒤로 이동)
+        self._changes_by_mentor: Dict[int, Dict[int, None]] = {}
+        self._changes_by_mentee: Dict[int, Dict[int, None]] = {}
+        self._next_id = 1
+        # 마지막으로 매긴 변경 버전
+        self._version = 0
+        # 버전 계열 id - 프로세스마다 다르고 clear() 때 바뀜
+        self._epoch = secrets.token_hex(4)
+        # 대기 중 요청 인덱스 - (멘티, 멘토)별 / 멘티별 대기 중 요청 수 (0이 되면 키 삭제)
+        # (이전 데이터에 중복이 있을 수 있어서 id 대신 개수로 보관)
+        self._pending_by_pair: Dict[Tuple[int, int], int] = {}
+        self._pending_by_mentee: Dict[int, int] = {}
+        # 멘토별 수락된 요청 수 (멘토는 한 명만 수락할 수 있음 - 대기 중 인덱스와 같은 이유로 개수로 보관)
+        self._accepted_by_mentor: Dict[int, int] = {}
+        # 인덱스/카운터 보호 (백엔드 쓰기는 id를 받아야 하는 추가만 락 안에서)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def _allocate_id(self) -> int:
+        """백엔드가 id를 발급하지 않을 때 (메모리 백엔드) 쓰는 id - 락을 잡은 상태에서 호출"""
+        request_id = self._next_id
+        self._next_id += 1
+        return request_id
+
+    @property
+    def version(self) -> int:
+        """현재 변경 버전 (high-water mark)"""
+        return self._version
+
+    def sync_state(self) -> Tuple[str, int]:
+        """(epoch, 현재 변경 버전)"""
+        with self._lock:
+            return self._epoch, self._version
+
+    def load(self, match_requests: Iterable) -> None:
+        """영속 저장소에서 읽어온 매칭 요청 등록 (백엔드에 다시 쓰지 않음)"""
+        # 변경 로그가 버전 순서가 되도록 버전 순으로 등록
+        match_requests = sorted(match_requests, key=lambda match_request: match_request.version)
+        with self._lock:
+            for match_request in match_requests:
+                self._version = max(self._version, match_request.version)
+                self._insert(match_request)
+            # 버전 정보가 없던 이전 데이터에는 새 버전을 매김
+            for match_request in match_requests:
+                if not match_request.version:
+                    self._touch(match_request)
+
+    def add(self, match_request, max_pending: Optional[int] = None) -> None:
+        """새 매칭 요청 추가 및 인덱스 등록 (match_request.id에 새 id를 발급해서 설정)
+
+        max_pending이 주어지면 대기 중 요청을 추가하기 전에 같은 멘토에게 대기 중인 요청이 있는지
+        (DuplicateMatchRequestError), 멘티의 대기 중 요청이 max_pending개 이상인지(PendingLimitError)
+        확인합니다. 확인과 추가는 같은 락 안에서 일어납니다.
+        백엔드가 id를 발급하면 (SQLite) 그 값을 쓰므로 백엔드 저장도 같은 락 안에서 먼저 합니다.
+        """
+        with self._lock:
+            if max_pending is not None and match_request.status == "pending":
+                self.check_pending(match_request.menteeId, match_request.mentorId, max_pending)
+            match_request.version = self._next_version()
+            request_id = self._backend.insert_match_request(match_request) if self._backend is not None else None
+            match_request.id = request_id if request_id is not None else self._allocate_id()
+            self._insert(match_request)
+
+    def _insert(self, match_request) -> None:
+        # 같은 id가 다시 들어오면 (재로드 등) 이전 인덱스 항목을 먼저 제거해서 중복 등록 방지
+        existing = self._by_id.get(match_request.id)
+        if existing is not None:
+            self._unindex(existing)
+        self._by_id[match_request.id] = match_request
+        # id는 증가하므로 보통 맨 뒤에 추가됨
+        insort(self._ids_by_mentor.setdefault(match_request.mentorId, []), match_request.id)
+        insort(self._ids_by_mentee.setdefault(match_request.menteeId, []), match_request.id)
+        self._ids_by_status.setdefault(match_request.status, {})[match_request.id] = None
+        self._count_status(match_request, match_request.status, 1)
+        self._log_change(match_request)
+        if match_request.id >= self._next_id:
+            self._next_id = match_request.id + 1
+
+    def _unindex(self, match_request) -> None:
+        for ids in (
+            self._ids_by_mentor.get(match_request.mentorId),
+            self._ids_by_mentee.get(match_request.menteeId)
+        ):
+            if ids is None:
+                continue
+            position = bisect_left(ids, match_request.id)
+            if position < len(ids) and ids[position] == match_request.id:
+                del ids[position]
+        self._ids_by_status.get(match_request.status, {}).pop(match_request.id, None)
+        self._count_status(match_request, match_request.status, -1)
+        self._changes_by_mentor.get(match_request.mentorId, {}).pop(match_request.id, None)
+        self._changes_by_mentee.get(match_request.menteeId, {}).pop(match_request.id, None)
+
+    def _count_status(self, match_request, status: str, delta: int) -> None:
+        """대기 중 / 수락 인덱스의 개수 증감"""
+        if status == "pending":
+            self._bump(self._pending_by_pair, (match_request.menteeId, match_request.mentorId), delta)
+            self._bump(self._pending_by_mentee, match_request.menteeId, delta)
+        elif status == "accepted":
+            self._bump(self._accepted_by_mentor, match_request.mentorId, delta)
+
+    @staticmethod
+    def _bump(counts: Dict, key, delta: int) -> None:
+        count = counts.get(key, 0) + delta
+        if count > 0:
+            counts[key] = count
+        else:
+            counts.pop(key, None)
+
+    def _next_version(self) -> int:
+        self._version += 1
+        return self._version
+
+    def _log_change(self, match_request) -> None:
+        """변경 로그 맨 뒤로 이동 (버전 순서 유지)"""
+        for changes, owner_id in (
+            (self._changes_by_mentor, match_request.mentorId),
+            (self._changes_by_mentee, match_request.menteeId)
+        ):
+            owner_changes = changes.setdefault(owner_id, {})
+            owner_changes.pop(match_request.id, None)
+            owner_changes[match_request.id] = None
+
+    def _touch(self, match_request) -> None:
+        match_request.version = self._next_version()
+        self._log_change(match_request)
+
+    def set_status(self, match_request, new_status: str) -> None:
+        """상태 변경 + 상태 인덱스 갱신"""
+        with self._lock:
+            old_status = match_request.status
+            if old_status == new_status:
+                return
+            self._ids_by_status.get(old_status, {}).pop(match_request.id, None)
+            self._count_status(match_request, old_status, -1)
+            match_request.status = new_status
+            self._ids_by_status.setdefault(new_status, {})[match_request.id] = None
+            self._count_status(match_request, new_status, 1)
+            self._touch(match_request)
+        if self._backend is not None:
+            self._backend.save_match_request(match_request)
+
+    def clear(self) -> None:
+        """모든 매칭 요청 삭제 (id 카운터 포함, 변경 버전은 새 epoch에서 다시 시작)"""
+        with self._lock:
+            self._by_id.clear()
+            self._ids_by_mentor.clear()
+            self._ids_by_mentee.clear()
+            self._ids_by_status.clear()
+            self._changes_by_mentor.clear()
+            self._changes_by_mentee.clear()
+            self._pending_by_pair.clear()
+            self._pending_by_mentee.clear()
+            self._accepted_by_mentor.clear()
+            self._next_id = 1
+            self._version = 0
+            self._epoch = secrets.token_hex(4)
+        if self._backend is not None:
+            self._backend.clear_match_requests()
+
+    def get(self, request_id: int):
+        return self._by_id.get(request_id)
+
+    def by_mentor(self, mentor_id: int, after_id: Optional[int] = None, limit: Optional[int] = None) -> List:
+        """멘토가 받은 요청 목록 (생성 순, after_id 다음부터 limit개)"""
+        ids = self._ids_by_mentor.get(mentor_id, [])
+        return [self._by_id[request_id] for request_id in _page(ids, after_id, limit)]
+
+    def by_mentee(self, mentee_id: int, after_id: Optional[int] = None, limit: Optional[int] = None) -> List:
+        """멘티가 보낸 요청 목록 (생성 순, after_id 다음부터 limit개)"""
+        ids = self._ids_by_mentee.get(mentee_id, [])
+        return [self._by_id[request_id] for request_id in _page(ids, after_id, limit)]
+
+    def changed_for_mentor(self, mentor_id: int, since: int, limit: Optional[int] = None) -> List:
+        """멘토가 받은 요청 중 since 버전 이후 바뀐 것 (버전 순, 최대 limit개)"""
+        return self._changed(self._changes_by_mentor.get(mentor_id, {}), since, limit)
+
+    def changed_for_mentee(self, mentee_id: int, since: int, limit: Optional[int] = None) -> List:
+        """멘티가 보낸 요청 중 since 버전 이후 바뀐 것 (버전 순, 최대 limit개)"""
+        return self._changed(self._changes_by_mentee.get(mentee_id, {}), since, limit)
+
+    def _changed(self, changes: Dict[int, None], since: int, limit: Optional[int]) -> List:
+        # 로그 뒤쪽(최근 변경)부터 since 이하 버전을 만날 때까지만 확인
+        changed = []
+        with self._lock:
+            for request_id in reversed(changes):
+                match_request = self._by_id[request_id]
+                if match_request.version <= since:
+                    break
+                changed.append(match_request)
+        changed.reverse()
+        return changed[:limit] if limit is not None else changed
+
+    def by_status(self, status: str) -> List:
+        with self._lock:
+            return [self._by_id[request_id] for request_id in self._ids_by_status.get(status, {})]
+
+    def check_pending(self, mentee_id: int, mentor_id: int, max_pending: int) -> None:
+        """새 대기 중 요청을 추가할 수 있는지 확인 (O(1), 불가능하면 예외)
+
+        add(max_pending=...)가 락 안에서 호출합니다.
+        """
+        if (mentee_id, mentor_id) in self._pending_by_pair:
+            raise DuplicateMatchRequestError()
+        if self._pending_by_mentee.get(mentee_id, 0) >= max_pending:
+            raise PendingLimitError()
+
+    def has_pending(self, mentee_id: int, mentor_id: int) -> bool:
+        """멘티가 멘토에게 보낸 대기 중 요청이 있는지 (O(1))"""
+        return (mentee_id, mentor_id) in self._pending_by_pair
+
+    def pending_count(self, mentee_id: int) -> int:
+        """멘티의 대기 중 요청 수 (O(1))"""
+        return self._pending_by_mentee.get(mentee_id, 0)
+
+    def has_accepted(self, mentor_id: int) -> bool:
+        """멘토가 수락한 요청이 있는지 (O(1))"""
+        return mentor_id in self._accepted_by_mentor
+
+    def count_by_status(self, status: str) -> int:
+        return len(self._ids_by_status.get(status, {}))
+
+    def all(self) -> List:
+        return list(self._by_id.values())
@@ -0,0 +1,110 @@
+"""
+기본 아바타 렌더링 테스트 (프로세스 풀 렌더러, 임시 이미지)
+"""
+
+import asyncio
+import io
+import os
+import time
+
+from PIL import Image
+
+from avatar_service import AvatarRenderService, placeholder_png
+from create_test_images import (
+    AVATAR_FALLBACK_TEXT,
+    avatar_color,
+    avatar_digest,
+    avatar_text,
+    create_profile_image,
+)
+from image_index import ImageIndex
+
+
+def wait_for_avatar(app_client, url: str):
+    """렌더링이 끝나서 임시 이미지(no-store)가 아닌 응답이 올 때까지 다시 요청"""
+    for _ in range(100):
+        response = app_client.get(url)
+        assert response.status_code == 200
+        if response.headers.get("Cache-Control") != "no-store":
+            return response
+        time.sleep(0.1)
+    raise AssertionError("avatar was not rendered")
+
+
+def test_placeholder_is_a_small_png_built_once():
+    body = placeholder_png()
+
+    assert placeholder_png() is body
+    with Image.open(io.BytesIO(body)) as image:
+        assert (image.format, image.size) == ("PNG", (64, 64))
+
+
+def test_concurrent_requests_share_one_render(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    service = AvatarRenderService(ImageIndex(), max_workers=1, wait_timeout=30)
+    args = ("mentor", "K")
+
+    async def scenario():
+        first = service.schedule(*args)
+        assert service.schedule(*args) is first
+        assert all(await asyncio.gather(service.render(*args), service.render(*args)))
+        # 파일이 생긴 뒤에는 다시 렌더링하지 않음
+        assert service.schedule(*args) is None
+
+    try:
+        asyncio.run(scenario())
+        assert service.stats()["rendered"] == 1
+    finally:
+        service.shutdown()
+
+
+def test_user_without_upload_gets_rendered_avatar(app_client, signup):
+    mentor, _ = signup(role="mentor", name="아바타")
+
+    response = wait_for_avatar(app_client, f"/api/images/mentor/{mentor['id']}")
+    assert "ETag" in response.headers
+    with Image.open(io.BytesIO(response.content)) as image:
+        assert (image.format, image.size) == ("PNG", (500, 500))
+
+
+def test_avatar_is_determined_by_role_and_initial():
+    assert avatar_text("kim") == "K"
+    assert avatar_digest("mentor", "K") == avatar_digest("mentor", "K")
+    assert avatar_digest("mentor", "K") != avatar_digest("mentee", "K")
+    assert avatar_color("mentor", "K") == avatar_color("mentor", "K")
+
+    first = create_profile_image(width=100, height=100, role="mentor", name="K")
+    second = create_profile_image(width=100, height=100, role="mentor", name="K")
+    assert first.tobytes() == second.tobytes()
+
+
+def test_nameless_users_share_one_fallback_avatar():
+    assert avatar_text("") == avatar_text(None) == AVATAR_FALLBACK_TEXT
+
+    # 사용자 id는 그림에도 digest에도 들어가지 않음
+    first = create_profile_image(width=100, height=100, user_id=1, role="mentee", name="")
+    second = create_profile_image(width=100, height=100, user_id=2, role="mentee", name="")
+    assert first.tobytes() == second.tobytes()
+
+
+def test_users_with_same_initial_share_one_avatar_file(app_client, signup):
+    first, _ = signup(role="mentee", name="공유1")
+    second, _ = signup(role="mentee", name="공유2")
+
+    first_response = wait_for_avatar(app_client, f"/api/images/mentee/{first['id']}")
+    second_response = wait_for_avatar(app_client, f"/api/images/mentee/{second['id']}")
+    assert first_response.headers["ETag"] == second_response.headers["ETag"]
+    assert os.path.exists(f"images/avatars/{avatar_digest('mentee', '공')}.png")
+
+
+def test_signup_drops_avatar_cached_before_the_user_existed(app_client, signup):
+    previous, _ = signup(role="mentor", name="이전")
+    url = f"/api/images/mentor/{previous['id'] + 1}"
+    # 아직 없는 사용자 id → 이름 없는 기본 아바타가 캐시됨
+    before = wait_for_avatar(app_client, url)
+
+    mentor, _ = signup(role="mentor", name="새멘토")
+    assert mentor["id"] == previous["id"] + 1
+
+    after = wait_for_avatar(app_client, url)
+    assert after.headers["ETag"] != before.headers["ETag"]
@@ -0,0 +1,103 @@
+"""
+프로필 이미지 API 테스트 (업로드 → 조회, 조건부 GET)
+"""
+
+import base64
+import io
+import os
+
+import pytest
+from PIL import Image
+
+
+def png_base64(color, size=(300, 300)) -> str:
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color).save(buffer, "PNG")
+    return base64.b64encode(buffer.getvalue()).decode()
+
+
+def upload(app_client, mentor, headers, color):
+    response = app_client.put(
+        "/api/profile",
+        headers=headers,
+        json={"id": mentor["id"], "name": mentor["profile"]["name"], "role": "mentor", "bio": "", "image": png_base64(color)}
+    )
+    assert response.status_code == 200, response.text
+
+
+@pytest.fixture
+def mentor_with_image(app_client, signup):
+    mentor, headers = signup(role="mentor", name="이미지멘토")
+    upload(app_client, mentor, headers, "red")
+    return mentor, headers
+
+
+def test_image_has_validators_and_conditional_get_returns_304(app_client, mentor_with_image):
+    url = f"/api/images/mentor/{mentor_with_image[0]['id']}"
+    response = app_client.get(url)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/png"
+    etag, last_modified = response.headers["ETag"], response.headers["Last-Modified"]
+
+    not_modified = app_client.get(url, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["ETag"] == etag
+
+    assert app_client.get(url, headers={"If-Modified-Since": last_modified}).status_code == 304
+    assert app_client.get(url, headers={"If-None-Match": '"other"'}).status_code == 200
+
+
+def test_new_upload_replaces_cached_image(app_client, mentor_with_image):
+    mentor, headers = mentor_with_image
+    url = f"/api/images/mentor/{mentor['id']}"
+    etag = app_client.get(url).headers["ETag"]
+
+    upload(app_client, mentor, headers, "blue")
+
+    response = app_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_invalid_role_is_rejected(app_client):
+    assert app_client.get("/api/images/admin/1").status_code == 400
+
+
+def test_thumbnail_size_and_format_follow_the_request(app_client, mentor_with_image):
+    url = f"/api/images/mentor/{mentor_with_image[0]['id']}"
+
+    response = app_client.get(url, params={"size": 64}, headers={"Accept": "image/webp,*/*"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/webp"
+    assert response.headers["Vary"] == "Accept"
+    with Image.open(io.BytesIO(response.content)) as thumbnail:
+        assert (thumbnail.format, thumbnail.size) == ("WEBP", (64, 64))
+
+    response = app_client.get(url, params={"size": 128}, headers={"Accept": "image/png"})
+    assert response.headers["content-type"] == "image/png"
+    with Image.open(io.BytesIO(response.content)) as thumbnail:
+        assert thumbnail.size == (128, 128)
+
+
+def test_thumbnail_is_stored_and_regenerated_after_new_upload(app_client, mentor_with_image):
+    mentor, headers = mentor_with_image
+    url = f"/api/images/mentor/{mentor['id']}"
+    path = f"images/mentor/{mentor['id']}_64.png"
+
+    app_client.get(url, params={"size": 64})
+    assert os.path.exists(path)
+    assert [name for name in os.listdir("images/mentor") if name.endswith(".tmp")] == []
+
+    upload(app_client, mentor, headers, "blue")
+    response = app_client.get(url, params={"size": 64})
+    with Image.open(io.BytesIO(response.content)) as thumbnail:
+        assert thumbnail.convert("RGB").getpixel((32, 32)) == (0, 0, 255)
+    with Image.open(path) as thumbnail:
+        assert thumbnail.convert("RGB").getpixel((32, 32)) == (0, 0, 255)
+
+
+def test_invalid_thumbnail_size_is_rejected(app_client, mentor_with_image):
+    response = app_client.get(f"/api/images/mentor/{mentor_with_image[0]['id']}", params={"size": 100})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid size (allowed: 64, 128, 256)"
@@ -0,0 +1,84 @@
+"""
+ImageCache / 조건부 GET 판단 테스트
+"""
+
+from email.utils import formatdate
+
+from image_cache import CachedImage, ImageCache, is_not_modified
+
+
+def image(body: bytes = b"body", last_modified: float = 1_700_000_000) -> CachedImage:
+    return CachedImage(body, "image/png", last_modified)
+
+
+def test_byte_cap_evicts_least_recently_used():
+    cache = ImageCache(max_bytes=10)
+    cache.put(("mentor", 1), image(b"1111"))
+    cache.put(("mentor", 2), image(b"2222"))
+    cache.get(("mentor", 1))
+    cache.put(("mentor", 3), image(b"3333"))
+
+    assert cache.get(("mentor", 2)) is None
+    assert cache.get(("mentor", 1)) is not None and cache.get(("mentor", 3)) is not None
+    assert cache.stats()["bytes"] == 8
+
+
+def test_entry_over_per_entry_limit_is_not_cached():
+    cache = ImageCache(max_bytes=100, max_entry_bytes=4)
+    cache.put(("mentor", 1), image(b"12345"))
+
+    assert cache.get(("mentor", 1)) is None
+    assert cache.stats()["bytes"] == 0
+
+
+def test_invalidate_drops_every_variant_of_the_user():
+    cache = ImageCache()
+    cache.put(("mentor", 1), image())
+    cache.put(("mentor", 1, 64, "webp"), image(b"small"))
+    cache.put(("mentor", 2), image())
+
+    cache.invalidate("mentor", 1)
+
+    assert cache.get(("mentor", 1)) is None
+    assert cache.get(("mentor", 1, 64, "webp")) is None
+    assert cache.get(("mentor", 2)) is not None
+
+
+def test_shared_image_bytes_are_counted_once():
+    cache = ImageCache(max_bytes=10)
+    avatar = image(b"123456")
+    cache.put(("mentor", 1), avatar)
+    cache.put(("mentor", 2), avatar)
+    assert cache.stats()["bytes"] == 6
+
+    cache.invalidate("mentor", 1)
+    assert cache.stats()["bytes"] == 6
+    cache.invalidate("mentor", 2)
+    assert cache.stats()["bytes"] == 0
+
+
+def test_etag_is_a_strong_content_hash():
+    assert image(b"a").etag == image(b"a", last_modified=1).etag
+    assert image(b"a").etag != image(b"b").etag
+    assert not image().etag.startswith("W/")
+
+
+def test_if_none_match():
+    cached = image()
+
+    assert is_not_modified(cached, cached.etag, None)
+    assert is_not_modified(cached, f'"other", {cached.etag}', None)
+    assert is_not_modified(cached, "*", None)
+    assert not is_not_modified(cached, '"other"', None)
+    # If-None-Match가 있으면 If-Modified-Since는 보지 않음
+    assert not is_not_modified(cached, '"other"', cached.last_modified_header)
+
+
+def test_if_modified_since():
+    cached = image(last_modified=1_700_000_000)
+
+    assert is_not_modified(cached, None, cached.last_modified_header)
+    assert is_not_modified(cached, None, formatdate(1_700_000_100, usegmt=True))
+    assert not is_not_modified(cached, None, formatdate(1_699_999_000, usegmt=True))
+    assert not is_not_modified(cached, None, "not a date")
+    assert not is_not_modified(cached, None, None)
@@ -0,0 +1,61 @@
+"""
+ImageIndex 테스트 (시작 시 디렉터리 스캔, 업로드/렌더링 후 갱신)
+"""
+
+import os
+
+from image_index import ImageIndex
+
+DIGEST = "0123456789abcdef0123456789abcdef"
+
+
+def touch(path, data: bytes = b"x"):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+    return str(path)
+
+
+def test_scan_indexes_user_images_and_avatars(tmp_path):
+    root = tmp_path / "images"
+    touch(root / "mentor" / "1.jpg")
+    touch(root / "mentor" / "1.png", b"png")
+    touch(root / "mentee" / "2.jpeg")
+    # 썸네일, 임시 파일, 이름이 맞지 않는 아바타는 제외
+    touch(root / "mentor" / "1_64.webp")
+    touch(root / "mentor" / "tmp123.upload")
+    touch(root / "avatars" / f"{DIGEST}.png")
+    touch(root / "avatars" / "not-a-digest.png")
+
+    index = ImageIndex(root=str(root))
+    assert index.scan(str(root / "avatars")) == 3
+
+    # 같은 사용자의 파일이 여러 개면 png 우선
+    entry = index.get_user_image("mentor", 1)
+    assert (entry.path, entry.media_type, entry.size) == (f"{root}/mentor/1.png", "image/png", 3)
+    assert index.get_user_image("mentee", 2).media_type == "image/jpeg"
+    assert index.get_avatar(DIGEST).path == f"{root}/avatars/{DIGEST}.png"
+    assert index.stats() == {"user_images": 2, "avatars": 1}
+
+
+def test_scan_without_directories_is_empty(tmp_path):
+    index = ImageIndex(root=str(tmp_path / "images"))
+
+    assert index.scan(str(tmp_path / "images" / "avatars")) == 0
+    assert index.get_user_image("mentor", 1) is None
+
+
+def test_put_and_discard(tmp_path):
+    index = ImageIndex(root=str(tmp_path))
+    path = touch(tmp_path / "mentor" / "3.png", b"abcd")
+
+    entry = index.put_user_image("mentor", 3, path, os.stat(path))
+    assert index.get_user_image("mentor", 3) is entry
+    assert entry.size == 4
+
+    index.discard_user_image("mentor", 3)
+    assert index.get_user_image("mentor", 3) is None
+
+    index.put_avatar(DIGEST, path, os.stat(path))
+    index.discard_avatar(DIGEST)
+    assert index.get_avatar(DIGEST) is None
@@ -0,0 +1,70 @@
+"""
+ImageStorage 테스트 (스레드 풀 파일 I/O)
+"""
+
+import asyncio
+import os
+
+import pytest
+
+from image_storage import FileTooLargeError, ImageStorage
+
+
+@pytest.fixture
+def storage():
+    storage = ImageStorage(max_workers=2)
+    yield storage
+    storage.shutdown()
+
+
+def test_write_creates_directories_and_replaces_atomically(storage, tmp_path):
+    path = str(tmp_path / "images" / "mentor" / "1.png")
+
+    async def scenario():
+        await storage.write(path, b"first")
+        await storage.write(path, b"second")
+        return await storage.read(path)
+
+    assert asyncio.run(scenario()) == b"second"
+    # 임시 파일이 남지 않음
+    assert os.listdir(tmp_path / "images" / "mentor") == ["1.png"]
+
+
+def test_stat_and_remove_of_missing_file(storage, tmp_path):
+    path = str(tmp_path / "missing.png")
+
+    async def scenario():
+        assert await storage.stat(path) is None
+        assert not await storage.exists(path)
+        assert await storage.remove(path) is False
+
+    asyncio.run(scenario())
+    assert storage.stats()["operations"] == 3
+
+
+def test_stream_over_cap_removes_temp_file(storage, tmp_path):
+    async def chunks():
+        for _ in range(4):
+            yield b"x" * 10
+
+    async def scenario():
+        with pytest.raises(FileTooLargeError):
+            await storage.write_temp_stream(str(tmp_path), chunks(), max_bytes=25)
+
+    asyncio.run(scenario())
+    assert os.listdir(tmp_path) == []
+
+
+def test_stream_within_cap_returns_path_and_size(storage, tmp_path):
+    async def chunks():
+        yield b"abc"
+        yield b"def"
+
+    async def scenario():
+        return await storage.write_temp_stream(str(tmp_path), chunks(), max_bytes=6)
+
+    path, received = asyncio.run(scenario())
+    assert received == 6
+    assert path.endswith(".upload")
+    with open(path, "rb") as f:
+        assert f.read() == b"abcdef"
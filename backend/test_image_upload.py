@@ -0,0 +1,121 @@
+"""
+업로드 이미지 검증/재인코딩 테스트
+"""
+
+import base64
+import io
+import os
+
+import pytest
+from PIL import Image
+
+import image_upload
+from image_upload import InvalidImageError, reencode_image
+
+
+def save(path, size=(40, 20), fmt="PNG", **params):
+    Image.new("RGB", size, "red").save(path, fmt, **params)
+    return str(path)
+
+
+def test_junk_data_is_rejected(tmp_path):
+    source = tmp_path / "junk.upload"
+    source.write_bytes(b"not an image")
+    dest = tmp_path / "1.png"
+
+    with pytest.raises(InvalidImageError) as excinfo:
+        reencode_image(str(source), str(dest), 500)
+    # Pillow 메시지(임시 파일 경로 포함)를 그대로 쓰지 않음
+    assert str(excinfo.value) == "Cannot decode image"
+    assert not dest.exists()
+
+
+def test_format_outside_allowlist_is_rejected(tmp_path):
+    source = save(tmp_path / "image.upload", fmt="BMP")
+
+    with pytest.raises(InvalidImageError, match="Unsupported image format"):
+        reencode_image(source, str(tmp_path / "1.png"), 500)
+
+
+def test_too_many_pixels_is_rejected(tmp_path, monkeypatch):
+    monkeypatch.setattr(image_upload, "MAX_SOURCE_PIXELS", 100)
+    source = save(tmp_path / "image.upload")
+
+    with pytest.raises(InvalidImageError, match="Image dimensions too large"):
+        reencode_image(source, str(tmp_path / "1.png"), 500)
+
+
+def test_exif_orientation_is_applied_and_metadata_dropped(tmp_path):
+    exif = Image.Exif()
+    exif[0x0112] = 6  # 시계 방향 90도 회전해서 보여야 함
+    source = save(tmp_path / "photo.upload", size=(40, 20), fmt="JPEG", exif=exif.tobytes())
+    dest = str(tmp_path / "1.png")
+
+    reencode_image(source, dest, 500)
+
+    with Image.open(dest) as image:
+        assert (image.format, image.size) == ("PNG", (20, 40))
+        assert not image.getexif()
+        assert "exif" not in image.info
+
+
+def test_large_image_is_downscaled(tmp_path):
+    source = save(tmp_path / "large.upload", size=(1000, 500), fmt="WEBP")
+    dest = str(tmp_path / "1.png")
+
+    reencode_image(source, dest, 500)
+
+    with Image.open(dest) as image:
+        assert image.size == (500, 250)
+
+
+def put_image(app_client, headers, body: bytes):
+    return app_client.put("/api/profile/image", content=body, headers={**headers, "Content-Type": "image/png"})
+
+
+def test_binary_upload_stores_image(app_client, signup):
+    mentor, headers = signup(role="mentor")
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 64), "blue").save(buffer, "PNG")
+
+    response = put_image(app_client, headers, buffer.getvalue())
+    assert response.status_code == 200, response.text
+    assert response.json()["profile"]["imageUrl"] == f"/images/mentor/{mentor['id']}"
+
+
+def test_binary_upload_of_junk_is_rejected_without_leftovers(app_client, signup):
+    _, headers = signup(role="mentor")
+
+    response = put_image(app_client, headers, b"not an image")
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid image data: Cannot decode image"
+    assert [name for name in os.listdir("images/mentor") if name.endswith((".upload", ".tmp"))] == []
+
+
+def test_rejected_upload_does_not_expose_server_paths(app_client, signup):
+    mentor, headers = signup(role="mentor")
+    junk = base64.b64encode(b"not an image").decode()
+
+    responses = [
+        put_image(app_client, headers, b"not an image"),
+        app_client.put(
+            "/api/profile",
+            headers=headers,
+            json={"id": mentor["id"], "name": mentor["profile"]["name"], "role": "mentor", "bio": "", "image": junk}
+        ),
+    ]
+    for response in responses:
+        assert response.status_code == 400
+        assert os.getcwd() not in response.text
+        assert "images/" not in response.text
+        assert ".upload" not in response.text
+
+
+def test_binary_upload_over_cap_is_rejected(app_client, signup, monkeypatch):
+    import main
+
+    monkeypatch.setattr(main, "IMAGE_UPLOAD_MAX_BYTES", 10)
+    _, headers = signup(role="mentee")
+
+    response = put_image(app_client, headers, b"x" * 11)
+    assert response.status_code == 413
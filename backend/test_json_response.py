@@ -0,0 +1,36 @@
+"""
+FastJSONResponse / dumps 테스트
+"""
+
+import json
+
+from json_response import FastJSONResponse, dumps
+
+
+def test_dumps_is_compact_utf8():
+    assert dumps({"name": "김프론트", "skills": ["React"], "id": 1}) == '{"name":"김프론트","skills":["React"],"id":1}'.encode("utf-8")
+
+
+def test_response_renders_dicts_and_passes_bytes_through():
+    response = FastJSONResponse({"id": 1})
+    assert response.body == b'{"id":1}'
+    assert response.media_type == "application/json"
+
+    cached = b'[{"id":2}]'
+    assert FastJSONResponse(cached).body is cached
+
+
+def test_me_response_matches_declared_model(app_client, auth_headers):
+    import main
+
+    response = app_client.get("/api/me", headers=auth_headers("mentee1@example.com"))
+    assert response.headers["content-type"] == "application/json"
+    body = response.json()
+    # response_model 검증을 건너뛰어도 선언된 모델과 같은 형태여야 함
+    assert main.UserResponse.model_validate(body).model_dump() == body
+
+    # OpenAPI 문서의 응답 스키마는 그대로
+    schema = app_client.get("/openapi.json").json()
+    ref = schema["paths"]["/api/me"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]["$ref"]
+    assert ref.endswith("/UserResponse")
+    assert json.loads(dumps(body)) == body
@@ -0,0 +1,114 @@
+"""
+logging_setup 테스트 (경로별 레벨/샘플링, 가림 처리, JSON 포맷)
+"""
+
+import asyncio
+import json
+import logging
+
+from logging_setup import (
+    JsonFormatter,
+    LazyQueueHandler,
+    LazyRedacted,
+    PathPrefixSettings,
+    RequestLogContextMiddleware,
+    RequestLogFilter,
+    parse_path_settings,
+    redact,
+    sampling_settings,
+)
+
+
+def make_record(level=logging.INFO, msg="user %s", args=(1,)):
+    return logging.LogRecord("test", level, __file__, 1, msg, args, None)
+
+
+def test_parse_path_settings_skips_malformed_items():
+    assert parse_path_settings(" /api/images=0.1, /api/mentors=WARNING,broken,=1,/x=") == {
+        "/api/images": "0.1",
+        "/api/mentors": "WARNING",
+    }
+
+
+def test_redact_hides_sensitive_fields_and_truncates():
+    cleaned = redact({"Password": "secret", "profile": {"image": "A" * 50, "bio": "b" * 30}, "token": ""}, max_length=10)
+
+    assert cleaned["Password"] == "<redacted 6 chars>"
+    assert cleaned["profile"]["image"] == "<redacted 50 chars>"
+    assert cleaned["profile"]["bio"] == "bbbbbbbbbb...(+20 chars)"
+    assert cleaned["token"] == "<redacted>"
+
+
+def test_longest_prefix_wins():
+    settings = PathPrefixSettings({"/api": 1, "/api/images": 2})
+
+    assert settings.lookup("/api/images/mentor/1", 0) == 2
+    assert settings.lookup("/api/mentors", 0) == 1
+    assert settings.lookup("/health", 0) == 0
+    assert settings.lookup(None, 0) == 0
+
+
+def test_sampling_settings_clamp_rates():
+    settings = sampling_settings("/a=2,/b=-1,/c=abc,/d=0.5")
+
+    assert (settings.lookup("/a", None), settings.lookup("/b", None), settings.lookup("/d", None)) == (1.0, 0.0, 0.5)
+    assert settings.lookup("/c", None) is None
+
+
+def filter_in_request(path: str, records, sampling=None, levels=None):
+    """미들웨어를 거친 요청 안에서 필터 결과 확인"""
+    log_filter = RequestLogFilter(PathPrefixSettings(levels or {}))
+    results = []
+
+    async def app(scope, receive, send):
+        results.extend(log_filter.filter(record) for record in records)
+
+    middleware = RequestLogContextMiddleware(app, PathPrefixSettings(sampling or {}))
+    asyncio.run(middleware({"type": "http", "path": path}, None, None))
+    return results
+
+
+def test_sampled_out_request_keeps_only_warnings():
+    records = [make_record(logging.INFO), make_record(logging.WARNING)]
+
+    assert filter_in_request("/api/images/mentor/1", records, sampling={"/api/images": 0.0}) == [False, True]
+    assert filter_in_request("/api/mentors", records, sampling={"/api/images": 0.0}) == [True, True]
+
+
+def test_path_level_drops_lower_records():
+    records = [make_record(logging.DEBUG), make_record(logging.INFO), make_record(logging.ERROR)]
+
+    assert filter_in_request("/api/mentors", records, levels={"/api/mentors": logging.INFO}) == [False, True, True]
+    # 요청 밖(시작 로그 등)은 거르지 않음
+    assert RequestLogFilter(PathPrefixSettings({"/": logging.ERROR})).filter(make_record()) is True
+
+
+def test_queue_handler_leaves_message_unformatted():
+    record = LazyQueueHandler(None).prepare(make_record())
+
+    assert (record.msg, record.args) == ("user %s", (1,))
+    assert record.path is None
+
+
+def test_json_formatter_writes_one_object_per_line():
+    record = make_record(msg="x" * 20, args=())
+    record.path = "/api/me"
+
+    entry = json.loads(JsonFormatter(max_message_length=5).format(record))
+    assert (entry["level"], entry["logger"], entry["path"]) == ("INFO", "test", "/api/me")
+    assert entry["msg"] == "xxxxx...(+15 chars)"
+
+
+def test_lazy_redacted_builds_value_only_when_formatted():
+    calls = []
+
+    def produce():
+        calls.append(1)
+        return {"password": "secret", "name": "kim"}
+
+    value = LazyRedacted(produce)
+    record = make_record(msg="data %s", args=(value,))
+    assert calls == []
+
+    assert record.getMessage() == "data {'password': '<redacted 6 chars>', 'name': 'kim'}"
+    assert calls == [1]
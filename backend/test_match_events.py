@@ -0,0 +1,59 @@
+"""
+매칭 요청 이벤트 브로커 테스트 (SSE 큐 넘침 → resync)
+"""
+
+import asyncio
+
+from match_events import RESYNC_EVENT, MatchEventBroker, format_sse
+
+
+def test_format_sse():
+    assert format_sse("accepted", b'{"id":1}', 5) == b'id: 5\nevent: accepted\ndata: {"id":1}\n\n'
+    assert format_sse(RESYNC_EVENT, b"{}") == b"event: resync\ndata: {}\n\n"
+
+
+def test_publish_reaches_only_subscribed_user():
+    broker = MatchEventBroker()
+
+    async def scenario():
+        mentor = broker.subscribe(1)
+        mentee = broker.subscribe(2)
+        broker.publish(1, "created", b'{"id":7}')
+        # 구독자가 없는 사용자에게는 아무것도 하지 않음
+        broker.publish(3, "created", b'{"id":8}')
+
+        assert await mentor.get(1) == format_sse("created", b'{"id":7}', 1)
+        assert await mentee.get(0.01) is None
+
+    asyncio.run(scenario())
+    assert broker.stats()["published"] == 1
+
+
+def test_overflow_drops_backlog_and_queues_resync():
+    broker = MatchEventBroker(max_queue=2)
+
+    async def scenario():
+        subscription = broker.subscribe(1)
+        for i in range(3):
+            broker.publish(1, "created", str(i).encode())
+
+        assert await subscription.get(1) == format_sse(RESYNC_EVENT, b"{}")
+        assert await subscription.get(0.01) is None
+        assert broker.stats()["dropped"] == 2
+
+        broker.unsubscribe(subscription)
+        assert not broker.has_subscribers(1)
+
+    asyncio.run(scenario())
+
+
+def test_publish_from_another_thread_is_delivered_on_the_loop():
+    broker = MatchEventBroker()
+
+    async def scenario():
+        subscription = broker.subscribe(1)
+        # 동기 핸들러(스레드 풀)에서 발행하는 경우
+        await asyncio.get_running_loop().run_in_executor(None, broker.publish, 1, "rejected", b"{}")
+        return await subscription.get(1)
+
+    assert asyncio.run(scenario()) == format_sse("rejected", b"{}", 1)
@@ -0,0 +1,237 @@
+"""
+매칭 요청 API 테스트 (TestClient, 프로세스 안에서 실행)
+픽스처는 conftest.py 참고 - 테스트마다 매칭 요청 저장소를 비웁니다.
+"""
+
+import main
+from pagination import NEXT_CURSOR_HEADER, SYNC_RESET_HEADER, SYNC_VERSION_HEADER
+
+# seed_data.json 사용자
+MENTOR = "mentor1@example.com"
+MENTEE = "mentee1@example.com"
+OTHER_MENTOR = "mentor2@example.com"
+OTHER_MENTEE = "mentee2@example.com"
+
+
+def user_id(email: str) -> int:
+    return main.get_user_by_email(email).id
+
+
+def seed_requests(mentor_id: int, mentee_id: int, count: int, request_status: str = "pending"):
+    """API 제한(중복/대기 수)을 거치지 않고 요청 생성"""
+    return [
+        main.create_match_request(mentor_id, mentee_id, f"요청 {i}", request_status=request_status)
+        for i in range(count)
+    ]
+
+
+def test_incoming_cursor_pages_cover_all_requests(client, auth_headers):
+    created = seed_requests(user_id(MENTOR), user_id(MENTEE), 5, request_status="rejected")
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/match-requests/incoming", params=params, headers=auth_headers(MENTOR))
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page) <= 2
+        seen.extend(item["id"] for item in page)
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if not cursor:
+            break
+
+    assert seen == [match_request.id for match_request in created]
+
+
+def test_outgoing_without_limit_returns_everything(client, auth_headers):
+    created = seed_requests(user_id(MENTOR), user_id(MENTEE), 3, request_status="rejected")
+
+    response = client.get("/api/match-requests/outgoing", headers=auth_headers(MENTEE))
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()] == [match_request.id for match_request in created]
+    assert NEXT_CURSOR_HEADER not in response.headers
+
+
+def test_incoming_rejects_invalid_cursor(client, auth_headers):
+    response = client.get("/api/match-requests/incoming", params={"cursor": "garbage"}, headers=auth_headers(MENTOR))
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def get_incoming(client, auth_headers, **params):
+    response = client.get("/api/match-requests/incoming", params=params, headers=auth_headers(MENTOR))
+    assert response.status_code == 200, response.text
+    return response
+
+
+def test_since_returns_changes_after_token(client, auth_headers):
+    token = get_incoming(client, auth_headers).headers[SYNC_VERSION_HEADER]
+    first, second = seed_requests(user_id(MENTOR), user_id(MENTEE), 2)
+
+    response = get_incoming(client, auth_headers, since=token)
+    assert [item["id"] for item in response.json()] == [first.id, second.id]
+    assert SYNC_RESET_HEADER not in response.headers
+    token = response.headers[SYNC_VERSION_HEADER]
+
+    # 바뀐 게 없으면 빈 목록, 토큰은 그대로
+    response = get_incoming(client, auth_headers, since=token)
+    assert response.json() == []
+    assert response.headers[SYNC_VERSION_HEADER] == token
+
+    main.match_transition_engine.apply(first.id, user_id(MENTOR), "reject")
+    response = get_incoming(client, auth_headers, since=token)
+    assert [(item["id"], item["status"]) for item in response.json()] == [(first.id, "rejected")]
+
+
+def test_since_with_limit_continues_from_last_item(client, auth_headers):
+    token = get_incoming(client, auth_headers).headers[SYNC_VERSION_HEADER]
+    created = seed_requests(user_id(MENTOR), user_id(MENTEE), 3)
+
+    response = get_incoming(client, auth_headers, since=token, limit=2)
+    assert [item["id"] for item in response.json()] == [created[0].id, created[1].id]
+    response = get_incoming(client, auth_headers, since=response.headers[SYNC_VERSION_HEADER], limit=2)
+    assert [item["id"] for item in response.json()] == [created[2].id]
+
+
+def test_since_from_another_epoch_resets(client, auth_headers):
+    seed_requests(user_id(MENTOR), user_id(MENTEE), 1)
+    token = get_incoming(client, auth_headers).headers[SYNC_VERSION_HEADER]
+
+    # 재시작/초기화 후 같은 버전 번호까지 다시 쓰인 경우에도 전체 목록을 받아야 함
+    main.match_request_store.clear()
+    recreated = seed_requests(user_id(MENTOR), user_id(MENTEE), 2)
+    response = get_incoming(client, auth_headers, since=token)
+    assert response.headers[SYNC_RESET_HEADER] == "true"
+    assert [item["id"] for item in response.json()] == [match_request.id for match_request in recreated]
+    assert response.headers[SYNC_VERSION_HEADER] != token
+
+
+def test_since_ahead_of_store_resets(client, auth_headers):
+    seed_requests(user_id(MENTOR), user_id(MENTEE), 1)
+    epoch, version = main.match_request_store.sync_state()
+
+    response = get_incoming(client, auth_headers, since=f"{epoch}.{version + 10}")
+    assert response.headers[SYNC_RESET_HEADER] == "true"
+    assert len(response.json()) == 1
+
+
+def test_invalid_since_is_rejected(client, auth_headers):
+    response = client.get("/api/match-requests/incoming", params={"since": "abc.x"}, headers=auth_headers(MENTOR))
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid since"
+
+
+def test_since_cannot_be_combined_with_cursor(client, auth_headers):
+    token = get_incoming(client, auth_headers).headers[SYNC_VERSION_HEADER]
+    response = client.get("/api/match-requests/incoming", params={"since": token, "cursor": "x"}, headers=auth_headers(MENTOR))
+    assert response.status_code == 400
+
+
+def post_bulk(client, auth_headers, ids, action, email=MENTOR):
+    return client.post("/api/match-requests/bulk", json={"ids": ids, "action": action}, headers=auth_headers(email))
+
+
+def test_bulk_accept_reports_status_per_request(client, auth_headers):
+    mentor_id, mentee_id = user_id(MENTOR), user_id(MENTEE)
+    (pending,) = seed_requests(mentor_id, mentee_id, 1)
+    (rejected,) = seed_requests(mentor_id, user_id(OTHER_MENTEE), 1, request_status="rejected")
+    (others,) = seed_requests(user_id(OTHER_MENTOR), mentee_id, 1)
+
+    response = post_bulk(client, auth_headers, [pending.id, 999999, others.id, rejected.id, pending.id], "accept")
+    assert response.status_code == 200, response.text
+    body = response.json()
+
+    # 중복 id는 한 번만 처리, 결과는 요청한 순서대로 (다른 멘토의 요청은 멘토의 목록에 없으므로 404)
+    assert [(item["id"], item["status"]) for item in body["results"]] == [
+        (pending.id, 200),
+        (999999, 404),
+        (others.id, 404),
+        (rejected.id, 400),
+    ]
+    assert (body["succeeded"], body["failed"]) == (1, 3)
+    results = body["results"]
+    assert results[0]["matchRequest"]["status"] == "accepted"
+    assert results[1]["detail"] == results[2]["detail"] == "Match request not found"
+    assert results[3]["detail"] == "Match request already rejected"
+    assert main.match_request_store.get(others.id).status == "pending"
+
+
+def test_bulk_accept_allows_one_accepted_request_per_mentor(client, auth_headers):
+    first, second = seed_requests(user_id(MENTOR), user_id(MENTEE), 2)
+
+    body = post_bulk(client, auth_headers, [first.id, second.id], "accept").json()
+    assert [(item["id"], item["status"]) for item in body["results"]] == [(first.id, 200), (second.id, 400)]
+    assert body["results"][1]["detail"] == "Mentor has already accepted another match request"
+    assert main.match_request_store.get(second.id).status == "pending"
+
+
+def test_bulk_reject_after_accept(client, auth_headers):
+    accepted, pending = seed_requests(user_id(MENTOR), user_id(MENTEE), 2)
+    main.match_transition_engine.apply(accepted.id, user_id(MENTOR), "accept")
+
+    body = post_bulk(client, auth_headers, [accepted.id, pending.id], "reject").json()
+    assert [(item["id"], item["status"]) for item in body["results"]] == [(accepted.id, 400), (pending.id, 200)]
+
+
+def test_single_accept_maps_mentor_already_matched_to_400(client, auth_headers):
+    first, second = seed_requests(user_id(MENTOR), user_id(MENTEE), 2)
+
+    assert client.put(f"/api/match-requests/{first.id}/accept", headers=auth_headers(MENTOR)).status_code == 200
+    response = client.put(f"/api/match-requests/{second.id}/accept", headers=auth_headers(MENTOR))
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Mentor has already accepted another match request"
+
+
+def test_bulk_is_mentor_only(client, auth_headers):
+    (match_request,) = seed_requests(user_id(MENTOR), user_id(MENTEE), 1)
+
+    response = post_bulk(client, auth_headers, [match_request.id], "accept", email=MENTEE)
+    assert response.status_code == 403
+    assert main.match_request_store.get(match_request.id).status == "pending"
+
+
+def test_bulk_rejects_unknown_action(client, auth_headers):
+    (match_request,) = seed_requests(user_id(MENTOR), user_id(MENTEE), 1)
+
+    response = post_bulk(client, auth_headers, [match_request.id], "cancel")
+    assert response.status_code == 400
+    assert response.json()["detail"] == "action must be 'accept' or 'reject'"
+
+
+def post_match_request(client, auth_headers, mentor_email, mentee_email=MENTEE):
+    payload = {"mentorId": user_id(mentor_email), "menteeId": user_id(mentee_email), "message": "멘토링 요청드립니다!"}
+    return client.post("/api/match-requests", json=payload, headers=auth_headers(mentee_email))
+
+
+def test_duplicate_pending_request_is_rejected(client, auth_headers):
+    assert post_match_request(client, auth_headers, MENTOR).status_code == 200
+
+    response = post_match_request(client, auth_headers, MENTOR)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Match request to this mentor is already pending"
+    assert main.match_request_store.pending_count(user_id(MENTEE)) == 1
+
+
+def test_pending_limit_is_enforced(client, auth_headers):
+    limit = main.MAX_PENDING_MATCH_REQUESTS
+    mentors = [f"mentor{i}@example.com" for i in range(1, limit + 2)]
+    for mentor in mentors[:limit]:
+        assert post_match_request(client, auth_headers, mentor).status_code == 200
+
+    response = post_match_request(client, auth_headers, mentors[limit])
+    assert response.status_code == 400
+    assert response.json()["detail"] == f"Too many pending match requests (max {limit})"
+
+
+def test_new_request_allowed_after_reject_or_cancel(client, auth_headers):
+    first = post_match_request(client, auth_headers, MENTOR).json()
+    assert client.put(f"/api/match-requests/{first['id']}/reject", headers=auth_headers(MENTOR)).status_code == 200
+
+    second = post_match_request(client, auth_headers, MENTOR)
+    assert second.status_code == 200
+    assert client.delete(f"/api/match-requests/{second.json()['id']}", headers=auth_headers(MENTEE)).status_code == 200
+
+    assert post_match_request(client, auth_headers, MENTOR).status_code == 200
@@ -0,0 +1,219 @@
+"""
+MatchRequestStore 단위 테스트 (인덱스, 변경 로그, 대기 중 요청 카운터)
+"""
+
+import pytest
+
+from records import MatchRequest
+from store import DuplicateMatchRequestError, MatchRequestStore, PendingLimitError
+
+
+def make_request(mentor_id: int = 1, mentee_id: int = 2, status: str = "pending", request_id=None, version: int = 0):
+    return MatchRequest(id=request_id, mentorId=mentor_id, menteeId=mentee_id, message="멘토링 요청드립니다!", status=status, version=version)
+
+
+def add_request(store: MatchRequestStore, match_request, max_pending=None):
+    store.add(match_request, max_pending=max_pending)
+    return match_request
+
+
+def ids(match_requests):
+    return [match_request.id for match_request in match_requests]
+
+
+def test_indexes_by_mentor_mentee_and_status():
+    store = MatchRequestStore()
+    first = add_request(store, make_request(mentor_id=1, mentee_id=2))
+    second = add_request(store, make_request(mentor_id=1, mentee_id=3, status="rejected"))
+    third = add_request(store, make_request(mentor_id=4, mentee_id=2))
+
+    assert ids(store.by_mentor(1)) == [first.id, second.id]
+    assert ids(store.by_mentee(2)) == [first.id, third.id]
+    assert ids(store.by_status("pending")) == [first.id, third.id]
+    assert store.count_by_status("rejected") == 1
+    assert store.by_mentor(99) == []
+    assert store.get(second.id) is second
+
+
+def test_set_status_moves_request_between_status_indexes():
+    store = MatchRequestStore()
+    match_request = add_request(store, make_request())
+
+    store.set_status(match_request, "accepted")
+
+    assert match_request.status == "accepted"
+    assert store.count_by_status("pending") == 0
+    assert ids(store.by_status("accepted")) == [match_request.id]
+    # 멘토/멘티 인덱스는 그대로
+    assert ids(store.by_mentor(1)) == [match_request.id]
+
+
+def test_reinserting_an_id_replaces_its_index_entries():
+    store = MatchRequestStore()
+    store.load([make_request(request_id=1, mentor_id=1, status="pending")])
+    store.load([make_request(request_id=1, mentor_id=5, status="rejected")])
+
+    assert store.by_mentor(1) == []
+    assert ids(store.by_mentor(5)) == [1]
+    assert ids(store.by_mentee(2)) == [1]
+    assert store.count_by_status("pending") == 0
+    assert store.count_by_status("rejected") == 1
+    assert store.changed_for_mentor(1, 0) == []
+
+
+def test_by_mentor_pages_after_id():
+    store = MatchRequestStore()
+    requests = [add_request(store, make_request(mentee_id=mentee_id)) for mentee_id in range(2, 7)]
+
+    assert ids(store.by_mentor(1, limit=2)) == ids(requests[:2])
+    assert ids(store.by_mentor(1, after_id=requests[1].id, limit=2)) == ids(requests[2:4])
+    assert ids(store.by_mentee(2, after_id=requests[0].id)) == []
+
+
+def test_add_assigns_increasing_versions():
+    store = MatchRequestStore()
+    first = add_request(store, make_request())
+    second = add_request(store, make_request(mentee_id=3))
+
+    assert (first.id, second.id) == (1, 2)
+    assert first.version < second.version == store.version
+
+
+def test_changed_returns_only_changes_after_since_in_version_order():
+    store = MatchRequestStore()
+    first = add_request(store, make_request())
+    second = add_request(store, make_request(mentee_id=3))
+    third = add_request(store, make_request(mentor_id=9))
+    since = store.version
+
+    assert store.changed_for_mentor(1, since) == []
+
+    # 먼저 추가된 요청이 나중에 바뀌면 로그 맨 뒤로 이동
+    store.set_status(first, "accepted")
+    assert ids(store.changed_for_mentor(1, since)) == [first.id]
+    assert ids(store.changed_for_mentor(1, 0)) == [second.id, first.id]
+    assert ids(store.changed_for_mentee(2, since)) == [first.id]
+    assert store.changed_for_mentee(3, since) == []
+    # 다른 멘토의 변경은 보이지 않음
+    assert ids(store.changed_for_mentor(9, 0)) == [third.id]
+
+
+def test_changed_limit_returns_oldest_changes_first():
+    store = MatchRequestStore()
+    requests = [add_request(store, make_request(mentee_id=mentee_id)) for mentee_id in range(2, 7)]
+
+    page = store.changed_for_mentor(1, 0, limit=2)
+    assert ids(page) == ids(requests[:2])
+    assert ids(store.changed_for_mentor(1, page[-1].version, limit=2)) == ids(requests[2:4])
+
+
+def test_set_status_to_same_status_does_not_bump_version():
+    store = MatchRequestStore()
+    match_request = add_request(store, make_request(status="cancelled"))
+    version = store.version
+
+    store.set_status(match_request, "cancelled")
+    assert store.version == version
+
+
+def test_clear_starts_a_new_epoch():
+    store = MatchRequestStore()
+    add_request(store, make_request())
+    epoch, version = store.sync_state()
+    assert version == 1
+
+    store.clear()
+    new_epoch, new_version = store.sync_state()
+    assert new_epoch != epoch
+    assert new_version == 0
+    assert store.changed_for_mentor(1, 0) == []
+    # 같은 버전 번호가 다시 쓰이므로 epoch 없이는 구분할 수 없음
+    add_request(store, make_request())
+    assert store.sync_state() == (new_epoch, 1)
+
+
+def test_each_store_has_its_own_epoch():
+    assert MatchRequestStore().sync_state()[0] != MatchRequestStore().sync_state()[0]
+
+
+def test_load_keeps_persisted_versions_and_versions_legacy_rows():
+    store = MatchRequestStore()
+    store.load([
+        make_request(request_id=1, version=5),
+        make_request(request_id=2, mentee_id=3, version=3),
+        # 버전 컬럼이 없던 이전 데이터
+        make_request(request_id=3, mentee_id=4, version=0),
+    ])
+
+    assert store.version == 6
+    assert store.get(3).version == 6
+    assert ids(store.changed_for_mentor(1, 0)) == [2, 1, 3]
+    assert ids(store.changed_for_mentor(1, 4)) == [1, 3]
+
+
+def test_pending_counters_follow_add_and_set_status():
+    store = MatchRequestStore()
+    first = add_request(store, make_request(mentor_id=1))
+    second = add_request(store, make_request(mentor_id=3))
+    add_request(store, make_request(mentor_id=4, status="rejected"))
+
+    assert store.has_pending(2, 1) and store.has_pending(2, 3)
+    assert not store.has_pending(2, 4)
+    assert store.pending_count(2) == 2
+
+    store.set_status(first, "accepted")
+    assert not store.has_pending(2, 1)
+    assert store.pending_count(2) == 1
+
+    store.set_status(second, "cancelled")
+    assert store.pending_count(2) == 0
+    assert store.has_accepted(1)
+    assert not store.has_accepted(3)
+
+
+def test_pending_counters_follow_load_and_clear():
+    store = MatchRequestStore()
+    store.load([
+        make_request(request_id=1, mentor_id=1),
+        make_request(request_id=2, mentor_id=3),
+        make_request(request_id=3, mentor_id=4, status="accepted"),
+    ])
+    assert store.pending_count(2) == 2
+    assert store.has_accepted(4)
+
+    # 같은 id를 다른 상태로 다시 읽으면 이전 상태의 카운트는 빠져야 함
+    store.load([make_request(request_id=1, mentor_id=1, status="rejected")])
+    assert not store.has_pending(2, 1)
+    assert store.pending_count(2) == 1
+
+    store.clear()
+    assert store.pending_count(2) == 0
+    assert not store.has_pending(2, 3)
+    assert not store.has_accepted(4)
+
+
+def test_add_with_max_pending_rejects_duplicate_and_over_limit():
+    store = MatchRequestStore()
+    add_request(store, make_request(mentor_id=1), max_pending=2)
+
+    with pytest.raises(DuplicateMatchRequestError):
+        add_request(store, make_request(mentor_id=1), max_pending=2)
+    add_request(store, make_request(mentor_id=3), max_pending=2)
+    with pytest.raises(PendingLimitError):
+        add_request(store, make_request(mentor_id=4), max_pending=2)
+
+    # 실패한 add는 저장소를 바꾸지 않음
+    assert len(store.by_mentee(2)) == 2
+    assert store.pending_count(2) == 2
+    # 대기 중이 아닌 요청이나 다른 멘티는 제한 대상이 아님
+    add_request(store, make_request(mentor_id=1, status="rejected"), max_pending=2)
+    add_request(store, make_request(mentor_id=1, mentee_id=5), max_pending=2)
+
+
+def test_add_with_max_pending_allows_new_request_after_reject():
+    store = MatchRequestStore()
+    first = add_request(store, make_request(mentor_id=1), max_pending=1)
+    store.set_status(first, "rejected")
+
+    add_request(store, make_request(mentor_id=1), max_pending=1)
+    assert store.pending_count(2) == 1
@@ -0,0 +1,192 @@
+"""
+MatchTransitionEngine 단위 테스트 (전이 결과, 알림, 동시 전이)
+"""
+
+import threading
+
+import pytest
+
+from match_transitions import FORBIDDEN, INVALID_STATE, MENTOR_ALREADY_MATCHED, NOT_FOUND, OK, MatchTransitionEngine
+from records import MatchRequest
+from store import MatchRequestStore
+
+MENTOR_ID = 1
+MENTEE_ID = 2
+
+
+def make_engine(*statuses: str):
+    """요청 id 1, 2, ...가 주어진 상태인 저장소 + 엔진 (알림은 notified에 기록)"""
+    store = MatchRequestStore()
+    store.load(
+        MatchRequest(id=i, mentorId=MENTOR_ID, menteeId=MENTEE_ID, message="멘토링 요청드립니다!", status=status)
+        for i, status in enumerate(statuses, start=1)
+    )
+    notified = []
+    engine = MatchTransitionEngine(store, on_transition=lambda match_request, status: notified.append((match_request.id, status)))
+    return store, engine, notified
+
+
+@pytest.mark.parametrize("action, actor_id, new_status", [
+    ("accept", MENTOR_ID, "accepted"),
+    ("reject", MENTOR_ID, "rejected"),
+    ("cancel", MENTEE_ID, "cancelled"),
+])
+def test_pending_request_transitions(action, actor_id, new_status):
+    store, engine, notified = make_engine("pending")
+
+    result = engine.apply(1, actor_id, action)
+
+    assert result.ok
+    assert result.previous_status == "pending"
+    assert store.get(1).status == new_status
+    assert store.count_by_status("pending") == 0
+    assert store.count_by_status(new_status) == 1
+    assert notified == [(1, new_status)]
+
+
+def test_unknown_request_is_not_found():
+    _, engine, notified = make_engine("pending")
+
+    result = engine.apply(99, MENTOR_ID, "accept")
+
+    assert result.outcome == NOT_FOUND
+    assert result.match_request is None
+    assert notified == []
+
+
+def test_apply_to_uses_the_given_request():
+    store, engine, notified = make_engine("pending")
+
+    assert engine.apply_to(store.get(1), MENTOR_ID, "accept").ok
+    assert store.get(1).status == "accepted"
+    assert engine.apply_to(None, MENTOR_ID, "reject").outcome == NOT_FOUND
+    assert notified == [(1, "accepted")]
+
+
+@pytest.mark.parametrize("action, actor_id", [
+    ("accept", MENTEE_ID),
+    ("reject", 99),
+    ("cancel", MENTOR_ID),
+])
+def test_other_users_are_forbidden(action, actor_id):
+    store, engine, notified = make_engine("pending")
+
+    result = engine.apply(1, actor_id, action)
+
+    assert result.outcome == FORBIDDEN
+    assert store.get(1).status == "pending"
+    assert notified == []
+
+
+@pytest.mark.parametrize("status, action, actor_id", [
+    ("accepted", "accept", MENTOR_ID),
+    ("accepted", "reject", MENTOR_ID),
+    ("rejected", "accept", MENTOR_ID),
+    ("cancelled", "reject", MENTOR_ID),
+    ("accepted", "cancel", MENTEE_ID),
+])
+def test_transitions_from_wrong_state_are_invalid(status, action, actor_id):
+    store, engine, notified = make_engine(status)
+    version = store.version
+
+    result = engine.apply(1, actor_id, action)
+
+    assert result.outcome == INVALID_STATE
+    assert result.previous_status == status
+    assert store.get(1).status == status
+    assert store.version == version
+    assert notified == []
+
+
+def test_cancel_of_rejected_or_cancelled_request_is_allowed():
+    store, engine, notified = make_engine("rejected", "cancelled")
+
+    assert engine.apply(1, MENTEE_ID, "cancel").ok
+    # 이미 취소된 요청의 재취소는 성공하지만 바뀐 게 없으므로 알리지 않음
+    result = engine.apply(2, MENTEE_ID, "cancel")
+    assert result.ok
+    assert result.previous_status == "cancelled"
+    assert notified == [(1, "cancelled")]
+
+
+def test_stats_count_outcomes():
+    _, engine, _ = make_engine("pending")
+    engine.apply(1, MENTOR_ID, "reject")
+    engine.apply(1, MENTOR_ID, "reject")
+    engine.apply(2, MENTOR_ID, "reject")
+    engine.apply(1, MENTEE_ID, "reject")
+
+    stats = engine.stats()
+    assert (stats[OK], stats[INVALID_STATE], stats[NOT_FOUND], stats[FORBIDDEN]) == (1, 1, 1, 1)
+
+
+def test_concurrent_conflicting_transitions_apply_once():
+    count = 200
+    store, engine, notified = make_engine(*["pending"] * count)
+    wins = []
+    start = threading.Barrier(4)
+
+    def worker(action: str, actor_id: int):
+        start.wait()
+        for request_id in range(1, count + 1):
+            if engine.apply(request_id, actor_id, action).ok:
+                wins.append(request_id)
+
+    threads = [
+        threading.Thread(target=worker, args=("reject", MENTOR_ID)),
+        threading.Thread(target=worker, args=("reject", MENTOR_ID)),
+        threading.Thread(target=worker, args=("cancel", MENTEE_ID)),
+        threading.Thread(target=worker, args=("cancel", MENTEE_ID)),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 거절된 요청은 멘티가 다시 취소할 수 있으므로 요청마다 최소 1번, 최대 (거절 1 + 취소 2)번 성공
+    assert set(wins) == set(range(1, count + 1))
+    assert store.count_by_status("pending") == 0
+    # 상태가 실제로 바뀐 전이만 알림 - 거절 두 번이 모두 성공하는 일은 없음
+    rejected_twice = [request_id for request_id in range(1, count + 1) if notified.count((request_id, "rejected")) > 1]
+    assert rejected_twice == []
+
+
+def test_mentor_can_accept_only_one_request():
+    store, engine, notified = make_engine("pending", "pending")
+
+    assert engine.apply(1, MENTOR_ID, "accept").ok
+    result = engine.apply(2, MENTOR_ID, "accept")
+
+    assert result.outcome == MENTOR_ALREADY_MATCHED
+    assert store.get(2).status == "pending"
+    assert notified == [(1, "accepted")]
+    assert engine.stats()[MENTOR_ALREADY_MATCHED] == 1
+    # 거절은 계속 가능
+    assert engine.apply(2, MENTOR_ID, "reject").ok
+
+
+def test_loaded_accepted_request_blocks_accept():
+    _, engine, _ = make_engine("accepted", "pending")
+
+    assert engine.apply(2, MENTOR_ID, "accept").outcome == MENTOR_ALREADY_MATCHED
+
+
+def test_concurrent_accepts_by_one_mentor_accept_one_request():
+    count = 50
+    store, engine, notified = make_engine(*["pending"] * count)
+    start = threading.Barrier(count)
+
+    def worker(request_id: int):
+        start.wait()
+        engine.apply(request_id, MENTOR_ID, "accept")
+
+    threads = [threading.Thread(target=worker, args=(request_id,)) for request_id in range(1, count + 1)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert store.count_by_status("accepted") == 1
+    assert store.count_by_status("pending") == count - 1
+    assert len(notified) == 1
+    assert engine.stats()[MENTOR_ALREADY_MATCHED] == count - 1
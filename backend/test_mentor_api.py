@@ -0,0 +1,108 @@
+"""
+멘토 목록 API 테스트 (TestClient, 프로세스 안에서 실행)
+"""
+
+import main
+from pagination import NEXT_CURSOR_HEADER
+
+# seed_data.json 사용자
+MENTOR = "mentor1@example.com"
+MENTEE = "mentee1@example.com"
+
+
+def get_mentors(app_client, auth_headers, **params):
+    response = app_client.get("/api/mentors", params=params, headers=auth_headers(MENTEE))
+    assert response.status_code == 200, response.text
+    return response
+
+
+def test_mentor_list_is_mentee_only(app_client, auth_headers):
+    response = app_client.get("/api/mentors", headers=auth_headers(MENTOR))
+    assert response.status_code == 403
+
+
+def test_mentor_list_is_served_from_cache(app_client, auth_headers):
+    first = get_mentors(app_client, auth_headers, order_by="name")
+    hits = main.mentor_list_cache.stats()["hits"]
+
+    second = get_mentors(app_client, auth_headers, order_by="name")
+    assert main.mentor_list_cache.stats()["hits"] == hits + 1
+    assert second.content == first.content
+
+
+def test_mentor_profile_change_bumps_cache_version(app_client, auth_headers, signup):
+    mentor, headers = signup(role="mentor", name="캐시멘토")
+    get_mentors(app_client, auth_headers)
+    version = main.mentor_list_cache.version
+
+    response = app_client.put(
+        "/api/profile",
+        headers=headers,
+        json={"id": mentor["id"], "name": "바뀐멘토", "role": "mentor", "bio": "", "skills": ["Go"]}
+    )
+    assert response.status_code == 200
+    assert main.mentor_list_cache.version > version
+
+    names = {item["id"]: item["profile"]["name"] for item in get_mentors(app_client, auth_headers).json()}
+    assert names[mentor["id"]] == "바뀐멘토"
+
+
+def test_mentee_profile_change_keeps_cache_version(app_client, auth_headers, signup):
+    mentee, headers = signup(role="mentee")
+    version = main.mentor_list_cache.version
+
+    response = app_client.put(
+        "/api/profile",
+        headers=headers,
+        json={"id": mentee["id"], "name": "바뀐멘티", "role": "mentee", "bio": ""}
+    )
+    assert response.status_code == 200
+    assert main.mentor_list_cache.version == version
+
+
+def test_skill_filter_ignores_case(app_client, auth_headers):
+    mentors = get_mentors(app_client, auth_headers, skill="REACT").json()
+
+    assert main.get_user_by_email(MENTOR).id in {mentor["id"] for mentor in mentors}
+    assert all("react" in [skill.lower() for skill in mentor["profile"]["skills"]] for mentor in mentors)
+
+
+def test_mentor_skill_match(app_client, auth_headers):
+    def mentor_ids(**params):
+        return {mentor["id"] for mentor in get_mentors(app_client, auth_headers, **params).json()}
+
+    any_ids = mentor_ids(skill="React,Vue")
+    all_ids = mentor_ids(skill="React,Vue", skill_match="all")
+    assert main.get_user_by_email(MENTOR).id in all_ids
+    assert all_ids <= any_ids
+
+
+def test_mentor_skill_match_rejects_unknown_value(app_client, auth_headers):
+    response = app_client.get("/api/mentors", params={"skill": "React", "skill_match": "bogus"}, headers=auth_headers(MENTEE))
+    assert response.status_code == 400
+
+
+def test_mentor_cursor_from_other_ordering_is_rejected(app_client, auth_headers):
+    cursor = get_mentors(app_client, auth_headers, limit=1, order_by="name").headers[NEXT_CURSOR_HEADER]
+
+    response = app_client.get("/api/mentors", params={"limit": 1, "order_by": "skill", "cursor": cursor}, headers=auth_headers(MENTEE))
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_mentor_cursor_pages_match_full_list(app_client, auth_headers):
+    full = get_mentors(app_client, auth_headers, order_by="name").json()
+
+    paged = []
+    cursor = None
+    while True:
+        params = {"limit": 2, "order_by": "name"}
+        if cursor:
+            params["cursor"] = cursor
+        response = get_mentors(app_client, auth_headers, **params)
+        paged.extend(response.json())
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if not cursor:
+            break
+
+    assert [mentor["id"] for mentor in paged] == [mentor["id"] for mentor in full]
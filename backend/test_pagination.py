@@ -0,0 +1,54 @@
+"""
+pagination.py 단위 테스트 (커서, 동기화 토큰 인코딩/디코딩)
+"""
+
+import pytest
+
+from pagination import decode_cursor, decode_sync_token, encode_cursor, encode_sync_token
+
+
+@pytest.mark.parametrize("ordering, key", [
+    ("id", (42,)),
+    ("name", ("김프론트", 3)),
+    ("skill", ((0, "react"), 7)),
+    ("skill", ((1, ""), 9)),
+])
+def test_cursor_round_trip(ordering, key):
+    cursor = encode_cursor(ordering, key)
+    assert "=" not in cursor
+    assert decode_cursor(cursor, ordering) == key
+
+
+@pytest.mark.parametrize("cursor", [
+    "not-base64!",
+    "e30",  # {}
+    "W10",  # []
+    "eyJvIjoiaWQiLCJrIjoxfQ",  # {"o":"id","k":1} - 키가 리스트가 아님
+    "",
+])
+def test_decode_cursor_rejects_malformed(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, "id")
+
+
+def test_decode_cursor_rejects_other_ordering():
+    cursor = encode_cursor("name", ("alice", 1))
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, "id")
+
+
+def test_sync_token_round_trip():
+    token = encode_sync_token("3f9a01bc", 42)
+    assert token == "3f9a01bc.42"
+    assert decode_sync_token(token) == ("3f9a01bc", 42)
+
+
+def test_sync_token_without_epoch_decodes_to_empty_epoch():
+    # 이전 형식(버전만) - 어떤 저장소 epoch와도 같지 않으므로 전체 목록이 됨
+    assert decode_sync_token("10") == ("", 10)
+
+
+@pytest.mark.parametrize("token", ["", "abc.", "abc.x", "abc.-1", "abc.1.5x"])
+def test_decode_sync_token_rejects_malformed(token):
+    with pytest.raises(ValueError):
+        decode_sync_token(token)
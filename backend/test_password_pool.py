@@ -0,0 +1,113 @@
+"""
+PasswordPool 테스트 (bcrypt 대신 멈춰 둘 수 있는 가짜 해셔 사용)
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from password_pool import PasswordPool, PasswordPoolBusyError
+
+
+class BlockingContext:
+    """release 이벤트가 설정될 때까지 해싱을 멈추는 pwd_context 대역"""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.started = threading.Event()
+
+    def hash(self, password: str) -> str:
+        self.started.set()
+        self.release.wait(5)
+        if password == "fail":
+            raise ValueError("hash failed")
+        return f"hashed:{password}"
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return hashed_password == f"hashed:{plain_password}"
+
+
+@pytest.fixture
+def context():
+    context = BlockingContext()
+    yield context
+    context.release.set()
+
+
+def make_pool(context, max_workers: int = 1, max_pending: int = 1):
+    return PasswordPool(context, max_workers=max_workers, max_pending=max_pending)
+
+
+async def wait_for(predicate):
+    for _ in range(500):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not reached")
+
+
+def test_completed_and_failed_jobs_are_counted(context):
+    pool = make_pool(context)
+    context.release.set()
+
+    async def scenario():
+        assert await pool.hash("secret") == "hashed:secret"
+        assert await pool.verify("secret", "hashed:secret")
+        with pytest.raises(ValueError):
+            await pool.hash("fail")
+
+    try:
+        asyncio.run(scenario())
+        stats = pool.stats()
+        assert (stats["completed"], stats["failed"], stats["cancelled"], stats["in_flight"]) == (2, 1, 0, 0)
+    finally:
+        pool.shutdown()
+
+
+def test_saturated_pool_rejects_new_jobs(context):
+    pool = make_pool(context, max_workers=1, max_pending=1)
+
+    async def scenario():
+        running = asyncio.ensure_future(pool.hash("a"))
+        queued = asyncio.ensure_future(pool.hash("b"))
+        await wait_for(lambda: pool.stats()["in_flight"] == 2)
+        with pytest.raises(PasswordPoolBusyError):
+            await pool.hash("c")
+        context.release.set()
+        assert await asyncio.gather(running, queued) == ["hashed:a", "hashed:b"]
+
+    try:
+        asyncio.run(scenario())
+        stats = pool.stats()
+        assert (stats["completed"], stats["rejected"], stats["in_flight"]) == (2, 1, 0)
+    finally:
+        pool.shutdown()
+
+
+def test_cancelled_running_job_stays_in_flight_until_it_finishes(context):
+    pool = make_pool(context, max_workers=1, max_pending=1)
+
+    async def scenario():
+        running = asyncio.ensure_future(pool.hash("a"))
+        queued = asyncio.ensure_future(pool.hash("b"))
+        await wait_for(lambda: context.started.is_set() and pool.stats()["in_flight"] == 2)
+
+        # 클라이언트 연결이 끊긴 경우처럼 두 요청 모두 취소
+        running.cancel()
+        queued.cancel()
+        await asyncio.gather(running, queued, return_exceptions=True)
+
+        # 시작 전이던 작업은 바로 빠지지만, 실행 중인 작업은 워커 스레드를 계속 점유하므로 남아 있어야 함
+        await wait_for(lambda: pool.stats()["cancelled"] == 1)
+        assert pool.stats()["in_flight"] == 1
+
+        context.release.set()
+        await wait_for(lambda: pool.stats()["in_flight"] == 0)
+
+    try:
+        asyncio.run(scenario())
+        stats = pool.stats()
+        assert (stats["completed"], stats["cancelled"]) == (1, 1)
+    finally:
+        pool.shutdown()
@@ -0,0 +1,46 @@
+"""
+도메인 레코드(__slots__ 클래스) 테스트
+"""
+
+import sys
+
+import pytest
+
+from records import MatchRequest, User, UserProfile
+
+
+def test_records_have_no_instance_dict():
+    user = User(id=1, email="a@example.com", role="mentor", profile=UserProfile(name="김"), hashed_password="x")
+
+    assert not hasattr(user, "__dict__")
+    with pytest.raises(AttributeError):
+        user.nickname = "kim"
+
+
+def test_user_from_backend_row():
+    user = User.from_dict({
+        "id": 3,
+        "email": "a@example.com",
+        "role": "mentor",
+        "profile": {"name": "김", "bio": "소개", "imageUrl": None, "skills": ["React"]},
+        "hashed_password": "x"
+    })
+
+    assert (user.id, user.role, user.profile.name, user.profile.skills) == (3, "mentor", "김", ["React"])
+
+
+def test_match_request_from_backend_row():
+    match_request = MatchRequest.from_dict({"id": 1, "mentorId": 2, "menteeId": 3, "message": "안녕하세요", "status": "pending", "version": 7})
+    assert match_request.version == 7
+
+    assert (match_request.id, match_request.mentorId, match_request.menteeId) == (1, 2, 3)
+
+
+def test_role_and_status_strings_are_shared():
+    # 실행 중에 만들어진 문자열도 intern된 같은 객체로 바뀜
+    role = "".join(["men", "tor"])
+    status = "".join(["pend", "ing"])
+    profile = UserProfile(name="김")
+
+    assert User(id=1, email="a", role=role, profile=profile, hashed_password="x").role is sys.intern("mentor")
+    assert MatchRequest(id=1, mentorId=1, menteeId=2, message="", status=status).status is sys.intern("pending")
@@ -0,0 +1,36 @@
+"""
+VersionedResponseCache 테스트
+"""
+
+from response_cache import VersionedResponseCache
+
+
+def test_bump_invalidates_cached_bodies():
+    cache = VersionedResponseCache()
+    cache.put("mentors", b"[1]", cache.version)
+    assert cache.get("mentors") == b"[1]"
+
+    cache.bump()
+    assert cache.get("mentors") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_put_with_stale_version_is_ignored():
+    cache = VersionedResponseCache()
+    # 응답을 만드는 도중 데이터가 바뀐 경우
+    version = cache.version
+    cache.bump()
+    cache.put("mentors", b"[old]", version)
+
+    assert cache.get("mentors") is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = VersionedResponseCache(max_entries=2)
+    cache.put("a", b"a", cache.version)
+    cache.put("b", b"b", cache.version)
+    cache.get("a")
+    cache.put("c", b"c", cache.version)
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (b"a", b"c")
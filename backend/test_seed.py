@@ -0,0 +1,39 @@
+"""
+테스트 데이터(seed) 로더 테스트
+"""
+
+import os
+
+from passlib.context import CryptContext
+
+from seed import ensure_password_hashes, load_seed_users
+
+SEED_DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "seed_data.json")
+
+
+def test_fixture_users_carry_precomputed_hashes():
+    users = load_seed_users(SEED_DATA_PATH)
+
+    assert len(users) == 9
+    assert {user["role"] for user in users} == {"mentor", "mentee"}
+    # 시작 시 해싱이 필요 없도록 모든 항목에 해시가 있어야 함
+    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    assert all(pwd_context.verify("password123", user["hashed_password"]) for user in users)
+
+
+def test_ensure_password_hashes_only_hashes_missing_entries():
+    users = [
+        {"email": "a@example.com", "hashed_password": "precomputed"},
+        {"email": "b@example.com", "password": "secret"},
+        {"email": "c@example.com", "password": "other", "hashed_password": ""},
+    ]
+    hashed = []
+
+    def hash_func(password):
+        hashed.append(password)
+        return f"hashed:{password}"
+
+    ensure_password_hashes(users, hash_func, max_workers=2)
+
+    assert sorted(hashed) == ["other", "secret"]
+    assert [user["hashed_password"] for user in users] == ["precomputed", "hashed:secret", "hashed:other"]
@@ -0,0 +1,109 @@
+"""
+SQLite 저장소 백엔드 테스트 (같은 DB 파일을 쓰는 워커 두 개를 저장소 두 개로 흉내냄)
+"""
+
+import sqlite3
+
+import pytest
+
+from records import MatchRequest, User, UserProfile
+from storage import SQLiteBackend
+from store import DuplicateEmailError, MatchRequestStore, UserStore
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "mentor.db")
+
+
+@pytest.fixture
+def backends(db_path):
+    first, second = SQLiteBackend(db_path), SQLiteBackend(db_path)
+    yield first, second
+    first.close()
+    second.close()
+
+
+def make_user(email: str, role: str = "mentee", skills=None):
+    return User(id=None, email=email, role=role, profile=UserProfile(name="테스트", skills=skills), hashed_password="x")
+
+
+def make_request(mentee_id: int):
+    return MatchRequest(id=None, mentorId=1, menteeId=mentee_id, message="멘토링 요청드립니다!", status="pending")
+
+
+def add(store, record):
+    store.add(record)
+    return record
+
+
+def test_database_is_in_wal_mode(backends, db_path):
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_users_round_trip_through_another_connection(backends):
+    store = UserStore(backend=backends[0])
+    mentor = add(store, make_user("Mentor@Example.com", role="mentor", skills=["React", "Vue"]))
+    mentee = add(store, make_user("mentee@example.com"))
+
+    rows = backends[1].load_users()
+    assert [row["id"] for row in rows] == [mentor.id, mentee.id]
+    assert rows[0]["email"] == "Mentor@Example.com"
+    assert rows[0]["profile"]["skills"] == ["React", "Vue"]
+    assert rows[1]["profile"]["skills"] is None
+
+    store.remove(mentee.id)
+    assert [row["id"] for row in backends[1].load_users()] == [mentor.id]
+
+
+def test_status_change_updates_existing_row(backends):
+    store = MatchRequestStore(backend=backends[0])
+    match_request = add(store, make_request(2))
+    store.set_status(match_request, "rejected")
+
+    (row,) = backends[1].load_match_requests()
+    assert (row["id"], row["status"], row["version"]) == (match_request.id, "rejected", match_request.version)
+
+
+def test_clear_deletes_persisted_rows(backends):
+    store = MatchRequestStore(backend=backends[0])
+    add(store, make_request(2))
+    store.clear()
+
+    assert backends[1].load_match_requests() == []
+
+
+def test_match_request_ids_are_assigned_by_the_database(backends):
+    stores = [MatchRequestStore(backend=backend) for backend in backends]
+    added = []
+    for mentee_id in range(2, 8):
+        match_request = make_request(mentee_id)
+        stores[mentee_id % 2].add(match_request)
+        added.append(match_request)
+
+    # 워커마다 메모리 카운터를 쓰면 1, 1, 2, 2, ...가 되어 서로 덮어씀
+    assert [match_request.id for match_request in added] == list(range(1, 7))
+    rows = backends[0].load_match_requests()
+    assert [(row["id"], row["menteeId"]) for row in rows] == [(mr.id, mr.menteeId) for mr in added]
+
+
+def test_user_ids_are_assigned_by_the_database(backends):
+    first, second = (UserStore(backend=backend) for backend in backends)
+    alice, bob = make_user("alice@example.com"), make_user("bob@example.com")
+    first.add(alice)
+    second.add(bob)
+
+    assert (alice.id, bob.id) == (1, 2)
+    assert [row["email"] for row in backends[0].load_users()] == ["alice@example.com", "bob@example.com"]
+
+
+def test_duplicate_email_from_another_worker_is_rejected(backends):
+    first, second = (UserStore(backend=backend) for backend in backends)
+    first.add(make_user("alice@example.com"))
+
+    # 다른 워커의 메모리 인덱스에는 없지만 DB의 unique 인덱스에 걸림 (대소문자 무시)
+    with pytest.raises(DuplicateEmailError):
+        second.add(make_user(" Alice@Example.com"))
+    assert len(second) == 0
+    assert len(backends[1].load_users()) == 1
@@ -0,0 +1,62 @@
+"""
+썸네일 포맷 협상 / 생성 테스트
+"""
+
+import io
+import os
+
+import pytest
+from PIL import Image
+
+from thumbnails import is_thumbnail_fresh, negotiate_format, render_thumbnail, thumbnail_path
+
+
+@pytest.mark.parametrize("accept, expected", [
+    (None, "png"),
+    ("", "png"),
+    ("image/png,*/*", "png"),
+    ("image/avif,image/webp,*/*", "webp"),
+    ("IMAGE/WEBP;q=0.8", "webp"),
+    ("image/webp;q=0", "png"),
+    ("image/webp;q=abc", "png"),
+])
+def test_negotiate_format(accept, expected):
+    assert negotiate_format(accept) == expected
+
+
+def test_thumbnail_path_sits_next_to_source():
+    assert thumbnail_path("images/mentor/3.jpg", 64, "webp") == "images/mentor/3_64.webp"
+
+
+def image_bytes(size, color="red", fmt="PNG") -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color).save(buffer, fmt)
+    return buffer.getvalue()
+
+
+def test_render_thumbnail_fits_size():
+    body = render_thumbnail(image_bytes((500, 250)), 128, "png")
+
+    with Image.open(io.BytesIO(body)) as thumbnail:
+        assert (thumbnail.format, thumbnail.size) == ("PNG", (128, 64))
+
+
+def test_render_thumbnail_encodes_webp():
+    body = render_thumbnail(image_bytes((300, 300), "blue", "JPEG"), 64, "webp")
+
+    with Image.open(io.BytesIO(body)) as thumbnail:
+        assert (thumbnail.format, thumbnail.size) == ("WEBP", (64, 64))
+        assert thumbnail.convert("RGB").getpixel((32, 32))[2] > 200
+
+
+def test_thumbnail_is_fresh_only_when_not_older_than_source(tmp_path):
+    path = tmp_path / "1_64.png"
+    path.write_bytes(b"x")
+    os.utime(path, (100, 100))
+    thumbnail_stat = os.stat(path)
+
+    assert is_thumbnail_fresh(100, thumbnail_stat)
+    assert is_thumbnail_fresh(50, thumbnail_stat)
+    # 원본이 다시 업로드됨
+    assert not is_thumbnail_fresh(200, thumbnail_stat)
+    assert not is_thumbnail_fresh(50, None)
@@ -0,0 +1,85 @@
+"""
+TokenCache 테스트 (시계는 가짜 time 모듈로 고정)
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+import token_cache
+from token_cache import TokenCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(token_cache, "time", SimpleNamespace(time=lambda: now[0]))
+    return now
+
+
+def user(user_id: int):
+    return SimpleNamespace(id=user_id)
+
+
+def test_entry_expires_after_ttl(clock):
+    cache = TokenCache(ttl_seconds=300)
+    cache.put("t", {"sub": "1"}, user(1))
+
+    clock[0] = 1299.0
+    assert cache.get("t")[1].id == 1
+    clock[0] = 1300.0
+    assert cache.get("t") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_token_exp_caps_the_ttl(clock):
+    cache = TokenCache(ttl_seconds=300)
+    cache.put("t", {"sub": "1", "exp": 1010}, user(1))
+
+    clock[0] = 1009.0
+    assert cache.get("t") is not None
+    # TTL이 남아 있어도 토큰 자체가 만료되면 캐시에서 꺼내지 않음
+    clock[0] = 1010.0
+    assert cache.get("t") is None
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = TokenCache(max_size=2)
+    cache.put("a", {}, user(1))
+    cache.put("b", {}, user(2))
+    cache.get("a")
+    cache.put("c", {}, user(3))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.stats()["size"] == 2
+
+
+def test_invalidate_user_drops_only_that_users_tokens(clock):
+    cache = TokenCache()
+    cache.put("a1", {}, user(1))
+    cache.put("a2", {}, user(1))
+    cache.put("b", {}, user(2))
+
+    cache.invalidate_user(1)
+
+    assert cache.get("a1") is None and cache.get("a2") is None
+    assert cache.get("b") is not None
+
+
+def test_profile_update_drops_cached_token(app_client, signup):
+    import main
+
+    mentee, headers = signup(role="mentee")
+    token = headers["Authorization"].split()[1]
+    assert app_client.get("/api/me", headers=headers).status_code == 200
+    assert main.token_cache.get(token) is not None
+
+    response = app_client.put(
+        "/api/profile",
+        headers=headers,
+        json={"id": mentee["id"], "name": "바뀐이름", "role": "mentee", "bio": ""}
+    )
+    assert response.status_code == 200
+    assert main.token_cache.get(token) is None
+    assert app_client.get("/api/me", headers=headers).json()["profile"]["name"] == "바뀐이름"
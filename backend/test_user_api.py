@@ -0,0 +1,40 @@
+"""
+회원가입 / 로그인 / 내 정보 API 테스트
+"""
+
+from conftest import SEED_PASSWORD
+
+
+def test_seed_user_can_log_in(app_client, auth_headers):
+    response = app_client.get("/api/me", headers=auth_headers("mentor1@example.com"))
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["email"], body["role"]) == ("mentor1@example.com", "mentor")
+    assert "React" in body["profile"]["skills"]
+
+
+def test_startup_time_is_reported(app_client):
+    stats = app_client.get("/api/debug/stats").json()
+
+    assert stats["startup_seconds"] is not None
+    assert stats["password_pool"]["in_flight"] == 0
+
+
+def test_signup_then_login(app_client, signup):
+    user, headers = signup(role="mentee", name="새멘티")
+
+    me = app_client.get("/api/me", headers=headers).json()
+    assert (me["id"], me["profile"]["name"]) == (user["id"], "새멘티")
+
+    wrong = app_client.post("/api/login", json={"email": user["email"], "password": "wrong"})
+    assert wrong.status_code == 401
+
+
+def test_signup_rejects_duplicate_email(app_client):
+    response = app_client.post(
+        "/api/signup",
+        json={"email": "MENTOR1@example.com", "password": SEED_PASSWORD, "name": "중복", "role": "mentor"}
+    )
+
+    assert response.status_code == 400
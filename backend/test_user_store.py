@@ -0,0 +1,164 @@
+"""
+UserStore 단위 테스트 (이메일/역할 인덱스, 스킬 역색인, 멘토 정렬 순서)
+"""
+
+from records import User, UserProfile
+from store import UserStore
+
+
+def make_user(email: str, role: str = "mentee", name: str = "테스트", skills=None):
+    return User(id=None, email=email, role=role, profile=UserProfile(name=name, skills=skills), hashed_password="x")
+
+
+def add_user(store: UserStore, email: str, role: str = "mentee", name: str = "테스트", skills=None):
+    user = make_user(email, role, name, skills)
+    store.add(user)
+    return user
+
+
+def ids(users):
+    return [user.id for user in users]
+
+
+def test_get_by_email_ignores_case_and_whitespace():
+    store = UserStore()
+    user = add_user(store, "Alice@Example.com")
+
+    assert store.get_by_email("alice@example.com") is user
+    assert store.get_by_email("  ALICE@EXAMPLE.COM ") is user
+    assert store.get_by_email("bob@example.com") is None
+    assert store.get(user.id) is user
+
+
+def test_by_role_lists_users_in_id_order():
+    store = UserStore()
+    mentee = add_user(store, "mentee@example.com")
+    first = add_user(store, "first@example.com", role="mentor")
+    second = add_user(store, "second@example.com", role="mentor")
+
+    assert ids(store.by_role("mentor")) == [first.id, second.id]
+    assert ids(store.by_role("mentee")) == [mentee.id]
+    assert store.by_role("admin") == []
+    assert len(store) == 3
+
+
+def test_update_moves_user_to_new_email_and_role():
+    store = UserStore()
+    user = add_user(store, "old@example.com")
+
+    user.email = "new@example.com"
+    user.role = "mentor"
+    store.update(user)
+
+    assert store.get_by_email("old@example.com") is None
+    assert store.get_by_email("new@example.com") is user
+    assert store.by_role("mentee") == []
+    assert ids(store.by_role("mentor")) == [user.id]
+
+
+def test_remove_drops_user_from_indexes():
+    store = UserStore()
+    user = add_user(store, "alice@example.com", role="mentor")
+
+    store.remove(user.id)
+
+    assert store.get(user.id) is None
+    assert store.get_by_email("alice@example.com") is None
+    assert store.by_role("mentor") == []
+
+
+def test_clear_resets_id_counter():
+    store = UserStore()
+    add_user(store, "alice@example.com")
+    store.clear()
+
+    assert len(store) == 0
+    assert add_user(store, "bob@example.com").id == 1
+
+
+def mentor_ids_with_skills(store: UserStore, skills, match_all: bool = False):
+    return store.mentor_ids_with_skills(skills, match_all)
+
+
+def test_skill_index_matches_any_or_all_skills():
+    store = UserStore()
+    react = add_user(store, "react@example.com", role="mentor", skills=["React", "JavaScript"])
+    fullstack = add_user(store, "full@example.com", role="mentor", skills=["react", "Node.js"])
+    add_user(store, "python@example.com", role="mentor", skills=["Python"])
+    # 멘티의 스킬은 색인하지 않음
+    add_user(store, "mentee@example.com", skills=["React"])
+
+    assert mentor_ids_with_skills(store, [" REACT "]) == {react.id, fullstack.id}
+    assert mentor_ids_with_skills(store, ["react", "node.js"]) == {react.id, fullstack.id}
+    assert mentor_ids_with_skills(store, ["react", "node.js"], match_all=True) == {fullstack.id}
+    assert mentor_ids_with_skills(store, ["go"]) == set()
+    assert mentor_ids_with_skills(store, [""]) == set()
+
+
+def test_skill_index_follows_updates_and_removal():
+    store = UserStore()
+    mentor = add_user(store, "mentor@example.com", role="mentor", skills=["React"])
+
+    mentor.profile.skills = ["Vue"]
+    store.update(mentor)
+    assert mentor_ids_with_skills(store, ["react"]) == set()
+    assert mentor_ids_with_skills(store, ["vue"]) == {mentor.id}
+
+    store.remove(mentor.id)
+    assert mentor_ids_with_skills(store, ["vue"]) == set()
+
+
+def test_mentor_orderings_stay_sorted_through_updates():
+    store = UserStore()
+    bob = add_user(store, "bob@example.com", role="mentor", name="Bob", skills=["Vue"])
+    alice = add_user(store, "alice@example.com", role="mentor", name="alice", skills=["React"])
+    nobody = add_user(store, "nobody@example.com", role="mentor", name="Carol", skills=[])
+    add_user(store, "mentee@example.com", name="Aaron")
+
+    assert ids(store.mentors_ordered()) == [bob.id, alice.id, nobody.id]
+    assert ids(store.mentors_ordered("name")) == [alice.id, bob.id, nobody.id]
+    # 스킬이 없는 멘토는 맨 뒤
+    assert ids(store.mentors_ordered("skill")) == [alice.id, bob.id, nobody.id]
+
+    bob.profile.name = "Zed"
+    nobody.profile.skills = ["Angular"]
+    store.update(bob)
+    store.update(nobody)
+    assert ids(store.mentors_ordered("name")) == [alice.id, nobody.id, bob.id]
+    assert ids(store.mentors_ordered("skill")) == [nobody.id, alice.id, bob.id]
+
+    store.remove(alice.id)
+    assert ids(store.mentors_ordered("name")) == [nobody.id, bob.id]
+
+
+def test_mentors_ordered_sorts_filtered_ids():
+    store = UserStore()
+    bob = add_user(store, "bob@example.com", role="mentor", name="Bob")
+    alice = add_user(store, "alice@example.com", role="mentor", name="Alice")
+    add_user(store, "carol@example.com", role="mentor", name="Carol")
+
+    assert ids(store.mentors_ordered("name", ids={bob.id, alice.id})) == [alice.id, bob.id]
+    # 알 수 없는 정렬 값은 id 순
+    assert ids(store.mentors_ordered("bogus", ids={bob.id, alice.id})) == [bob.id, alice.id]
+
+
+def test_mentors_ordered_pages_after_sort_key():
+    store = UserStore()
+    mentors = [add_user(store, f"m{i}@example.com", role="mentor", name=name) for i, name in enumerate("DBEAC")]
+    by_name = sorted(mentors, key=lambda user: user.profile.name)
+
+    first = store.mentors_ordered("name", limit=2)
+    assert ids(first) == ids(by_name[:2])
+    after = store.mentor_sort_key(first[-1].id, "name")
+    assert ids(store.mentors_ordered("name", after=after, limit=2)) == ids(by_name[2:4])
+    assert ids(store.mentors_ordered("name", after=store.mentor_sort_key(by_name[-1].id, "name"))) == []
+
+
+def test_add_assigns_ids_and_listeners_see_them():
+    store = UserStore()
+    notified = []
+    store.add_listener(notified.append)
+
+    first, second = add_user(store, "a@example.com"), add_user(store, "b@example.com")
+    assert (first.id, second.id) == (1, 2)
+    assert notified == [1, 2]
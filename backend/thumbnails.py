@@ -0,0 +1,68 @@
+"""
+프로필 이미지 썸네일
+목록 화면처럼 작은 이미지만 필요한 곳을 위해 원본(500x500)을 줄인 크기별 변형을 만듭니다.
+
+- 변형은 원본 옆에 `{원본 이름}_{크기}.{png|webp}`로 저장하고 한 번만 생성
+- 원본이 변형보다 새로우면 (이미지 재업로드) 다시 생성
+- 이 모듈은 크기 조절만 하고, 파일 확인/읽기/쓰기는 호출하는 쪽에서 ImageStorage로 처리
+- 포맷은 Accept 헤더로 결정 (image/webp를 받으면 WebP, 아니면 PNG)
+"""
+
+import io
+import os
+from typing import Optional
+
+from PIL import Image
+
+# 허용하는 썸네일 크기 (정사각형 한 변 픽셀)
+THUMBNAIL_SIZES = (64, 128, 256)
+
+THUMBNAIL_MEDIA_TYPES = {
+    "png": "image/png",
+    "webp": "image/webp"
+}
+
+
+def negotiate_format(accept: Optional[str]) -> str:
+    """Accept 헤더 → 썸네일 포맷 ("webp" 또는 "png")"""
+    if accept:
+        for part in accept.split(","):
+            media_range, _, params = part.strip().partition(";")
+            if media_range.strip().lower() != "image/webp":
+                continue
+            # q=0 은 명시적 거부
+            for param in params.split(";"):
+                name, _, value = param.partition("=")
+                if name.strip().lower() == "q":
+                    try:
+                        if float(value) <= 0:
+                            return "png"
+                    except ValueError:
+                        return "png"
+            return "webp"
+    return "png"
+
+
+def thumbnail_path(source_path: str, size: int, image_format: str) -> str:
+    base, _ = os.path.splitext(source_path)
+    return f"{base}_{size}.{image_format}"
+
+
+def is_thumbnail_fresh(source_mtime: float, thumbnail_stat: Optional[os.stat_result]) -> bool:
+    """변형 파일이 있고 원본보다 오래되지 않았는지"""
+    return thumbnail_stat is not None and thumbnail_stat.st_mtime >= source_mtime
+
+
+def render_thumbnail(source: bytes, size: int, image_format: str) -> bytes:
+    """원본 이미지 바이트를 size x size 안에 맞춰 줄인 이미지 바이트 (Pillow 작업만, 파일 I/O 없음)"""
+    with Image.open(io.BytesIO(source)) as image:
+        image.draft("RGB", (size, size))
+        thumbnail = image.convert("RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB")
+    thumbnail.thumbnail((size, size), Image.LANCZOS)
+
+    buffer = io.BytesIO()
+    if image_format == "webp":
+        thumbnail.save(buffer, "WEBP", quality=80, method=4)
+    else:
+        thumbnail.save(buffer, "PNG", optimize=True)
+    return buffer.getvalue()
@@ -0,0 +1,93 @@
+"""
+검증된 토큰 캐시
+같은 토큰으로 반복되는 요청에서 jwt.decode(HMAC 검증 + claim 파싱)를 다시 하지 않도록
+토큰 → (claims, 사용자)를 LRU + TTL로 보관합니다.
+
+- 항목 만료 시각은 토큰의 exp와 TTL 중 빠른 쪽
+- 사용자 삭제/변경 시 invalidate_user()로 해당 사용자의 토큰을 모두 제거
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Set, Tuple
+
+
+class TokenCache:
+    """토큰 → (claims, 사용자) LRU/TTL 캐시
+
+    get_current_user는 동기 dependency라서 스레드 풀에서 실행되므로 락으로 보호합니다.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl_seconds: float = 300.0):
+        self._max_size = max_size
+        self._ttl = ttl_seconds
+        # token -> (expires_at, claims, user)
+        self._entries: "OrderedDict[str, Tuple[float, Dict, object]]" = OrderedDict()
+        # user_id -> 해당 사용자의 캐시된 토큰들 (사용자 단위 무효화용)
+        self._tokens_by_user: Dict[int, Set[str]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, token: str) -> Optional[Tuple[Dict, object]]:
+        """캐시된 (claims, 사용자) 반환 - 없거나 만료됐으면 None"""
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                self._misses += 1
+                return None
+            expires_at, claims, user = entry
+            if expires_at <= time.time():
+                self._remove(token)
+                self._misses += 1
+                return None
+            self._entries.move_to_end(token)
+            self._hits += 1
+            return claims, user
+
+    def put(self, token: str, claims: Dict, user) -> None:
+        exp = claims.get("exp")
+        expires_at = time.time() + self._ttl
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, float(exp))
+
+        with self._lock:
+            if token in self._entries:
+                self._remove(token)
+            self._entries[token] = (expires_at, claims, user)
+            self._tokens_by_user.setdefault(user.id, set()).add(token)
+            while len(self._entries) > self._max_size:
+                oldest_token = next(iter(self._entries))
+                self._remove(oldest_token)
+
+    def invalidate_user(self, user_id: int) -> None:
+        """사용자 삭제/역할 변경 등으로 캐시된 토큰을 더 이상 쓰면 안 될 때 호출"""
+        with self._lock:
+            for token in list(self._tokens_by_user.get(user_id, ())):
+                self._remove(token)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tokens_by_user.clear()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self._max_size,
+                "hits": self._hits,
+                "misses": self._misses
+            }
+
+    def _remove(self, token: str) -> None:
+        entry = self._entries.pop(token, None)
+        if entry is None:
+            return
+        user_id = entry[2].id
+        tokens = self._tokens_by_user.get(user_id)
+        if tokens is not None:
+            tokens.discard(token)
+            if not tokens:
+                del self._tokens_by_user[user_id]
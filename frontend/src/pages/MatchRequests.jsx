@@ -22,6 +22,33 @@ const MatchRequests = () => {
     }
   }, [user]);
 
+  // 매칭 요청 변경 이벤트 구독 - 목록을 주기적으로 다시 조회하지 않고 변경이 있을 때만 반영
+  useEffect(() => {
+    if (user?.role !== 'mentor' && user?.role !== 'mentee') return undefined;
+    const reload = user.role === 'mentor' ? loadIncomingRequests : loadOutgoingRequests;
+    let connected = false;
+
+    return profileService.subscribeMatchRequestEvents((event, data) => {
+      if (event === 'ready') {
+        // 재연결이면 끊긴 동안의 변경을 반영하기 위해 다시 조회
+        if (connected) reload();
+        connected = true;
+      } else if (event === 'resync') {
+        reload();
+      } else if (event === 'match_request') {
+        const changed = data.matchRequest;
+        if (data.type === 'created') {
+          // 새 요청은 상대방 프로필 정보가 필요하므로 목록 다시 조회
+          reload();
+        } else {
+          setRequests(prev => prev.map(request => (
+            request.id === changed.id ? { ...request, status: changed.status } : request
+          )));
+        }
+      }
+    });
+  }, [user]);
+
   // 사용자 프로필 정보 가져오기 (ID로)
   const getUserProfile = async (userId, role) => {
     try {
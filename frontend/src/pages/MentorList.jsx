@@ -360,7 +360,7 @@ const MentorList = () => {
                   <div className="mentor-image">
                     <img 
                       src={mentor.profile?.imageUrl 
-                        ? `http://localhost:8080/api${mentor.profile.imageUrl}`
+                        ? `http://localhost:8080/api${mentor.profile.imageUrl}?size=128`
                         : 'https://placehold.co/500x500.jpg?text=MENTOR'
                       }
                       alt={mentor.profile?.name || '멘토'}
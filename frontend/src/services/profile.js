@@ -70,12 +70,71 @@ export const profileService = {
     return response.data;
   },
 
+  // 매칭 요청 일괄 수락/거절 (멘토용) - action: 'accept' | 'reject'
+  async bulkUpdateMatchRequests(ids, action) {
+    const response = await api.post('/match-requests/bulk', { ids, action });
+    return response.data;
+  },
+
   // 매칭 요청 취소 (멘티용)
   async cancelMatchRequest(requestId) {
     const response = await api.delete(`/match-requests/${requestId}`);
     return response.data;
   },
 
+  // 매칭 요청 변경 이벤트 구독 (SSE) - 구독 해제 함수 반환
+  // EventSource는 Authorization 헤더를 보낼 수 없어서 fetch 스트림으로 읽음
+  subscribeMatchRequestEvents(onEvent, retryDelay = 3000) {
+    const controller = new AbortController();
+    let retryTimer = null;
+
+    const connect = async () => {
+      try {
+        const response = await fetch(`${api.defaults.baseURL}/match-requests/events`, {
+          headers: { Authorization: `Bearer ${localStorage.getItem('authToken')}` },
+          signal: controller.signal
+        });
+        if (!response.ok || !response.body) {
+          throw new Error(`이벤트 스트림 연결 실패: ${response.status}`);
+        }
+
+        const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+        let buffer = '';
+        for (;;) {
+          const { value, done } = await reader.read();
+          if (done) break;
+          buffer += value;
+          // 이벤트는 빈 줄로 구분됨
+          let boundary;
+          while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+            const chunk = buffer.slice(0, boundary);
+            buffer = buffer.slice(boundary + 2);
+            let event = 'message';
+            let data = '';
+            for (const line of chunk.split('\n')) {
+              if (line.startsWith('event: ')) event = line.slice(7);
+              else if (line.startsWith('data: ')) data += line.slice(6);
+            }
+            if (data) onEvent(event, JSON.parse(data));
+          }
+        }
+      } catch (error) {
+        if (controller.signal.aborted) return;
+        console.error('❌ 매칭 요청 이벤트 스트림 오류:', error);
+      }
+      // 연결이 끊기면 잠시 후 다시 연결
+      if (!controller.signal.aborted) {
+        retryTimer = setTimeout(connect, retryDelay);
+      }
+    };
+
+    connect();
+    return () => {
+      controller.abort();
+      clearTimeout(retryTimer);
+    };
+  },
+
   // 이미지 로드 (인증 헤더 포함)
   async loadImage(imageUrl) {
     console.log('🔥 이미지 로드 요청 시작:', imageUrl);